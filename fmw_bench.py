@@ -0,0 +1,750 @@
+# fmw_bench.py
+# FMW 데이터 경로 벤치마크 (단일 파일)
+# - Streamlit 앱 파일에서 UI 이전(st.set_page_config 앞)까지의 함수/상수만 로드해서 측정
+# - 합성 데이터(numpy)로 행 수를 키워가며 소요시간 비교
+#
+# 실행 예시
+#   python fmw_bench.py diff                      # 100k, 1M 행: 기존 문자열 키 diff vs 해시 diff
+#   python fmw_bench.py diff --rows 10000 100000
+#   python fmw_bench.py schema                    # 캐시 스키마: 전부 str vs 타입 고정(category/timestamp)
+#   python fmw_bench.py index                     # 탐색 필터: 마스크 순차 적용 vs 사전 인덱스 교집합
+#   python fmw_bench.py snapshots --days 30       # streamlit_app 데일리 스냅샷: 매일 전체 CSV vs 체크포인트+변경분
+#   python fmw_bench.py search                    # 전역 검색: 행×컬럼 문자열 스캔 vs 값 사전 + postings
+#   python fmw_bench.py rangediff --days 90       # 기간 diff: 전체 CSV 2개 diff vs 일별 변경분 병합
+#   python fmw_bench.py oocdiff --budgets 256 64  # 데일리 diff 피크 메모리: 메모리 diff vs 디스크 분할 diff
+#   python fmw_bench.py suite --out bench_results.json --baseline bench_baseline.json   # 회귀 게이트(초과 시 exit 1)
+#   python fmw_bench.py suite --update-baseline --baseline bench_baseline.json          # 기준선 갱신
+#   python fmw_bench.py suite --rows 10000 100000 1000000 10000000                      # 운영 규모(10M은 메모리 32GB 이상)
+#   python fmw_bench.py replay --rows 100000 --days 90 --out replay.json     # N일 변경 시뮬레이션 → 동기화/스냅샷/변경 이력 리플레이
+#   python fmw_bench.py gen --rows 10000000 --out fmw_10m.parquet --models 2000 --operators 300 --countries 150
+#                                                 # 부하 테스트용 합성 데이터 파일(.parquet | .csv) 생성
+#   python fmw_bench.py net --rows 100000 --latency-ms 100 --jitter-ms 50 --bandwidth-mbps 100   # 목 서버(fmw_mock_api) 상대 클라이언트 처리량/지연
+
+import os, sys, json, time, pathlib, argparse, platform, tempfile, threading, tracemalloc, multiprocessing
+from datetime import datetime, date, timedelta, timezone
+from typing import Dict, Any, List, Callable
+
+import numpy as np
+import pandas as pd
+
+import fmw_mock_api
+from fmw_mock_api import load_app_core, ux3_records  # 앱 코어 로더: 앱 파일의 UI 이전 정의부만 실행
+
+# ============== 합성 데이터 ==============
+def synth_records(n: int, seed: int = 0) -> pd.DataFrame:
+    """ux3 캐시 스키마(REQ_COLS) 형태의 합성 레코드. 키는 model_name으로 유일하게 만든다."""
+    rng = np.random.default_rng(seed)
+    def pick(opts):
+        return np.asarray(opts, dtype=object)[rng.integers(0, len(opts), n)]
+    return pd.DataFrame({
+        "feature_group": "allow list",
+        "feature_name": "device_allowed",
+        "model_name": np.char.add("M", np.arange(n).astype(str)).astype(object),
+        "mcc": pick(["450", "440", "262", "208"]),
+        "mnc": pick(["1", "2", "3", "5", "8"]),
+        "region": pick(["APAC", "EMEA", "NA"]),
+        "country": pick(["KR", "JP", "DE", "FR", "US"]),
+        "operator": pick(["KT", "SKT", "LGU+", "NTT", "KDDI", "Orange"]),
+        "sp_type": pick([f"SP-{i:03d}" for i in range(1, 11)]),
+        "mode": pick(["allow", "block"]),
+        "value": rng.integers(0, 1000, n).astype(str).astype(object),
+        "status": "active",
+        "updated_at": "2025-10-23T06:00:00+09:00",
+    })
+
+def synth_all(n: int, seed: int = 0) -> pd.DataFrame:
+    """streamlit_app의 /api/v1/all 스키마(DataManager.HEADERS) 형태의 합성 레코드."""
+    rng = np.random.default_rng(seed)
+    def pick(opts):
+        return np.asarray(opts, dtype=object)[rng.integers(0, len(opts), n)]
+    return pd.DataFrame({
+        "model_name": np.char.add("S", np.arange(n).astype(str)).astype(object),
+        "solution": pick(["slsi", "mtk"]),
+        "feature_group": pick(["Connectivity", "Messaging", "Data", "Roaming"]),
+        "feature": pick(["VoLTE", "VoWiFi", "5G_SA", "SMS", "RCS", "APN", "Hotspot", "Roaming"]),
+        "mcc": pick(["450", "440", "310", None]),
+        "mnc": pick(["05", "08", "10", None]),
+        "region": pick(["APAC", "NA", "EU", None]),
+        "country": pick(["KR", "JP", "US", "DE", None]),
+        "operator": pick(["KT", "SKT", "LGU+", "KDDI", "VERIZON", None]),
+        "sp_fci": pick(["postpaid", "prepaid", "mvno", None]),
+        "mode": pick(["allow", "block", "none"]),
+        "value": pick(["true", "false", "level-1", "level-2", "10", "100"]),
+        "sync_time": "2025-10-24T06:00:00+09:00",
+    })
+
+def synth_audit(n: int, seed: int = 0, days: int = 30) -> pd.DataFrame:
+    """샘플 앱(v3_plus, ov_hx)의 감사 로그 형태. changed_at은 오늘 기준 최근 days일에 고르게 분포."""
+    rng = np.random.default_rng(seed)
+    def pick(opts):
+        return np.asarray(opts, dtype=object)[rng.integers(0, len(opts), n)]
+    ts = pd.Timestamp.now().normalize() + pd.Timedelta(days=1) - pd.to_timedelta(rng.integers(1, days * 86400, n), unit="s")
+    return pd.DataFrame({
+        "action": pick(["created", "updated", "deleted"]),
+        "model_name": np.char.add("S", rng.integers(0, 5000, n).astype(str)).astype(object),
+        "solution": pick(["slsi", "mtk"]),
+        "feature_group": pick(["IMS", "RCS", "allow-list", "block-list"]),
+        "feature": pick(["VoLTE", "VoWiFi", "VoNR", "SMS", "RCS_CHAT"]),
+        "dims_json": pick(['{"country": "KR", "operator": "KT"}', '{"mcc": "450", "mnc": "05", "operator": "SKT"}',
+                           '{"country": "JP", "operator": "KDDI"}', '{"region": "EU"}', "{}"]),
+        "mode_before": pick(["allow", "block", ""]), "mode_after": pick(["allow", "block", ""]),
+        "value_before": pick(["true", "false", ""]), "value_after": pick(["true", "false", ""]),
+        "changed_at": ts.strftime("%Y-%m-%d %H:%M:%S").astype(object),
+        "run_id": pick([f"sync-{i:03d}" for i in range(100)]),
+    })
+
+def churn(df: pd.DataFrame, rate: float = 0.05, seed: int = 1, touch: float = 0.0) -> pd.DataFrame:
+    """rate 비율만큼 삭제/추가/값 변경을 가한 다음 스냅샷. touch 비율만큼은 값은 두고 sync_time만 바꾼다."""
+    rng = np.random.default_rng(seed)
+    n = len(df); k = max(1, int(n * rate))
+    out = df.drop(index=rng.choice(n, k, replace=False)).reset_index(drop=True)
+    upd = rng.choice(len(out), k, replace=False)
+    out.loc[upd, "value"] = "changed"
+    if touch and "sync_time" in out.columns:
+        out.loc[rng.choice(len(out), int(len(out) * touch), replace=False), "sync_time"] = f"touched-{seed}"
+    add = df.sample(n=k, random_state=seed).copy()
+    add["model_name"] = f"N{seed}-" + add["model_name"].astype(str)  # seed별 접두어: 여러 날 연속 적용해도 키 유일
+    return pd.concat([out, add], ignore_index=True)
+
+# ============== 측정 ==============
+def timeit(fn: Callable[[], Any], repeat: int = 1) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter(); fn(); best = min(best, time.perf_counter() - t0)
+    return best
+
+def _legacy_diff(old_df: pd.DataFrame, new_df: pd.DataFrame, key_cols: List[str]) -> Dict[str, int]:
+    """기준선: 변경 전 diff_counts + snapshot_changes의 문자열 키/집합/merge 경로."""
+    def keyed(df):
+        df = df.copy(); df["_key"] = df[key_cols].astype(str).agg("|".join, axis=1); return df
+    for _ in range(2):  # diff_counts, snapshot_changes가 각각 키를 다시 만들었음
+        oldk = keyed(old_df); newk = keyed(new_df)
+        old_keys = set(oldk["_key"]); new_keys = set(newk["_key"])
+        added = newk[newk["_key"].isin(new_keys - old_keys)]
+        removed = oldk[oldk["_key"].isin(old_keys - new_keys)]
+        merged = newk[newk["_key"].isin(old_keys & new_keys)].merge(
+            oldk[["_key", "value", "status"]], on="_key", how="left", suffixes=("", "_old"))
+        updated = merged[(merged["value"] != merged["value_old"]) | (merged["status"] != merged["status_old"])]
+    return {"added": len(added), "updated": len(updated), "removed": len(removed)}
+
+def bench_diff(rows: List[int]) -> List[Dict[str, Any]]:
+    core = load_app_core("fmw_dm_single_ux3.py")
+    results = []
+    for n in rows:
+        old = synth_records(n); new = churn(old)
+        t0 = time.perf_counter(); c_legacy = _legacy_diff(old, new, core.KEY_COLS); t_legacy = time.perf_counter() - t0
+        t_engine = timeit(lambda: core.diff_frames(old, new), repeat=3)
+        c_engine = core.diff_frames(old, new)[0]
+        assert c_legacy == c_engine, (c_legacy, c_engine)
+        results.append({"rows": n, "legacy_s": round(t_legacy, 3), "engine_s": round(t_engine, 3),
+                        "speedup": round(t_legacy / t_engine, 1), **c_engine})
+    return results
+
+def _legacy_str_cols(df: pd.DataFrame) -> pd.DataFrame:
+    """기준선: 변경 전 ensure_cols처럼 모든 컬럼을 파이썬 str 객체로."""
+    return pd.DataFrame({c: df[c].astype(object).astype(str).astype(object) for c in df.columns})
+
+def bench_schema(rows: List[int]) -> List[Dict[str, Any]]:
+    core = load_app_core("fmw_dm_single_ux3.py")
+    results = []
+    for n in rows:
+        raw = synth_records(n)
+        legacy = _legacy_str_cols(raw); typed = core.ensure_cols(raw)
+        def flt(df):
+            return df[(df["mode"] == "allow") & (df["country"] == "KR") & (df["operator"] == "KT") & (df["mcc"] == "450")]
+        assert len(flt(legacy)) == len(flt(typed))
+        mb = lambda df: df.memory_usage(deep=True).sum() / 2**20
+        pq_legacy, pq_typed = pathlib.Path("legacy.parquet"), pathlib.Path("typed.parquet")
+        legacy.to_parquet(pq_legacy, index=False); typed.to_parquet(pq_typed, index=False)
+        results.append({
+            "rows": n,
+            "mem_str_mb": round(mb(legacy), 1), "mem_typed_mb": round(mb(typed), 1),
+            "parquet_str_kb": pq_legacy.stat().st_size // 1024, "parquet_typed_kb": pq_typed.stat().st_size // 1024,
+            "filter_str_ms": round(timeit(lambda: flt(legacy), repeat=5) * 1000, 2),
+            "filter_typed_ms": round(timeit(lambda: flt(typed), repeat=5) * 1000, 2),
+        })
+    return results
+
+def _legacy_explore(df: pd.DataFrame, eq: Dict[str, str], like: Dict[str, str]) -> pd.DataFrame:
+    """기준선: 변경 전 탐색 탭(전체 copy 후 마스크 순차 적용 + str.contains)."""
+    q = df.copy()
+    for c, v in eq.items():
+        if v: q = q[q[c] == v]
+    for c, v in like.items():
+        if v: q = q[q[c].str.contains(v, case=False, na=False)]
+    return q
+
+def bench_index(rows: List[int]) -> List[Dict[str, Any]]:
+    core = load_app_core("fmw_dm_single_ux3.py")
+    cases = {
+        "eq2":       ({"mode": "allow", "country": "KR"}, {}),
+        "eq4+like":  ({"mode": "allow", "country": "KR", "mcc": "450", "sp_type": "SP-003"}, {"operator": "kt"}),
+        "like_model": ({}, {"model_name": "m1234"}),
+    }
+    results = []
+    for n in rows:
+        df = core.ensure_cols(synth_records(n))
+        t0 = time.perf_counter(); idx = core.build_filter_index(df); t_build = time.perf_counter() - t0
+        for name, (eq, like) in cases.items():
+            ref = _legacy_explore(df, eq, like)
+            ids = core.query_filter_index(idx, eq, like)
+            assert list(ref.index) == list(ids), name
+            results.append({
+                "rows": n, "case": name, "hits": len(ids), "build_s": round(t_build, 2),
+                "scan_ms": round(timeit(lambda: _legacy_explore(df, eq, like), repeat=3) * 1000, 2),
+                "index_ms": round(timeit(lambda: df.iloc[core.query_filter_index(idx, eq, like)], repeat=3) * 1000, 2),
+            })
+    return results
+
+def _dir_bytes(path) -> int:
+    """path 아래 모든 파일 크기 합(하위 폴더 포함)."""
+    return sum(p.stat().st_size for p in pathlib.Path(path).rglob("*") if p.is_file())
+
+def _same_rows(a: pd.DataFrame, b: pd.DataFrame, keys: List[str]) -> bool:
+    """행 순서를 무시하고 전 컬럼 비교(결측은 None으로 통일)."""
+    norm = lambda df: (df.astype(object).where(df.notna(), None)[sorted(df.columns)]
+                       .sort_values(keys, kind="stable", ignore_index=True))
+    return a.shape == b.shape and norm(a).equals(norm(b))
+
+def bench_snapshots(rows: List[int], days: int, rate: float, every: int, touch: float = 0.0) -> List[Dict[str, Any]]:
+    core = load_app_core("streamlit_app.py")
+    results = []
+    for n in rows:
+        legacy_dir = pathlib.Path(f"legacy_{n}"); legacy_dir.mkdir()
+        dm = core.DataManager("http://bench.invalid", cache_dir=f"store_{n}", checkpoint_every=every)
+        df, d0 = synth_all(n), date(2025, 10, 1)
+        t_write = 0.0
+        for i in range(days):
+            d = d0 + timedelta(days=i)
+            legacy = legacy_dir / f"{d:%Y-%m-%d}.csv"
+            df.to_csv(legacy, index=False, encoding="utf-8-sig")  # 기준선: 매일 전체 CSV
+            t0 = time.perf_counter(); dm.write_snapshot(d, core._typed(df.copy())); t_write += time.perf_counter() - t0
+            last, df = df, churn(df, rate=rate, seed=i + 1, touch=touch)
+        core._replay_snapshot.clear()
+        t_replay = timeit(lambda: dm.load_snapshot(d), repeat=1)  # 가장 긴 체인 근처(마지막 날)
+        # 크기 비교가 의미 있으려면 저장소가 CSV와 같은 내용(sync_time 포함 전 컬럼)을 복원해야 함
+        assert _same_rows(dm.load_snapshot(d), last, core.KEY_COLS), f"{d} 복원 결과가 원본과 다름"
+        t_csv = timeit(lambda: pd.read_csv(legacy, dtype=str), repeat=1)
+        csv_mb, store_mb = _dir_bytes(legacy_dir) / 2**20, _dir_bytes(pathlib.Path(dm.cache_dir) / "daily") / 2**20
+        results.append({
+            "rows": n, "days": days, "churn": rate, "touch": touch, "every": every,
+            "csv_mb": round(csv_mb, 1), "store_mb": round(store_mb, 1), "ratio": round(csv_mb / store_mb, 1),
+            "write_ms_per_day": round(t_write / days * 1000, 1),
+            "load_last_csv_ms": round(t_csv * 1000, 1), "load_last_store_ms": round(t_replay * 1000, 1),
+        })
+    return results
+
+def _legacy_search(df: pd.DataFrame, q: str) -> pd.DataFrame:
+    """기준선: 변경 전 search()/_search() — 모든 셀을 문자열로 바꿔 str.contains."""
+    ql = q.lower()
+    return df[df.astype(str).apply(lambda s: s.str.lower().str.contains(ql, na=False)).any(axis=1)]
+
+def bench_search(rows: List[int]) -> List[Dict[str, Any]]:
+    core = load_app_core("streamlit_app.py")
+    queries = {"kt": False, "s12": False, "level": False, "s99": True, "vo": True}  # 질의: 접두어 여부
+    results = []
+    for n in rows:
+        df = core._typed(synth_all(n))
+        t0 = time.perf_counter(); idx = core.build_search_index(df); t_build = time.perf_counter() - t0
+        for q, prefix in queries.items():
+            ids = core.search_rows(idx, q, prefix=prefix)
+            row = {"rows": n, "query": q, "prefix": prefix, "hits": len(ids), "build_s": round(t_build, 2)}
+            if not prefix:  # 기준선은 부분 문자열만 지원
+                ref = _legacy_search(df, q)
+                assert list(ref.index) == list(ids), q
+                row["scan_ms"] = round(timeit(lambda: _legacy_search(df, q), repeat=1) * 1000, 1)
+            row["index_ms"] = round(timeit(lambda: core.search_rows(idx, q, prefix=prefix), repeat=3) * 1000, 2)
+            results.append(row)
+    return results
+
+def _legacy_daily_changes(prev_df: pd.DataFrame, curr_df: pd.DataFrame, key_cols: List[str]):
+    """기준선: 변경 전 daily_changes — 문자열 키 결합 + 집합 차 + merge."""
+    p, c = prev_df.copy(), curr_df.copy()
+    keyed = lambda df: df[key_cols].fillna("").astype(str).agg("|".join, axis=1)  # fillna: pandas 3은 astype(str)이 NaN 유지
+    p["_key"] = keyed(p); c["_key"] = keyed(c)
+    created = c[c["_key"].isin(set(c["_key"]) - set(p["_key"]))]
+    deleted = p[p["_key"].isin(set(p["_key"]) - set(c["_key"]))]
+    merged = c.merge(p[["_key", "value"]].rename(columns={"value": "old_value"}), on="_key", how="inner")
+    updated = merged[merged["value"].astype(str) != merged["old_value"].astype(str)]
+    return created, updated, deleted
+
+def bench_rangediff(n: int, days: int, windows: List[int], rate: float, every: int) -> List[Dict[str, Any]]:
+    core = load_app_core("streamlit_app.py")
+    legacy_dir = pathlib.Path("legacy_range"); legacy_dir.mkdir()
+    dm = core.DataManager("http://bench.invalid", cache_dir="store_range", checkpoint_every=every)
+    df, d0 = synth_all(n), date(2025, 7, 1)
+    for i in range(days):
+        d = d0 + timedelta(days=i)
+        df.to_csv(legacy_dir / f"{d:%Y-%m-%d}.csv", index=False, encoding="utf-8-sig")
+        dm.write_snapshot(d, core._typed(df.copy()))
+        df = churn(df, rate=rate, seed=i + 1)
+    end = d0 + timedelta(days=days - 1)
+    results = []
+    for w in windows:
+        start = end - timedelta(days=w)
+        def legacy():
+            read = lambda d: pd.read_csv(legacy_dir / f"{d:%Y-%m-%d}.csv", **core.CSV_READ)
+            return _legacy_daily_changes(read(start), read(end), core.KEY_COLS)
+        t_legacy = timeit(legacy)
+        core._load_changes.clear(); core._range_changes.clear()
+        t_merge = timeit(lambda: dm.range_changes(start, end))
+        net = dm.range_changes(start, end)
+        ref = [len(x) for x in legacy()]
+        got = [int((net["change_type"] == t).sum()) for t in ("created", "updated", "deleted")]
+        assert ref == got, (w, ref, got)
+        results.append({"rows": n, "window_days": w, "created": got[0], "updated": got[1], "deleted": got[2],
+                        "csv_pair_diff_s": round(t_legacy, 2), "merge_s": round(t_merge, 3),
+                        "speedup": round(t_legacy / t_merge, 1)})
+    return results
+
+# ============== 스위트(회귀 게이트) ==============
+# 데이터 경로 함수별 시간(best of N)과 최대 메모리(tracemalloc, 별도 1회 실행)를 행 수별로 JSON에 기록하고,
+# 저장된 기준선보다 허용 비율 이상 느려지거나 커진 항목이 있으면 실패(exit 1).
+# 10k 같은 작은 크기의 측정 잡음은 절대 하한(min_sec/min_mb)으로 거른다.
+# app 케이스를 돌릴 때는 먼저 분할 diff(external_delta) 결과가 메모리 diff와 같은지 확인한다(check_external_delta).
+SUITE_ROWS = [10_000, 100_000, 1_000_000]
+
+class _Inputs(dict):
+    """이름 → 합성 입력. 처음 요청될 때 한 번만 만들고 같은 행 수의 케이스끼리 공유."""
+    def __init__(self, makers: Dict[str, Callable[["_Inputs"], Any]]):
+        super().__init__(); self.makers = makers
+    def __missing__(self, key):
+        value = self[key] = self.makers[key](self)
+        return value
+
+def _suite_inputs(n: int, ux3, app) -> _Inputs:
+    cache_name = "records__allow list__device_allowed"
+    return _Inputs({
+        "records": lambda d: synth_records(n),
+        "records_new": lambda d: churn(d["records"]),
+        "typed": lambda d: ux3.ensure_cols(d["records"]),
+        "typed_new": lambda d: ux3.ensure_cols(d["records_new"]),
+        "change_rows": lambda d: ux3.change_rows(cache_name, d["typed"], d["typed_new"])[1],
+        "filter_index": lambda d: ux3.build_filter_index(d["typed"]),
+        "all": lambda d: app._typed(synth_all(n)),
+        "all_new": lambda d: app._typed(churn(synth_all(n))),
+        "all_raw": lambda d: synth_all(n),
+        "all_raw_new": lambda d: churn(d["all_raw"]),
+        "search_index": lambda d: app.build_search_index(d["all"]),
+        "audit": lambda d: synth_audit(n),
+    })
+
+def _suite_cases(ux3, app, demo, v3, ovhx) -> Dict[str, tuple]:
+    """케이스 이름 → (필요한 입력, 실행 함수, 최대 행 수 또는 None). 이름 앞부분은 대상 앱 파일."""
+    cache_name = "records__allow list__device_allowed"
+    explore = ({"mode": "allow", "country": "KR", "mcc": "450", "sp_type": "SP-003"}, {"operator": "kt"})
+    def history(d):
+        dm = object.__new__(ovhx.DataManager)  # 샘플 데이터를 만드는 __init__ 대신 합성 감사 로그 주입
+        dm.audit, dm.history_cache = d["audit"], {}
+        return dm.search_history(30, model_name="s12", action="updated")
+    return {
+        "ux3.ensure_cols":            (["records"], lambda d: ux3.ensure_cols(d["records"]), None),
+        "ux3.df_keyed":               (["typed"], lambda d: ux3.df_keyed(d["typed"]), None),
+        "ux3.diff_counts":            (["typed", "typed_new"], lambda d: ux3.diff_counts(d["typed"], d["typed_new"]), None),
+        "ux3.snapshot_changes":       (["typed", "typed_new"], lambda d: ux3.snapshot_changes(cache_name, d["typed"], d["typed_new"]), None),
+        "ux3._append_recent_changes": (["change_rows"], lambda d: ux3._append_recent_changes(d["change_rows"].copy()), None),
+        "ux3.build_filter_index":     (["typed"], lambda d: ux3.build_filter_index(d["typed"]), None),
+        "ux3.explore_filter":         (["typed", "filter_index"],
+                                       lambda d: d["typed"].iloc[ux3.query_filter_index(d["filter_index"], *explore)], None),
+        "app.daily_changes":          (["all", "all_new"], lambda d: app.daily_changes(d["all"], d["all_new"]), None),
+        "app.apply_filters":          (["all"], lambda d: app.apply_filters(d["all"], "S123", "Connectivity"), None),
+        "app.search_rows":            (["all", "search_index"], lambda d: app.search_rows(d["search_index"], "kt"), None),
+        "demo.diff_prev_curr":        (["all_raw", "all_raw_new"], lambda d: demo.diff_prev_curr(d["all_raw"], d["all_raw_new"]),
+                                       100_000),  # 행 단위 문자열 join(1M행 수 분)
+        "v3.aggregate_summary":       (["audit"], lambda d: v3.aggregate_summary(d["audit"], 30), None),
+        "ovhx.search_history":        (["audit"], history, 1_000_000),  # 행 단위 apply
+    }
+
+def run_suite(rows: List[int], repeat: int = 3, only: List[str] = None) -> List[Dict[str, Any]]:
+    ux3, app = load_app_core("fmw_dm_single_ux3.py"), load_app_core("streamlit_app.py")
+    demo, v3 = load_app_core("fmw_streamlit_cloud_demo.py"), load_app_core("fmw_streamlit_sample_v3_plus.py")
+    ovhx = load_app_core("streamlit_ov_hx_sample.py")
+    cases = _suite_cases(ux3, app, demo, v3, ovhx)
+    if not only or any("app.".startswith(o) or o.startswith("app.") for o in only):
+        check_external_delta(app)  # 정합성 게이트: 시간 측정과 별개로 분할 diff 결과를 매번 확인
+    results = []
+    for n in rows:
+        inputs = _suite_inputs(n, ux3, app)
+        for name, (needs, fn, max_rows) in cases.items():
+            if only and not any(name.startswith(o) for o in only):
+                continue
+            if max_rows and n > max_rows:
+                results.append({"case": name, "rows": n, "skipped": f"max_rows={max_rows}"})
+                continue
+            for k in needs: inputs[k]  # 입력 준비는 측정에서 제외
+            sec = timeit(lambda: fn(inputs), repeat=repeat if n <= 100_000 else 1)
+            tracemalloc.start()
+            try:
+                fn(inputs); peak = tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+            results.append({"case": name, "rows": n, "sec": round(sec, 4), "peak_mb": round(peak / 2**20, 1)})
+            print(f"{name:28s} {n:>10,}  {sec:9.4f}s  {peak / 2**20:9.1f}MB", file=sys.stderr)
+        del inputs
+    return results
+
+def suite_report(results: List[Dict[str, Any]], rows: List[int]) -> Dict[str, Any]:
+    return {
+        "meta": {"created": datetime.now().isoformat(timespec="seconds"), "rows": rows,
+                 "python": platform.python_version(), "pandas": pd.__version__, "numpy": np.__version__,
+                 "machine": f"{platform.system()} {platform.machine()} cpu={os.cpu_count()}"},
+        "results": results,
+    }
+
+def check_regressions(results: List[Dict[str, Any]], baseline: Dict[str, Any], max_regression: float,
+                      min_sec: float = 0.005, min_mb: float = 1.0) -> List[Dict[str, Any]]:
+    """기준선 대비 (1 + max_regression)배를 넘고 절대 증가량도 하한을 넘은 (케이스, 행 수, 지표) 목록."""
+    base = {(r["case"], r["rows"]): r for r in baseline.get("results", []) if "sec" in r}
+    bad = []
+    for r in results:
+        b = base.get((r["case"], r["rows"]))
+        if b is None or "sec" not in r:
+            continue
+        for metric, floor in (("sec", min_sec), ("peak_mb", min_mb)):
+            if r[metric] > b[metric] * (1 + max_regression) and r[metric] - b[metric] > floor:
+                bad.append({"case": r["case"], "rows": r["rows"], "metric": metric, "baseline": b[metric],
+                            "now": r[metric], "ratio": round(r[metric] / max(b[metric], 1e-9), 2)})
+    return bad
+
+def check_external_delta(core, n: int = 5_000, budgets=(1,), seed: int = 7) -> None:
+    """디스크 분할 diff(external_delta)가 메모리 diff(sort_changes(snapshot_delta))와 행 단위로 같은지 확인.
+
+    키 중복(뒤쪽 행 기준), 결측, region "NA", sync_time만 바뀐 행이 섞인 입력을 쓰고 prev는 체크포인트+변경분 체인으로 준다.
+    작은 예산에서 분할·정렬 런 병합 경로를 타게 한다. 다르면 AssertionError.
+    """
+    base = synth_all(n, seed)
+    dup = base.sample(n=n // 50, random_state=seed).assign(value="dup")
+    prev = pd.concat([base, dup], ignore_index=True)
+    curr = pd.concat([churn(prev, 0.05, seed, touch=0.05), dup.sample(frac=0.5, random_state=seed + 1).assign(value="dup2")],
+                     ignore_index=True)
+    delta = core.sort_changes(core.snapshot_delta(base, prev))
+    ref = core.sort_changes(core.snapshot_delta(core.apply_delta(base, delta), curr))
+    norm = lambda df: df.reindex(columns=core.CHANGE_COLS).astype(object).where(df.notna(), None).reset_index(drop=True)
+    tmp = tempfile.mkdtemp(prefix="ooc-check-", dir=".")
+    paths = [os.path.join(tmp, f) for f in ("ckpt.parquet", "delta.parquet", "curr.parquet")]
+    for df, p in zip((base, delta, curr), paths):
+        df.to_parquet(p, index=False)
+    for b in budgets:
+        out = os.path.join(tmp, f"out{b}.parquet")
+        n_out = core.external_delta(paths[:2], paths[2:], out, budget_mb=b, work_dir=tmp)
+        assert n_out == len(ref), (b, n_out, len(ref))
+        pd.testing.assert_frame_equal(norm(pd.read_parquet(out)), norm(ref), check_dtype=False, obj=f"external_delta {b}MB")
+    print(f"external_delta == snapshot_delta ({len(ref):,}행, 예산 {list(budgets)}MB)", file=sys.stderr)
+
+def _oocdiff_data(n: int, rate: float, workdir: str) -> None:
+    os.chdir(workdir)
+    prev = synth_all(n)
+    prev.to_parquet("prev.parquet", index=False)
+    churn(prev, rate=rate).to_parquet("curr.parquet", index=False)
+
+def _oocdiff_child(mode: str, workdir: str, q) -> None:
+    # 자식 프로세스에서 1회 실행 → (변경 행 수, 초, 앱 코어 로드 이후 늘어난 최대 메모리 MB, 측정 방식)
+    # resource는 Unix 전용: Windows에서는 tracemalloc 피크(파이썬/numpy 할당만, pyarrow 버퍼는 빠짐)로 대신한다
+    os.chdir(workdir)
+    core = load_app_core("streamlit_app.py")
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        meter, peak_mb = "rss", lambda: resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    else:
+        tracemalloc.start()
+        meter, peak_mb = "tracemalloc", lambda: tracemalloc.get_traced_memory()[1] / 2**20
+    base = peak_mb()
+    t0 = time.perf_counter()
+    if mode == "memory":
+        n = len(core.sort_changes(core.snapshot_delta(pd.read_parquet("prev.parquet"), pd.read_parquet("curr.parquet"))))
+    else:
+        n = core.external_delta(["prev.parquet"], ["curr.parquet"], "out.parquet", budget_mb=int(mode), work_dir=".")
+    q.put((n, time.perf_counter() - t0, peak_mb() - base, meter))
+
+def bench_oocdiff(rows: List[int], budgets: List[int], rate: float) -> List[Dict[str, Any]]:
+    # ru_maxrss는 프로세스 단위이고 fork/exec 시 부모 값을 물려받으므로, 데이터 생성과 방식별 측정을 각각 새 프로세스에서
+    check_external_delta(load_app_core("streamlit_app.py"))  # 결과가 같아야 메모리 비교가 의미 있음
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for n in rows:
+        gen = ctx.Process(target=_oocdiff_data, args=(n, rate, os.getcwd()))
+        gen.start(); gen.join()
+        for mode in ["memory"] + [str(b) for b in budgets]:
+            q = ctx.Queue()
+            proc = ctx.Process(target=_oocdiff_child, args=(mode, os.getcwd(), q))
+            proc.start(); changes, secs, peak, meter = q.get(); proc.join()
+            results.append({"rows": n, "mode": mode if mode == "memory" else f"external {mode}MB", "changes": changes,
+                            "sec": round(secs, 1), "peak_mb": round(peak), "meter": meter})
+    return results
+
+def gen_dataset(out: str, n: int, seed: int, models: int, operators: int, countries: int) -> Dict[str, Any]:
+    demo = load_app_core("fmw_streamlit_cloud_demo.py")
+    t0 = time.perf_counter()
+    rows = demo.write_fmw_dataset(out, n, seed=seed, n_models=models, n_operators=operators, n_countries=countries)
+    sec = time.perf_counter() - t0
+    return {"out": out, "rows": rows, "sec": round(sec, 1), "rows_per_s": int(rows / sec), "mb": round(os.path.getsize(out) / 2**20, 1)}
+
+# ============== 리플레이(장기 운영 시뮬레이션) ==============
+# 데모 생성기의 N일 변경 시뮬레이터(iter_churn_days)가 만든 스냅샷을 하루씩
+#   ux3 sync_all(샘플 소스 교체) → 변경 이력 파티션/compaction, streamlit_app write_snapshot
+# 에 흘려 보내고 날마다 동기화 비용, 저장소 증가량, 이력 조회 지연을 기록한다.
+# ux3 모듈의 datetime을 시뮬레이션 시계로 바꿔 끼우므로 일 파티션·주기적 전체 재조회·보관 기간이 시뮬레이션 날짜를 따른다.
+REPLAY_START = date(2025, 1, 1)
+_KST = timezone(timedelta(hours=9))
+
+def _sim_clock(now: datetime) -> type:
+    """now()가 고정 시각 now를 돌려주는 datetime 하위 클래스."""
+    class SimDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now.astimezone(tz) if tz else now.replace(tzinfo=None)
+    return SimDatetime
+
+def bench_replay(n: int, days: int, rates: Dict[str, float], hot_frac: float, hot_share: float, delta: bool,
+                 every: int, seed: int, **gen_kw) -> List[Dict[str, Any]]:
+    demo, app = load_app_core("fmw_streamlit_cloud_demo.py"), load_app_core("streamlit_app.py")
+    ux3 = load_app_core("fmw_dm_single_ux3.py")
+    ux3.SNAPSHOT_GC_GRACE_S = 0  # 시뮬레이션 하루는 실제로 몇 초 — 유예를 두면 이전 세대가 지워지지 않고 쌓임
+    dm = app.DataManager("http://bench.invalid", cache_dir="store", checkpoint_every=every)
+    base = demo.make_fmw_df(n, seed=seed, sync_time=f"{REPLAY_START.isoformat()}T06:00:00+09:00", **gen_kw)
+    day0 = (REPLAY_START, base, {"created": len(base), "updated": 0, "deleted": 0})
+    sim = demo.iter_churn_days(base, days, start=REPLAY_START, hot_frac=hot_frac, hot_share=hot_share, seed=seed,
+                               **rates, **gen_kw)
+    results = []
+    for d, snap, made in [day0, *sim]:
+        ux3.datetime = _sim_clock(datetime(d.year, d.month, d.day, 6, tzinfo=_KST))
+        ux3.set_sample_source(ux3_records(snap))
+        t0 = time.perf_counter(); s = ux3.sync_all(delta=delta); t_sync = time.perf_counter() - t0
+        for t in [t for t in threading.enumerate() if t.name == "fmw-changelog-compact"]:
+            t.join()  # 다음 날 동기화와 겹치지 않게
+        t0 = time.perf_counter()
+        kind = dm.write_snapshot(d, app._typed(snap.astype(object).where(snap.notna(), None)))
+        t_write = time.perf_counter() - t0
+        app._load_changes.clear(); app._range_changes.clear(); app._replay_snapshot.clear()  # 조회 지연은 캐시 없이(새 세션 기준)
+        results.append({
+            "day": d.isoformat(), "rows": len(snap), **made,
+            "ux3_full": s["features_full"], "ux3_changes": s["records_added"] + s["records_updated"] + s["records_removed"],
+            "ux3_sync_s": round(t_sync, 2),
+            "changelog_mb": round(_dir_bytes(ux3.CHANGE_LOG_DIR) / 2**20, 2),
+            "ux3_cache_mb": round(_dir_bytes(ux3.current_generation()) / 2**20, 1),
+            "recent_ms": round(timeit(lambda: ux3.load_recent_changes(200)) * 1000, 1),
+            "trend7_ms": round(timeit(ux3.trend7) * 1000, 1),
+            "app_kind": kind, "app_write_s": round(t_write, 2),
+            "app_store_mb": round(_dir_bytes(pathlib.Path(dm.cache_dir) / "daily") / 2**20, 1),
+            "app_changes_ms": round(timeit(lambda: dm.load_changes(d)) * 1000, 1),
+            "app_range30_ms": round(timeit(lambda: dm.range_changes(d - timedelta(days=30), d)) * 1000, 1),
+            "app_snapshot_ms": round(timeit(lambda: dm.load_snapshot(d)) * 1000, 1),
+        })
+        print(" ".join(f"{k}={v}" for k, v in results[-1].items()), file=sys.stderr)
+    ux3.set_sample_source(None)
+    return results
+
+def replay_summary(results: List[Dict[str, Any]]) -> pd.DataFrame:
+    """시간 지표별 p50/p95/max와 일평균 저장소 증가량."""
+    df = pd.DataFrame(results[1:])  # 0일차(초기 적재) 제외
+    cols = ["ux3_sync_s", "recent_ms", "trend7_ms", "app_write_s", "app_changes_ms", "app_range30_ms", "app_snapshot_ms"]
+    out = df[cols].quantile([0.5, 0.95]).rename(index={0.5: "p50", 0.95: "p95"})
+    out.loc["max"] = df[cols].max()
+    for c in ("changelog_mb", "app_store_mb"):
+        out[c + "_per_day"] = round((df[c].iloc[-1] - df[c].iloc[0]) / max(len(df) - 1, 1), 3)
+    return out.round(2)
+
+# ============== 네트워크(목 서버) ==============
+# fmw_mock_api를 같은 프로세스의 스레드로 띄우고 각 앱의 API 로더를 실제 HTTP로 돌린다(라이브 서버 불필요).
+# 요청별 단계 지연은 앱마다 둔 계측기(get_net_log → fmw_netlog.NetLog)의 기록에서 케이스 단위로 집계한다.
+def _net_cases(base: str, ux3, app, demo, v3) -> Dict[str, Callable[[int], int]]:
+    def app_load(stream):
+        # 캐시 디렉터리를 매번 새로 → 검증자(ETag)가 없어 항상 전체 수신
+        return lambda i: len(app.DataManager(base, cache_dir=f"app_{stream}_{i}", stream=stream).refresh())
+    def v3_all(i):
+        v3.api_get_all.clear()
+        return len(v3.api_get_all(base, {}))
+    def ux3_sync(i):
+        return ux3.sync_all(delta=False)["records_fetched"]
+    return {
+        "app.all(buffered)": app_load(False),
+        "app.all(stream)": app_load(True),
+        "demo.load_from_drf": lambda i: len(demo.load_from_drf(base)[0]),
+        "demo.load_from_drf(stream)": lambda i: len(demo.load_from_drf(base, stream=True)[0]),
+        "v3.api_get_all": v3_all,
+        "ux3.sync_all(full)": ux3_sync,
+    }
+
+def bench_net(n: int, days: int, repeat: int, only: List[str] = None, **inject) -> List[Dict[str, Any]]:
+    data = fmw_mock_api.build_dataset(n, days)
+    srv, base = fmw_mock_api.serve_in_thread(data, **inject)
+    ux3, app = load_app_core("fmw_dm_single_ux3.py"), load_app_core("streamlit_app.py")
+    demo, v3 = load_app_core("fmw_streamlit_cloud_demo.py"), load_app_core("fmw_streamlit_sample_v3_plus.py")
+    ux3.API_BASE, ux3.USE_SAMPLE = base + "/api", "0"  # 실API 모드로 전환(모듈 로드 시점에 고른 함수 바인딩 교체)
+    for name in ("list_feature_groups", "list_features", "list_feature_records", "iter_feature_record_pages"):
+        setattr(ux3, name, getattr(ux3, name + "_api"))
+    logs = {"app": app.get_net_log(), "demo": demo.get_net_log(), "v3": v3.get_net_log(), "ux3": ux3.get_net_log()}
+    results = []
+    try:
+        for case, fn in _net_cases(base, ux3, app, demo, v3).items():
+            if only and not any(case.startswith(p) for p in only):
+                continue
+            log = logs[case.split(".")[0]]
+            log.recent.clear()
+            secs, rows, failed = [], 0, 0
+            for i in range(repeat):
+                t0 = time.perf_counter()
+                try:
+                    rows = fn(i)
+                except Exception:
+                    failed += 1  # 오류 주입 시 클라이언트 예외는 실패 횟수로만 센다
+                secs.append(time.perf_counter() - t0)
+            recs = pd.DataFrame(list(log.recent))
+            sec = float(np.median(secs))
+            results.append({
+                "case": case, "rows": rows, "sec_p50": round(sec, 3), "rows_per_s": int(rows / sec) if rows else 0,
+                "failed": failed, "requests": len(recs), "http_errors": int((recs["error"].notna() | (recs["status"] >= 400)).sum()) if len(recs) else 0,
+                **{f"{p}_p50_ms": round(float(recs[f"{p}_ms"].median()), 1) if len(recs) else None
+                   for p in ("connect", "ttfb", "download", "parse")},
+                "mb_per_s": round(recs["bytes"].sum() / 2**20 / sum(secs), 1) if len(recs) else 0.0,
+            })
+            print(" ".join(f"{k}={v}" for k, v in results[-1].items()), file=sys.stderr)
+    finally:
+        srv.shutdown()
+    return results
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="FMW 데이터 경로 벤치마크")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    p_diff = sub.add_parser("diff", help="diff 엔진: 문자열 키 vs 64bit 해시")
+    p_diff.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    p_schema = sub.add_parser("schema", help="캐시 스키마: 메모리/parquet 크기/동등 필터")
+    p_schema.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    p_index = sub.add_parser("index", help="탐색 필터: 스캔 vs 인덱스")
+    p_index.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    p_snap = sub.add_parser("snapshots", help="데일리 스냅샷 디스크 사용량: 전체 CSV vs 체크포인트+변경분")
+    p_snap.add_argument("--rows", type=int, nargs="+", default=[100_000])
+    p_snap.add_argument("--days", type=int, default=30)
+    p_snap.add_argument("--churn", type=float, default=0.01, help="일별 생성/삭제/변경 비율")
+    p_snap.add_argument("--every", type=int, default=7, help="체크포인트 주기(일)")
+    p_snap.add_argument("--touch", type=float, default=0.01, help="일별 sync_time만 바뀌는 행 비율")
+    p_search = sub.add_parser("search", help="전역 검색: 스캔 vs 인덱스")
+    p_search.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    p_range = sub.add_parser("rangediff", help="기간 diff: 전체 CSV 2개 diff vs 일별 변경분 병합")
+    p_range.add_argument("--rows", type=int, default=100_000)
+    p_range.add_argument("--days", type=int, default=90, help="생성할 이력 일수")
+    p_range.add_argument("--windows", type=int, nargs="+", default=[7, 30, 89])
+    p_range.add_argument("--churn", type=float, default=0.01)
+    p_range.add_argument("--every", type=int, default=7)
+    p_ooc = sub.add_parser("oocdiff", help="데일리 diff 피크 메모리: 메모리 diff vs 디스크 분할 diff")
+    p_ooc.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    p_ooc.add_argument("--budgets", type=int, nargs="+", default=[256, 64], help="메모리 예산(MB)")
+    p_ooc.add_argument("--churn", type=float, default=0.02)
+    p_gen = sub.add_parser("gen", help="합성 데이터 파일 생성(데모 생성기, 시드 고정)")
+    p_gen.add_argument("--rows", type=int, default=1_000_000)
+    p_gen.add_argument("--out", default="fmw_synth.parquet", help=".parquet | .csv (현재 디렉터리 기준)")
+    p_gen.add_argument("--seed", type=int, default=20251024)
+    p_gen.add_argument("--models", type=int, default=2000)
+    p_gen.add_argument("--operators", type=int, default=300)
+    p_gen.add_argument("--countries", type=int, default=150)
+    p_suite = sub.add_parser("suite", help="데이터 경로 스위트: 시간/최대 메모리 JSON 기록 + 기준선 대비 회귀 게이트")
+    p_suite.add_argument("--rows", type=int, nargs="+", default=SUITE_ROWS)
+    p_suite.add_argument("--cases", nargs="+", help="케이스 이름 접두어(예: ux3. app.daily)")
+    p_suite.add_argument("--repeat", type=int, default=3, help="100k행 이하 반복 횟수(최솟값 사용)")
+    p_suite.add_argument("--out", default="bench_results.json")
+    p_suite.add_argument("--baseline", help="비교할 기준선 JSON(없으면 비교 생략)")
+    p_suite.add_argument("--max-regression", type=float, default=0.25, help="허용 증가 비율(0.25 = +25%%)")
+    p_suite.add_argument("--min-sec", type=float, default=0.005, help="이보다 작은 시간 증가는 무시")
+    p_suite.add_argument("--min-mb", type=float, default=1.0, help="이보다 작은 메모리 증가는 무시")
+    p_suite.add_argument("--update-baseline", action="store_true", help="결과를 --baseline 경로에 저장(게이트 생략)")
+    p_net = sub.add_parser("net", help="목 서버(fmw_mock_api) 상대 API 로더 처리량/단계별 지연")
+    p_net.add_argument("--rows", type=int, default=100_000)
+    p_net.add_argument("--days", type=int, default=7, help="목 서버 변경 시뮬레이션 일수")
+    p_net.add_argument("--repeat", type=int, default=3)
+    p_net.add_argument("--cases", nargs="+", help="케이스 이름 접두어(예: app. ux3.)")
+    p_net.add_argument("--latency-ms", type=float, default=0.0)
+    p_net.add_argument("--jitter-ms", type=float, default=0.0)
+    p_net.add_argument("--error-rate", type=float, default=0.0)
+    p_net.add_argument("--bandwidth-mbps", type=float, default=0.0, help="0=무제한")
+    p_net.add_argument("--out", help="결과 JSON 경로")
+    p_replay = sub.add_parser("replay", help="N일 변경 시뮬레이션 리플레이: 일별 동기화 비용/저장소 증가/이력 조회 지연")
+    p_replay.add_argument("--rows", type=int, default=100_000, help="0일차 행 수")
+    p_replay.add_argument("--days", type=int, default=30)
+    p_replay.add_argument("--create", type=float, default=0.01, help="일별 생성 비율(전날 행 수 기준)")
+    p_replay.add_argument("--update", type=float, default=0.02, help="일별 값 변경 비율")
+    p_replay.add_argument("--delete", type=float, default=0.005, help="일별 삭제 비율")
+    p_replay.add_argument("--hot-frac", type=float, default=0.05, help="핫키 비율")
+    p_replay.add_argument("--hot-share", type=float, default=0.8, help="값 변경 중 핫키에 몰리는 비율")
+    p_replay.add_argument("--sync", choices=["delta", "full"], default="delta",
+                          help="ux3 동기화 방식(delta: 증분 + FULL_SYNC_EVERY_DAYS마다 전체, 삭제는 전체 재조회 날에만 반영)")
+    p_replay.add_argument("--every", type=int, default=7, help="streamlit_app 체크포인트 주기(일)")
+    p_replay.add_argument("--seed", type=int, default=20251024)
+    p_replay.add_argument("--models", type=int, default=2000)
+    p_replay.add_argument("--operators", type=int, default=300)
+    p_replay.add_argument("--countries", type=int, default=150)
+    p_replay.add_argument("--out", help="일별 결과 JSON 경로")
+    args = ap.parse_args(argv)
+    # 결과 파일이 남아야 하므로 임시 디렉터리로 옮기기 전에 경로 확정
+    if args.cmd == "gen":
+        args.out = os.path.abspath(args.out)
+    if args.cmd in ("replay", "net") and args.out:
+        args.out = os.path.abspath(args.out)
+    if args.cmd == "suite":
+        args.out = os.path.abspath(args.out)
+        args.baseline = args.baseline and os.path.abspath(args.baseline)
+        if args.update_baseline and not args.baseline:
+            ap.error("--update-baseline에는 --baseline 경로가 필요합니다")
+        if args.baseline and not args.update_baseline and not os.path.exists(args.baseline):
+            ap.error(f"기준선 파일이 없습니다: {args.baseline} (처음이면 --update-baseline으로 생성)")
+
+    os.chdir(tempfile.mkdtemp(prefix="fmw_bench_"))  # 앱 캐시 디렉터리 부수효과 격리
+    if args.cmd == "diff":
+        print(pd.DataFrame(bench_diff(args.rows)).to_string(index=False))
+    elif args.cmd == "schema":
+        print(pd.DataFrame(bench_schema(args.rows)).to_string(index=False))
+    elif args.cmd == "index":
+        print(pd.DataFrame(bench_index(args.rows)).to_string(index=False))
+    elif args.cmd == "search":
+        print(pd.DataFrame(bench_search(args.rows)).to_string(index=False))
+    elif args.cmd == "rangediff":
+        print(pd.DataFrame(bench_rangediff(args.rows, args.days, args.windows, args.churn, args.every)).to_string(index=False))
+    elif args.cmd == "suite":
+        report = suite_report(run_suite(args.rows, args.repeat, args.cases), args.rows)
+        pathlib.Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=1), encoding="utf-8")
+        print(pd.DataFrame(report["results"]).to_string(index=False))
+        if args.update_baseline:
+            pathlib.Path(args.baseline).write_text(json.dumps(report, ensure_ascii=False, indent=1), encoding="utf-8")
+            print(f"기준선 저장: {args.baseline}")
+        elif args.baseline:
+            baseline = json.loads(pathlib.Path(args.baseline).read_text(encoding="utf-8"))
+            bad = check_regressions(report["results"], baseline, args.max_regression, args.min_sec, args.min_mb)
+            if bad:
+                print(f"\n회귀 {len(bad)}건 (허용 +{args.max_regression:.0%}):")
+                print(pd.DataFrame(bad).to_string(index=False))
+                sys.exit(1)
+            print(f"\n회귀 없음 (기준선 {baseline['meta'].get('created')}, 허용 +{args.max_regression:.0%})")
+    elif args.cmd == "gen":
+        print(pd.DataFrame([gen_dataset(args.out, args.rows, args.seed, args.models, args.operators, args.countries)]).to_string(index=False))
+    elif args.cmd == "oocdiff":
+        print(pd.DataFrame(bench_oocdiff(args.rows, args.budgets, args.churn)).to_string(index=False))
+    elif args.cmd == "replay":
+        rates = {"create": args.create, "update": args.update, "delete": args.delete}
+        days = bench_replay(args.rows, args.days, rates, args.hot_frac, args.hot_share, args.sync == "delta", args.every,
+                            args.seed, n_models=args.models, n_operators=args.operators, n_countries=args.countries)
+        summary = replay_summary(days)
+        if args.out:
+            report = suite_report(days, [args.rows])
+            report["meta"].update(days=args.days, sync=args.sync, hot_frac=args.hot_frac, hot_share=args.hot_share, **rates)
+            report["summary"] = summary.to_dict()
+            pathlib.Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=1), encoding="utf-8")
+        cols = ["day", "rows", "created", "updated", "deleted", "ux3_full", "ux3_changes", "ux3_sync_s", "changelog_mb",
+                "recent_ms", "app_kind", "app_write_s", "app_store_mb", "app_range30_ms", "app_snapshot_ms"]
+        print(pd.DataFrame(days)[cols].to_string(index=False))
+        print(); print(summary.to_string())
+    elif args.cmd == "net":
+        results = bench_net(args.rows, args.days, args.repeat, args.cases, latency_ms=args.latency_ms,
+                            jitter_ms=args.jitter_ms, error_rate=args.error_rate, bandwidth_mbps=args.bandwidth_mbps)
+        if args.out:
+            report = suite_report(results, [args.rows])
+            report["meta"].update(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, error_rate=args.error_rate,
+                                  bandwidth_mbps=args.bandwidth_mbps)
+            pathlib.Path(args.out).write_text(json.dumps(report, ensure_ascii=False, indent=1), encoding="utf-8")
+        print(pd.DataFrame(results).to_string(index=False))
+    elif args.cmd == "snapshots":
+        print(pd.DataFrame(bench_snapshots(args.rows, args.days, args.churn, args.every, args.touch)).to_string(index=False))
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 # fmw_dm_single_ux3.py
 # 단일 파일: Streamlit 데이터 매니저 (UX 리뉴얼 v3, 모바일 친화)
 # - PRD v1.1 & ERD 반영: GET-only API(v1), 06:00 자동 동기화, 오버뷰 4카드(+7일 추이), 탐색, 변경 이력
-# - APScheduler 없을 때 Fallback: "앱 열릴 때 하루 1회" 자동 동기화
+# - 동기화는 프로세스당 1개 워커 + 호스트 파일 락(중복 실행 방지), 진행/결과는 _cache_v1/sync_status.json
+# - APScheduler 없을 때 Fallback: 워커 스레드가 "하루 1회(06:00 이후)" 자동 동기화
 # - 샘플 데이터(내장) 포함: 10개 모델 × 4개 그룹(allow list / block list / rel features / ue capa)
 # - 차원(dims): mcc, mnc, region, country, operator, sp_type, model_name, mode
 # - 다운로드: CSV(+가능하면 Excel)
@@ -10,22 +11,36 @@
 #   pip install streamlit pandas requests pytz python-dotenv   # apscheduler/xlsxwriter는 선택
 #   USE_SAMPLE=1 streamlit run fmw_dm_single_ux3.py
 #   USE_SAMPLE=0 API_BASE="http://localhost:8000/api" API_KEY="..." streamlit run fmw_dm_single_ux3.py
-
-import os, io, json, pathlib, base64
+#   SYNC_CONCURRENCY=16 ...   # 실API 동기화 동시 요청 수(1이면 순차)
+#   SYNC_DELTA=0 ...          # 증분(since) 동기화 끄기 → 매번 전체 재조회
+#   CHANGE_LOG_RETENTION_DAYS=180 ...  # 변경 이력(일 파티션) 보관 기간
+#   SNAPSHOT_KEEP_GENERATIONS=3 ...    # 보관할 스냅샷 세대 수(CURRENT 제외 이전 세대는 GC)
+#   SYNC_RETRY_MINUTES=30 ...          # 자동(하루 1회) 동기화가 실패하면 이 간격 뒤에 재시도
+
+import os, io, json, pathlib, base64, time, threading, pickle, socket, shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Callable
 
+import numpy as np
 import pandas as pd
 import requests
 import streamlit as st
 from pytz import timezone as tz
+from fmw_netlog import NetLog
 
-# ============== 선택 의존성: APScheduler / xlsxwriter ==============
+# ============== 선택 의존성: APScheduler / pyarrow / xlsxwriter ==============
 try:
     from apscheduler.schedulers.background import BackgroundScheduler  # type: ignore
 except Exception:
     BackgroundScheduler = None  # 패키지 없으면 Fallback 사용
 
+try:
+    import pyarrow as pa  # type: ignore
+    import pyarrow.parquet as pq  # type: ignore
+except Exception:
+    pa = pq = None  # 없으면 페이지를 모아서 한 번에 저장
+
 try:
     import xlsxwriter  # noqa: F401  # 존재 여부만 확인
     XLSX_AVAILABLE = True
@@ -41,6 +56,14 @@ USE_SAMPLE = os.getenv("USE_SAMPLE", "1")  # 기본 샘플 ON
 API_BASE = os.getenv("API_BASE", "http://localhost:8000/api").rstrip("/")
 API_KEY  = os.getenv("API_KEY")
 VERIFY_SSL = os.getenv("VERIFY_SSL", "false").lower() in ("1", "true", "yes")
+SYNC_CONCURRENCY = max(1, int(os.getenv("SYNC_CONCURRENCY", "8")))  # 동시 요청 상한(워커 풀 크기)
+SYNC_DELTA = os.getenv("SYNC_DELTA", "1") == "1"                      # 증분 동기화(피처별 high-water mark)
+FULL_SYNC_EVERY_DAYS = max(1, int(os.getenv("FULL_SYNC_EVERY_DAYS", "7")))  # 삭제 반영용 전체 재조회 주기
+PAGE_SIZE = max(1, int(os.getenv("PAGE_SIZE", "5000")))  # /feature-records/ 페이지 크기(서버 max_limit=5000)
+CHANGE_LOG_RETENTION_DAYS = max(1, int(os.getenv("CHANGE_LOG_RETENTION_DAYS", "90")))  # 변경 이력 보관(일)
+SNAPSHOT_KEEP_GENERATIONS = max(1, int(os.getenv("SNAPSHOT_KEEP_GENERATIONS", "3")))
+SYNC_RETRY_MINUTES = max(1, int(os.getenv("SYNC_RETRY_MINUTES", "30")))  # 자동 동기화 실패 후 재시도 간격(분)
+SNAPSHOT_GC_GRACE_S = 600  # 세대 교체 후 이 시간 동안은 이전 세대를 지우지 않음(읽는 중인 세션 보호)
 
 # API 경로 (PRD v1.1 반영: GET 전용)
 PATH_GROUPS   = "/feature-groups/"
@@ -102,19 +125,60 @@ except Exception:
     pass
 
 # ============== 공통 유틸/캐시 ==============
-def _p(name: str, suffix: str) -> pathlib.Path:
-    return DATA_DIR / f"{name}{suffix}"
-
-def _meta_path(name: str) -> pathlib.Path:
-    return _p(name, "._meta.json")
-
-def _save_meta(name: str, **extra):
+# 스냅샷 세대: 동기화마다 _cache_v1/gen/<id>/ 에 전체를 새로 쓰고, 끝나면 CURRENT 포인터를 원자적으로 교체.
+#   - 읽는 쪽은 리런 시작 시 세대 하나를 고정(pin)해서 그 디렉터리만 읽음 → 반쯤 쓰인 파일/부분 반영 없음
+#   - 세대 디렉터리는 게시 후 불변 → (이름, 세대) 키로 캐시/메모리맵 가능
+#   - 피처별 _meta.json(hwm 등)도 세대 안에 둬서 실패한 동기화가 워터마크를 앞당기지 않게 함
+#   - index 메타와 변경 이력은 세대 밖(DATA_DIR)에 두고 게시 후에만 기록
+GEN_DIR = DATA_DIR / "gen"
+CURRENT_FILE = DATA_DIR / "CURRENT"
+
+def _p(name: str, suffix: str, gen: Optional[pathlib.Path] = None) -> pathlib.Path:
+    return (gen or DATA_DIR) / f"{name}{suffix}"
+
+def current_generation() -> pathlib.Path:
+    """게시된 세대 디렉터리. 아직 세대가 없으면 구 레이아웃(DATA_DIR 평면)을 그대로 읽는다."""
+    try:
+        gen = GEN_DIR / CURRENT_FILE.read_text(encoding="utf-8").strip()
+        if gen.is_dir():
+            return gen
+    except Exception:
+        pass
+    return DATA_DIR
+
+def _new_generation() -> pathlib.Path:
+    gen = GEN_DIR / f"{datetime.now(KST):%Y%m%dT%H%M%S.%f}-{os.getpid()}"
+    gen.mkdir(parents=True, exist_ok=False)
+    return gen
+
+def _publish_generation(gen: pathlib.Path) -> None:
+    tmp = CURRENT_FILE.with_suffix(".tmp")
+    tmp.write_text(gen.name, encoding="utf-8")
+    os.replace(tmp, CURRENT_FILE)  # 포인터 교체 한 번으로 동기화 전체가 동시에 보이게 됨
+
+def gc_generations(keep: int = SNAPSHOT_KEEP_GENERATIONS) -> int:
+    """CURRENT와 최신 keep개를 제외한 이전 세대 삭제. 삭제 실패(Windows에서 열린 파일 등)는 다음 GC에서 재시도."""
+    cur = current_generation()
+    gens = sorted((g for g in GEN_DIR.glob("*") if g.is_dir()), key=lambda g: g.name, reverse=True)
+    removed, keep = 0, max(1, keep)
+    for newer, g in zip(gens[keep - 1:], gens[keep:]):
+        # 바로 다음 세대가 생긴 시각 = 이 세대가 CURRENT에서 내려온 시각
+        if g == cur or time.time() - newer.stat().st_mtime < SNAPSHOT_GC_GRACE_S:
+            continue
+        shutil.rmtree(g, ignore_errors=True)
+        removed += int(not g.exists())
+    return removed
+
+def _meta_path(name: str, gen: Optional[pathlib.Path] = None) -> pathlib.Path:
+    return _p(name, "._meta.json", gen)
+
+def _save_meta(name: str, gen: Optional[pathlib.Path] = None, **extra):
     meta = {"last_sync_kst": datetime.now(KST).isoformat(timespec="seconds")}
     meta.update(extra)
-    _meta_path(name).write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
+    _meta_path(name, gen).write_text(json.dumps(meta, ensure_ascii=False, indent=2), encoding="utf-8")
 
-def read_meta(name: str) -> dict:
-    p = _meta_path(name)
+def read_meta(name: str, gen: Optional[pathlib.Path] = None) -> dict:
+    p = _meta_path(name, gen)
     if not p.exists():
         return {}
     try:
@@ -122,13 +186,42 @@ def read_meta(name: str) -> dict:
     except Exception:
         return {}
 
-def _load_df(name: str) -> pd.DataFrame:
-    p = _p(name, ".parquet")
-    return pd.read_parquet(p) if p.exists() else pd.DataFrame()
+def _load_df(name: str, gen: Optional[pathlib.Path] = None) -> pd.DataFrame:
+    p = _p(name, ".parquet", gen or current_generation())
+    # 세대 파일은 불변이므로 메모리맵으로 읽어도 안전
+    return pd.read_parquet(p, memory_map=True) if p.exists() else pd.DataFrame()
+
+def _save_df(name: str, df: pd.DataFrame, gen: pathlib.Path):
+    df.to_parquet(_p(name, ".parquet", gen), index=False)
+
+# 매니페스트: 피처별 행 수/allow·block 수/파일 크기/최종 동기화 시각 (오버뷰 KPI를 parquet 로드 없이 산출)
+MANIFEST_NAME = "manifest.json"
 
-def _save_df(name: str, df: pd.DataFrame):
-    _p(name, ".parquet").parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(_p(name, ".parquet"), index=False)
+def _save_manifest(features: Dict[str, dict], gen: pathlib.Path) -> None:
+    body = {"updated_kst": datetime.now(KST).isoformat(timespec="seconds"), "features": features}
+    (gen / MANIFEST_NAME).write_text(json.dumps(body, ensure_ascii=False, indent=2), encoding="utf-8")
+
+def load_manifest(gen: Optional[pathlib.Path] = None) -> Dict[str, dict]:
+    try:
+        return json.loads(((gen or current_generation()) / MANIFEST_NAME).read_text(encoding="utf-8")).get("features", {})
+    except Exception:
+        return {}
+
+def manifest_from_footers(gen: Optional[pathlib.Path] = None) -> Dict[str, dict]:
+    """매니페스트가 없을 때: parquet footer의 num_rows만 읽는다(allow/block은 알 수 없음)."""
+    out = {}
+    for p in (gen or current_generation()).glob("records__*.parquet"):
+        try:
+            rows = pq.ParquetFile(p).metadata.num_rows if pq is not None else len(pd.read_parquet(p, columns=["mode"]))
+        except Exception:
+            continue
+        out[p.stem] = {"rows": rows, "allow": None, "block": None, "bytes": p.stat().st_size,
+                       "last_sync_kst": datetime.fromtimestamp(p.stat().st_mtime, KST).isoformat(timespec="seconds")}
+    return out
+
+def cache_manifest(gen: Optional[pathlib.Path] = None) -> Dict[str, dict]:
+    gen = gen or current_generation()
+    return load_manifest(gen) or manifest_from_footers(gen)
 
 KEY_COLS = [
     "feature_group","feature_name","model_name","mcc","mnc",
@@ -136,145 +229,383 @@ KEY_COLS = [
 ]
 REQ_COLS = KEY_COLS + ["value", "status", "updated_at"]
 
+# 캐시 스키마: 저카디널리티 차원은 category(parquet dictionary), 시각은 timestamp(KST)
+# 결측 처리는 기존 astype(str)과 동일하게 두어 키 해시가 바뀌지 않게 한다.
+CAT_COLS = ["feature_group","feature_name","mcc","mnc","region","country","operator","sp_type","mode","status"]
+STR_COLS = ["model_name","value"]
+TS_COLS  = ["updated_at"]
+
 def ensure_cols(df: pd.DataFrame) -> pd.DataFrame:
-    df = df.copy()
+    """REQ_COLS 순서의 타입 고정 프레임. 이미 맞는 타입의 컬럼은 다시 변환하지 않는다."""
+    out = {}
     for c in REQ_COLS:
-        if c not in df.columns:
-            df[c] = None
-    for c in df.columns:
-        df[c] = df[c].astype(str)
-    return df[REQ_COLS]
+        s = df[c] if c in df.columns else pd.Series(None, index=df.index, dtype=object)
+        if c in CAT_COLS:
+            if not isinstance(s.dtype, pd.CategoricalDtype):
+                s = s.astype(str).astype("category")
+        elif c in TS_COLS:
+            if not isinstance(s.dtype, pd.DatetimeTZDtype):
+                s = pd.to_datetime(s, errors="coerce", utc=True, format="ISO8601")
+            s = s.dt.tz_convert("Asia/Seoul")
+        else:
+            s = s.astype(str)
+        out[c] = s
+    return pd.DataFrame(out, index=df.index)
+
+def _arrow_schema():
+    return pa.schema(
+        [(c, pa.dictionary(pa.int32(), pa.string())) if c in CAT_COLS
+         else (c, pa.timestamp("us", tz="Asia/Seoul")) if c in TS_COLS
+         else (c, pa.string()) for c in REQ_COLS]
+    )
+
+def key_hash(df: pd.DataFrame) -> pd.Series:
+    """KEY_COLS → 64bit 해시(벡터화). 행 단위 문자열 join 없이 식별키를 만든다."""
+    return pd.util.hash_pandas_object(df[KEY_COLS], index=False)
 
 def df_keyed(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
-    df["_key"] = df[KEY_COLS].astype(str).agg("|".join, axis=1)
+    df["_key"] = key_hash(df).to_numpy()
     return df
 
+CHANGE_COLS = [
+    "ts_kst","group","feature","action",
+    "model_name","operator","region","country","mcc","mnc","sp_type","mode",
+    "before_value","after_value","before_status","after_status","_key"
+]
+
+def diff_frames(old_df: pd.DataFrame, new_df: pd.DataFrame):
+    """단일 패스 diff 엔진: (counts, changes) 반환.
+
+    changes는 ADD/UPD/REM 행(before/after 값 포함, ts/group/feature 제외)이고
+    counts는 그 행 수와 항상 일치한다. 키 비교는 uint64 해시 배열 위에서만 수행한다.
+    """
+    old = ensure_cols(old_df); new = ensure_cols(new_df)
+    old_h = key_hash(old).to_numpy(); new_h = key_hash(new).to_numpy()
+    # 중복 키는 첫 행 기준(기존 set 기반 비교와 동일)
+    old_first = ~pd.Index(old_h).duplicated(); new_first = ~pd.Index(new_h).duplicated()
+    old, old_h = old.loc[old_first], old_h[old_first]
+    new, new_h = new.loc[new_first], new_h[new_first]
+
+    pos = pd.Index(old_h).get_indexer(new_h)  # new 각 행에 대응하는 old 위치(-1: 신규)
+    hit = pos >= 0
+    rem_mask = ~pd.Index(old_h).isin(new_h)
+
+    added = new.loc[~hit].copy()
+    added["_key"] = new_h[~hit]
+    added["action"] = "ADD"; added["before_value"] = ""; added["before_status"] = ""
+    added["after_value"] = added["value"]; added["after_status"] = added["status"]
+
+    removed = old.loc[rem_mask].copy()
+    removed["_key"] = old_h[rem_mask]
+    removed["action"] = "REM"; removed["before_value"] = removed["value"]; removed["before_status"] = removed["status"]
+    removed["after_value"] = ""; removed["after_status"] = ""
+
+    # 공통 키: 위치 대응으로 before 값을 바로 꺼냄(merge 없음)
+    both = new.loc[hit]
+    old_value = old["value"].to_numpy()[pos[hit]]; old_status = old["status"].to_numpy()[pos[hit]]
+    upd_mask = (both["value"].to_numpy() != old_value) | (both["status"].to_numpy() != old_status)
+    updated = both.loc[upd_mask].copy()
+    updated["_key"] = new_h[hit][upd_mask]
+    updated["action"] = "UPD"
+    updated["before_value"] = old_value[upd_mask]; updated["before_status"] = old_status[upd_mask]
+    updated["after_value"] = updated["value"]; updated["after_status"] = updated["status"]
+
+    counts = {"added": len(added), "updated": len(updated), "removed": len(removed)}
+    changes = pd.concat([added, updated, removed], ignore_index=True)
+    return counts, changes
+
 def diff_counts(old_df: pd.DataFrame, new_df: pd.DataFrame) -> Dict[str, int]:
-    if old_df.empty:
-        return {"added": len(new_df), "updated": 0, "removed": 0}
-    old_k = df_keyed(old_df); new_k = df_keyed(new_df)
-    old_keys = set(old_k["_key"]); new_keys = set(new_k["_key"])
-    added = len(new_keys - old_keys)
-    removed = len(old_keys - new_keys)
-    merged = new_k.merge(old_k[["_key","value","status"]], on="_key", how="left", suffixes=("", "_old"))
-    updated = (merged["value"] != merged["value_old"]) | (merged["status"] != merged["status_old"])
-    return {"added": added, "updated": int(updated.sum()), "removed": removed}
+    return diff_frames(old_df, new_df)[0]
+
+# ============== 탐색 인덱스(동기화 시 생성) ==============
+# 정확 매칭 dims: 값 → 행 id 목록(CSR: values/offsets/rows, 값별 행 id는 오름차순)
+# 포함검색(model/operator): 고유값 소문자 trigram → 고유값 id, 고유값 id → 행 id
+EQ_INDEX_COLS = ["mode","region","country","mcc","mnc","sp_type"]
+LIKE_INDEX_COLS = ["model_name","operator"]
+
+def _postings(s: pd.Series):
+    codes, uniques = pd.factorize(s, sort=False)
+    valid = np.flatnonzero(codes >= 0)
+    rows = valid[np.argsort(codes[valid], kind="stable")].astype(np.int32)
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(codes[valid], minlength=len(uniques)))])
+    return np.asarray(uniques, dtype=object).astype(str), offsets, rows
+
+def _trigrams(values) -> Dict[str, np.ndarray]:
+    grams: Dict[str, List[int]] = {}
+    for i, v in enumerate(values):
+        for g in {v[j:j + 3] for j in range(len(v) - 2)}:
+            grams.setdefault(g, []).append(i)
+    return {g: np.asarray(ids, dtype=np.int32) for g, ids in grams.items()}
+
+def build_filter_index(df: pd.DataFrame) -> Dict[str, Any]:
+    idx: Dict[str, Any] = {"n": len(df), "eq": {}, "like": {}}
+    for c in EQ_INDEX_COLS:
+        values, offsets, rows = _postings(df[c])
+        idx["eq"][c] = {"pos": {v: i for i, v in enumerate(values)}, "offsets": offsets, "rows": rows}
+    for c in LIKE_INDEX_COLS:
+        values, offsets, rows = _postings(df[c].astype(str).str.lower())
+        idx["like"][c] = {"values": values, "offsets": offsets, "rows": rows, "grams": _trigrams(values)}
+    return idx
+
+def _save_filter_index(name: str, df: pd.DataFrame, gen: pathlib.Path) -> None:
+    with open(_p(name, ".idx.pkl", gen), "wb") as fh:
+        pickle.dump(build_filter_index(df), fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+def load_filter_index(name: str, gen: Optional[pathlib.Path] = None) -> Optional[Dict[str, Any]]:
+    p = _p(name, ".idx.pkl", gen or current_generation())
+    if not p.exists():
+        return None
+    with open(p, "rb") as fh:
+        return pickle.load(fh)
+
+def _like_rows(ent: Dict[str, Any], q: str) -> np.ndarray:
+    q = q.lower(); values = ent["values"]
+    if len(q) >= 3:
+        cand = None
+        for g in {q[j:j + 3] for j in range(len(q) - 2)}:
+            ids = ent["grams"].get(g)
+            if ids is None:
+                return np.empty(0, dtype=np.int32)
+            cand = ids if cand is None else np.intersect1d(cand, ids, assume_unique=True)
+        hit = [i for i in cand if q in values[i]]  # trigram 후보만 검증
+    else:
+        hit = np.flatnonzero(pd.Series(values, dtype=object).str.contains(q, regex=False).to_numpy())
+    off, rows = ent["offsets"], ent["rows"]
+    if len(hit) == 0:
+        return np.empty(0, dtype=np.int32)
+    return np.sort(np.concatenate([rows[off[i]:off[i + 1]] for i in hit]))
+
+def query_filter_index(idx: Dict[str, Any], eq: Dict[str, str], like: Dict[str, str]) -> np.ndarray:
+    """조건별 행 id(오름차순). 각 조건의 posting을 작은 것부터 교집합한다."""
+    sets = []
+    for c, v in eq.items():
+        if not v:
+            continue
+        ent = idx["eq"][c]; i = ent["pos"].get(str(v))
+        if i is None:
+            return np.empty(0, dtype=np.int32)
+        sets.append(ent["rows"][ent["offsets"][i]:ent["offsets"][i + 1]])
+    for c, q in like.items():
+        if q:
+            sets.append(_like_rows(idx["like"][c], q))
+    if not sets:
+        return np.arange(idx["n"], dtype=np.int32)
+    sets.sort(key=len)
+    out = sets[0]
+    for s_ in sets[1:]:
+        if len(out) == 0:
+            break
+        out = np.intersect1d(out, s_, assume_unique=True)
+    return out
 
 # ============== 최근 변경 스냅샷/추이 ==============
-RECENT_CHANGES_FILE = DATA_DIR / "recent_changes.csv"
+# 변경 이력: KST 일자별 append-only 파티션
+#   changes/YYYY-MM-DD.jsonl   — 당일(열린) 파티션, 동기화마다 변경분만 append
+#   changes/YYYY-MM-DD.parquet — 지난 날짜는 백그라운드 compaction으로 중복 제거 + 컬럼형 압축
+CHANGE_LOG_DIR = DATA_DIR / "changes"
+CHANGE_LOG_DIR.mkdir(parents=True, exist_ok=True)
+RECENT_CHANGES_FILE = DATA_DIR / "recent_changes.csv"  # 구 포맷(최초 compaction 시 파티션으로 이관)
+_RC_LOCK = threading.Lock()  # 병렬 동기화 시 파티션 append/compaction 직렬화
+
+def _day_paths(day: str):
+    return CHANGE_LOG_DIR / f"{day}.jsonl", CHANGE_LOG_DIR / f"{day}.parquet"
 
 def _append_recent_changes(df_new: pd.DataFrame) -> None:
-    cols_order = [
-        "ts_kst","group","feature","action",
-        "model_name","operator","region","country","mcc","mnc","sp_type","mode",
-        "before_value","after_value","before_status","after_status","_key"
-    ]
-    for c in cols_order:
+    for c in CHANGE_COLS:
         if c not in df_new.columns:
             df_new[c] = ""
-    if RECENT_CHANGES_FILE.exists():
-        base = pd.read_csv(RECENT_CHANGES_FILE, dtype=str, keep_default_na=False)
-        out = pd.concat([df_new[cols_order], base], ignore_index=True)
-    else:
-        out = df_new[cols_order]
-    out = out.drop_duplicates(subset=["ts_kst","_key","action"], keep="first")
-    out = out.sort_values("ts_kst", ascending=False).head(5000)
-    out.to_csv(RECENT_CHANGES_FILE, index=False)
-
-def snapshot_changes(cache_name: str, old_df: pd.DataFrame, new_df: pd.DataFrame) -> dict:
+    df_new = df_new[CHANGE_COLS].astype(str)
+    for day, part in df_new.groupby(df_new["ts_kst"].str[:10], sort=False):
+        text = part.to_json(orient="records", lines=True, force_ascii=False)
+        if not text.endswith("\n"):
+            text += "\n"
+        with _RC_LOCK:
+            with open(_day_paths(day)[0], "a", encoding="utf-8") as fh:
+                fh.write(text)
+
+def change_log_days() -> List[str]:
+    """보유 파티션 일자(최신순)."""
+    days = {p.stem for p in CHANGE_LOG_DIR.glob("*.jsonl")} | {p.stem for p in CHANGE_LOG_DIR.glob("*.parquet")}
+    return sorted(days, reverse=True)
+
+def read_change_partition(day: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    jl, pqf = _day_paths(day)
+    parts = []
+    if pqf.exists():
+        parts.append(pd.read_parquet(pqf, columns=columns))
+    if jl.exists() and jl.stat().st_size > 0:
+        df = pd.read_json(jl, lines=True, dtype=False, convert_dates=False)
+        parts.append(df[columns] if columns else df)
+    if not parts:
+        return pd.DataFrame(columns=columns or CHANGE_COLS)
+    return pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+
+def _migrate_legacy_recent_changes() -> None:
+    if not RECENT_CHANGES_FILE.exists():
+        return
+    legacy = pd.read_csv(RECENT_CHANGES_FILE, dtype=str, keep_default_na=False)
+    if not legacy.empty:
+        _append_recent_changes(legacy)
+    RECENT_CHANGES_FILE.rename(RECENT_CHANGES_FILE.with_suffix(".csv.migrated"))
+
+@st.cache_resource
+def _compaction_lock() -> threading.Lock:
+    # 프로세스 공용(리런마다 모듈 전역이 새로 만들어져도 같은 락). 구 포맷 이관 + compaction 전체를 직렬화
+    return threading.Lock()
+
+def compact_change_log(retention_days: int = CHANGE_LOG_RETENTION_DAYS) -> Dict[str, int]:
+    """지난 일자 jsonl → parquet 병합(중복 제거), 보관 기간 지난 파티션 삭제.
+
+    다른 compaction이 실행 중이면 기다리지 않고 건너뛴다(skipped=1). 남은 jsonl은 다음 compaction이 처리.
+    """
+    lock = _compaction_lock()
+    if not lock.acquire(blocking=False):
+        return {"compacted": 0, "expired": 0, "skipped": 1}
+    try:
+        return _compact_change_log(retention_days)
+    finally:
+        lock.release()
+
+def _compact_change_log(retention_days: int) -> Dict[str, int]:
+    _migrate_legacy_recent_changes()
+    today = datetime.now(KST).date()
+    cutoff = (today - timedelta(days=retention_days)).isoformat()
+    stats = {"compacted": 0, "expired": 0}
+    for day in change_log_days():
+        jl, pqf = _day_paths(day)
+        if day < cutoff:
+            with _RC_LOCK:
+                jl.unlink(missing_ok=True); pqf.unlink(missing_ok=True)
+            stats["expired"] += 1
+            continue
+        if day >= today.isoformat() or pq is None or not jl.exists():
+            continue
+        with _RC_LOCK:
+            if not jl.exists():  # 잠금 밖에서 확인한 뒤 사라졌을 수 있음
+                continue
+            df = read_change_partition(day).astype(str)
+            df = df.drop_duplicates(subset=["ts_kst","_key","action"], keep="first")
+            df = df.sort_values("ts_kst", ascending=False, kind="stable")
+            tmp = pqf.with_suffix(".parquet.tmp")
+            df[CHANGE_COLS].to_parquet(tmp, index=False)
+            os.replace(tmp, pqf)
+            jl.unlink(missing_ok=True)
+        stats["compacted"] += 1
+    return stats
+
+def start_compaction() -> threading.Thread:
+    t = threading.Thread(target=compact_change_log, name="fmw-changelog-compact", daemon=True)
+    t.start()
+    return t
+
+def change_rows(cache_name: str, old_df: pd.DataFrame, new_df: pd.DataFrame):
+    """diff 결과를 변경 이력 행(CHANGE_COLS)으로. (counts, rows) 반환, 기록은 하지 않음."""
     now_kst = datetime.now(KST).isoformat(timespec="seconds")
     g, f = cache_name.replace("records__", "").split("__", 1)
-    oldk = df_keyed(ensure_cols(old_df))
-    newk = df_keyed(ensure_cols(new_df))
-    old_keys = set(oldk["_key"]); new_keys = set(newk["_key"]); both_keys = old_keys & new_keys
-
-    added = newk[newk["_key"].isin(new_keys - old_keys)].copy()
-    added["action"] = "ADD"; added["before_value"] = ""; added["before_status"] = ""
-    added["after_value"] = added["value"]; added["after_status"] = added["status"]
-
-    removed = oldk[oldk["_key"].isin(old_keys - new_keys)].copy()
-    removed["action"] = "REM"; removed["before_value"] = removed["value"]; removed["before_status"] = removed["status"]
-    removed["after_value"] = ""; removed["after_status"] = ""
+    counts, out_df = diff_frames(old_df, new_df)
+    if out_df.empty:
+        return counts, pd.DataFrame(columns=CHANGE_COLS)
+    out_df["ts_kst"] = now_kst; out_df["group"] = g; out_df["feature"] = f
+    out_df["_key"] = out_df["_key"].map("{:016x}".format)
+    return counts, out_df[CHANGE_COLS]
 
-    merged = newk[newk["_key"].isin(both_keys)].merge(
-        oldk[["_key","value","status"]], on="_key", how="left", suffixes=("", "_old")
-    )
-    upd_mask = (merged["value"] != merged["value_old"]) | (merged["status"] != merged["status_old"])
-    updated = merged.loc[upd_mask].copy()
-    updated["action"] = "UPD"
-    updated["before_value"] = updated["value_old"].fillna("")
-    updated["before_status"] = updated["status_old"].fillna("")
-    updated["after_value"] = updated["value"]
-    updated["after_status"] = updated["status"]
-
-    def _decorate(df):
-        if df.empty: return df
-        df["ts_kst"] = now_kst; df["group"] = g; df["feature"] = f
-        return df[[
-            "ts_kst","group","feature","action",
-            "model_name","operator","region","country","mcc","mnc","sp_type","mode",
-            "before_value","after_value","before_status","after_status","_key"
-        ]]
-
-    out_df = pd.concat([_decorate(added), _decorate(updated), _decorate(removed)], ignore_index=True)
-    if not out_df.empty:
-        _append_recent_changes(out_df)
-
-    return {"added": len(added), "updated": len(updated), "removed": len(removed)}
+def snapshot_changes(cache_name: str, old_df: pd.DataFrame, new_df: pd.DataFrame) -> dict:
+    counts, rows = change_rows(cache_name, old_df, new_df)
+    if not rows.empty:
+        _append_recent_changes(rows)
+    return counts
 
 def load_recent_changes(limit: int = 200) -> pd.DataFrame:
-    if not RECENT_CHANGES_FILE.exists():
-        return pd.DataFrame(columns=[
-            "ts_kst","group","feature","action",
-            "model_name","operator","region","country","mcc","mnc","sp_type","mode",
-            "before_value","after_value","before_status","after_status","_key"
-        ])
-    df = pd.read_csv(RECENT_CHANGES_FILE, dtype=str, keep_default_na=False)
-    return df.sort_values("ts_kst", ascending=False).head(limit)
-
-def today_change_counts(df_rc: pd.DataFrame) -> int:
-    if df_rc.empty: return 0
-    # 날짜 비교는 Asia/Seoul 기준 문자열 date 비교
+    """최신 파티션부터 limit건이 찰 때까지만 읽는다."""
+    parts, n = [], 0
+    for day in change_log_days():
+        df = read_change_partition(day)
+        parts.append(df); n += len(df)
+        if n >= limit:
+            break
+    if not parts:
+        return pd.DataFrame(columns=CHANGE_COLS)
+    df = pd.concat(parts, ignore_index=True)
+    return df.sort_values("ts_kst", ascending=False, kind="stable").head(limit)
+
+def today_change_counts() -> int:
+    # 파티션이 Asia/Seoul 기준 일자이므로 당일 파티션 행 수만 센다
     today = datetime.now(KST).date().isoformat()
-    return int((pd.to_datetime(df_rc["ts_kst"]).dt.tz_localize("Asia/Seoul", nonexistent="shift_forward", ambiguous="NaT", errors="coerce").dt.date.astype(str) == today).sum())
-
-def trend7(df_rc: pd.DataFrame) -> pd.DataFrame:
-    if df_rc.empty:
-        return pd.DataFrame({"date": [], "ADD": [], "UPD": [], "REM": []})
-    df = df_rc.copy()
-    df["date"] = pd.to_datetime(df["ts_kst"]).dt.tz_localize("Asia/Seoul", nonexistent="shift_forward", ambiguous="NaT", errors="coerce").dt.date
-    pv = df.pivot_table(index="date", columns="action", values="_key", aggfunc="count", fill_value=0).reset_index()
-    # 7일만
-    pv = pv.sort_values("date", ascending=True).tail(7)
-    for c in ("ADD","UPD","REM"):
-        if c not in pv.columns: pv[c] = 0
-    return pv[["date","ADD","UPD","REM"]]
+    return len(read_change_partition(today, columns=["action"]))
+
+def trend7() -> pd.DataFrame:
+    today = datetime.now(KST).date()
+    rows = []
+    for i in range(6, -1, -1):
+        d = today - timedelta(days=i)
+        vc = read_change_partition(d.isoformat(), columns=["action"])["action"].value_counts()
+        if vc.empty:
+            continue
+        rows.append({"date": d, **{a: int(vc.get(a, 0)) for a in ("ADD","UPD","REM")}})
+    return pd.DataFrame(rows, columns=["date","ADD","UPD","REM"])
+
+# ============== HTTP 계측 ==============
+# 요청마다 connect / ttfb / download / parse 단계와 수신 바이트를 남긴다(fmw_netlog).
+# 병렬 동기화 워커·read-ahead 스레드에서 불려도 connect 시간은 스레드별로 잰다.
+NET_LOG = DATA_DIR / "net_timing.jsonl"
+NET_WINDOW = 1000  # 동기화 1회에 페이지 요청이 수백 건
+
+@st.cache_resource
+def get_net_log() -> NetLog:
+    return NetLog(NET_LOG, NET_WINDOW)
 
 # ============== 데이터 소스: 샘플 vs API ==============
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+def _session() -> requests.Session:
+    """프로세스 공용 keep-alive 세션. 풀 크기는 SYNC_CONCURRENCY에 맞춘다."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            s = requests.Session()
+            adapter = get_net_log().adapter(pool_connections=4, pool_maxsize=SYNC_CONCURRENCY)
+            s.mount("http://", adapter); s.mount("https://", adapter)
+            if API_KEY:
+                s.headers["X-API-KEY"] = API_KEY
+            s.verify = VERIFY_SSL
+            _SESSION = s
+        return _SESSION
+
 def _get(path: str, params: Optional[Dict[str, Any]] = None):
-    url = f"{API_BASE}/{path.lstrip('/')}"
-    headers = {"X-API-KEY": API_KEY} if API_KEY else {}
-    r = requests.get(url, params=params or {}, headers=headers, verify=VERIFY_SSL, timeout=120)
-    r.raise_for_status()
-    return r.json()
+    # DRF next 링크는 절대 URL로 오므로 그대로 사용
+    url = path if path.startswith(("http://", "https://")) else f"{API_BASE}/{path.lstrip('/')}"
+    with get_net_log().call("GET", url, session=_session(), params=params or {}, timeout=120) as r:
+        r.raise_for_status()
+        return r.json()
 
 @st.cache_data
 def sample_df() -> pd.DataFrame:
     return pd.read_csv(io.StringIO(SAMPLE_CSV), dtype=str, keep_default_na=False)
 
+_SAMPLE_OVERRIDE: Optional[pd.DataFrame] = None
+
+def set_sample_source(df: Optional[pd.DataFrame]) -> None:
+    """샘플 모드 데이터를 df(SAMPLE_CSV와 같은 컬럼, 결측은 "")로 교체. None이면 내장 샘플로 복귀(리플레이/부하 테스트용)."""
+    global _SAMPLE_OVERRIDE
+    _SAMPLE_OVERRIDE = df
+
+def _sample() -> pd.DataFrame:
+    return sample_df() if _SAMPLE_OVERRIDE is None else _SAMPLE_OVERRIDE
+
 def list_feature_groups_sample() -> List[Dict[str, Any]]:
-    df = sample_df()
+    df = _sample()
     groups = sorted(df["feature_group"].dropna().unique().tolist())
     return [{"name": g} for g in groups]
 
 def list_features_sample(group_name: str) -> List[Dict[str, Any]]:
-    df = sample_df()
+    df = _sample()
     feats = sorted(df.loc[df["feature_group"].eq(group_name), "feature_name"].dropna().unique().tolist())
     return [{"name": f} for f in feats]
 
 def list_feature_records_sample(group_name: str, feature_name: str, **filters) -> List[Dict[str, Any]]:
-    df = sample_df()
+    df = _sample()
     q = df[(df["feature_group"] == group_name) & (df["feature_name"] == feature_name)].copy()
     # 정확 매칭 필터
     for k in ("region","country","mcc","mnc","mode","sp_type"):
@@ -287,6 +618,10 @@ def list_feature_records_sample(group_name: str, feature_name: str, **filters) -
         if v:
             col = "model_name" if k == "model" else "operator"
             q = q[q[col].str.contains(str(v), case=False, na=False)]
+    # since: 백엔드(apply_common_filters)와 동일하게 날짜 단위 >= 비교
+    since = filters.get("since")
+    if since:
+        q = q[q["updated_at"].str[:10] >= str(since)[:10]]
     return q.to_dict(orient="records")
 
 def list_feature_groups_api() -> List[Dict[str, Any]]:
@@ -295,88 +630,360 @@ def list_feature_groups_api() -> List[Dict[str, Any]]:
 def list_features_api(group_name: str) -> List[Dict[str, Any]]:
     return _get(PATH_FEATURES, {"group": group_name})
 
-def list_feature_records_api(group_name: str, feature_name: str, **filters) -> List[Dict[str, Any]]:
+def _record_params(group_name: str, feature_name: str, filters: Dict[str, Any]) -> Dict[str, Any]:
     # PRD: GET-only, params 기반 필터
     params = {"group": group_name, "feature": feature_name}
-    for k in ("model","operator","region","country","mcc","mnc","mode","sp_type","page","page_size"):
+    for k in ("model","operator","region","country","mcc","mnc","mode","sp_type","since","page","page_size"):
         v = filters.get(k)
         if v not in (None, "", []):
             params[k] = v
+    return params
+
+def iter_feature_record_pages_api(group_name: str, feature_name: str, page_size: int = PAGE_SIZE,
+                                  prefetch: bool = True, **filters) -> Iterator[List[Dict[str, Any]]]:
+    """/feature-records/ 페이지 단위 제너레이터. DRF next 링크를 끝까지 따라간다.
+
+    prefetch=True이면 현재 페이지를 소비하는 동안 다음 페이지를 미리 받아 둔다(read-ahead 1장).
+    """
+    params = _record_params(group_name, feature_name, filters)
+    params.setdefault("limit", page_size)  # OptionalLimitOffsetPagination
     # /feature-records/ 또는 /long-records/ 중 선택
-    use_long = bool(filters.get("_use_long", False))
-    path = PATH_LONG if use_long else PATH_RECORDS
-    data = _get(path, params)
-    # DRF 페이징 대응
-    if isinstance(data, dict) and "results" in data:
-        return data["results"]
-    return data
+    path = PATH_LONG if filters.get("_use_long", False) else PATH_RECORDS
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="fmw-readahead") as ra:
+        fut = ra.submit(_get, path, params)
+        while fut is not None:
+            data = fut.result()
+            # DRF 페이징 대응(페이징 미사용 응답은 단일 페이지)
+            if isinstance(data, dict) and "results" in data:
+                rows, nxt = data["results"], data.get("next")
+            else:
+                rows, nxt = data, None
+            fut = ra.submit(_get, nxt) if (nxt and prefetch) else None
+            yield rows
+            if nxt and fut is None:
+                fut = ra.submit(_get, nxt)
+
+def list_feature_records_api(group_name: str, feature_name: str, **filters) -> List[Dict[str, Any]]:
+    return [r for page in iter_feature_record_pages_api(group_name, feature_name, **filters) for r in page]
+
+def iter_feature_record_pages_sample(group_name: str, feature_name: str, page_size: int = PAGE_SIZE,
+                                     prefetch: bool = True, **filters) -> Iterator[List[Dict[str, Any]]]:
+    rows = list_feature_records_sample(group_name, feature_name, **filters)
+    for i in range(0, max(len(rows), 1), page_size):
+        yield rows[i:i + page_size]
+
+def write_records_parquet(pages: Iterable[List[Dict[str, Any]]], path: pathlib.Path) -> int:
+    """페이지를 받는 즉시 row group으로 기록한다. 기록하는 동안의 메모리 상주량은 페이지 1장 수준."""
+    schema = _arrow_schema()
+    n = 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with pq.ParquetWriter(path, schema) as writer:
+        for rows in pages:
+            if not rows:
+                continue
+            page_df = ensure_cols(pd.DataFrame(rows))
+            writer.write_table(pa.Table.from_pandas(page_df, preserve_index=False).cast(schema))
+            n += len(page_df)
+    return n
 
 if USE_SAMPLE == "1":
     list_feature_groups = list_feature_groups_sample
     list_features = list_features_sample
     list_feature_records = list_feature_records_sample
+    iter_feature_record_pages = iter_feature_record_pages_sample
 else:
     list_feature_groups = list_feature_groups_api
     list_features = list_features_api
     list_feature_records = list_feature_records_api
+    iter_feature_record_pages = iter_feature_record_pages_api
 
 # ============== 동기화(06:00 자동) ==============
-def sync_all() -> Dict[str, Any]:
-    summary = {"groups": 0, "features": 0, "records_added": 0, "records_updated": 0, "records_removed": 0}
+def _high_water_mark(df: pd.DataFrame) -> Optional[str]:
+    if df.empty or "updated_at" not in df.columns:
+        return None
+    ts = pd.to_datetime(df["updated_at"], errors="coerce", utc=True).max()
+    return None if pd.isna(ts) else ts.tz_convert(KST).isoformat(timespec="seconds")
+
+def _needs_full_sync(meta: dict, old_df: pd.DataFrame) -> bool:
+    if old_df.empty or not meta.get("hwm") or not meta.get("last_full_kst"):
+        return True
+    try:
+        last_full = datetime.fromisoformat(meta["last_full_kst"])
+    except Exception:
+        return True
+    return datetime.now(KST) - last_full >= timedelta(days=FULL_SYNC_EVERY_DAYS)
+
+def _sync_feature(gname: str, fname: str, gen: pathlib.Path, prev: pathlib.Path, delta: bool = False) -> Dict[str, Any]:
+    """피처 1개 동기화: 이전 세대(prev) 대비 조회 → diff → 새 세대(gen)에 parquet/인덱스/meta 저장.
+
+    워커 스레드에서 호출된다. 변경 이력 행은 반환만 하고 세대 게시 후 sync_all이 기록한다.
+    delta=True이면 meta의 high-water mark(hwm) 이후 변경분만 since로 받아 캐시에 병합한다.
+    증분으로는 삭제를 알 수 없으므로 FULL_SYNC_EVERY_DAYS마다 전체 재조회로 정합을 맞춘다.
+
+    메모리: 전체 재조회의 수신·기록 구간만 페이지 1장 수준이다. 이어지는 diff/필터 인덱스/통계는
+    기록된 피처 전체를 다시 읽어 이전 세대 전체와 비교하므로 피크는 여전히 피처 약 2벌이다.
+    """
+    t0 = time.perf_counter()
+    cache_name = f"records__{gname}__{fname}"
+    old_df = _load_df(cache_name, prev)
+    meta = read_meta(cache_name, prev)
+    full = (not delta) or _needs_full_sync(meta, old_df)
+
+    # long 뷰 사용 시 파라미터로 활성화 가능(현재는 기본 off)
+    params = {} if full else {"since": meta["hwm"]}
+    pages = iter_feature_record_pages(gname, fname, _use_long=False, **params)
+    streamed = full and pq is not None
+    if streamed:
+        # 전체 재조회는 페이지 단위로 바로 parquet에 스트리밍(JSON 전체를 메모리에 쌓지 않음)
+        write_records_parquet(pages, _p(cache_name, ".parquet", gen))
+        fetched_df = _load_df(cache_name, gen)  # diff/인덱스용으로 피처 전체를 다시 올림(메모리 상한 아님)
+    else:
+        fetched_df = ensure_cols(pd.DataFrame([r for page in pages for r in page]))
+    if full:
+        new_df = fetched_df
+    else:
+        # 변경분 우선, 나머지는 기존 캐시 유지 (since는 날짜 단위라 겹치는 행은 덮어쓰기)
+        new_df = pd.concat([fetched_df, ensure_cols(old_df)], ignore_index=True)
+        new_df = ensure_cols(new_df.drop_duplicates(subset=KEY_COLS, keep="first").reset_index(drop=True))
+
+    dcnt, changes = change_rows(cache_name, old_df, new_df)  # diff 단일 패스
+
+    # 새 세대는 아직 게시 전이라 읽는 쪽과 충돌 없음. 파일은 피처별로 분리되어 워커 간 충돌도 없음
+    if not streamed:
+        _save_df(cache_name, new_df, gen)
+    _save_filter_index(cache_name, new_df, gen)
+    now_iso = datetime.now(KST).isoformat(timespec="seconds")
+    mode = new_df["mode"]
+    stats = {"rows": len(new_df), "allow": int((mode == "allow").sum()), "block": int((mode == "block").sum()),
+             "bytes": _p(cache_name, ".parquet", gen).stat().st_size, "last_sync_kst": now_iso}
+    _save_meta(
+        cache_name, gen, **dcnt, **stats,
+        sync_mode="full" if full else "delta",
+        fetched=len(fetched_df),
+        hwm=_high_water_mark(new_df) or meta.get("hwm"),
+        last_full_kst=now_iso if full else meta.get("last_full_kst"),
+    )
+    return {**dcnt, "full": full, "fetched": len(fetched_df), "elapsed_s": time.perf_counter() - t0,
+            "cache_name": cache_name, "stats": stats, "changes": changes}
+
+def sync_all(concurrency: Optional[int] = None, delta: Optional[bool] = None,
+             progress: Optional[Callable[[int, int], None]] = None) -> Dict[str, Any]:
+    """전체 동기화. concurrency>1이면 공용 세션 위 bounded 워커 풀로 그룹/피처를 병렬 처리한다.
+
+    - concurrency 미지정: 실API는 SYNC_CONCURRENCY, 샘플 모드는 1(순차)
+    - delta 미지정: SYNC_DELTA (피처별 hwm 기반 증분 + 주기적 전체 재조회)
+    - progress(done, total): 피처 1개 완료마다 호출(호출 스레드에서)
+    - summary.elapsed_s: 벽시계 소요, summary.serial_s: 피처별 소요 합(순차 실행 기준선 추정)
+    """
+    workers = concurrency or (1 if USE_SAMPLE == "1" else SYNC_CONCURRENCY)
+    delta = SYNC_DELTA if delta is None else delta
+    t0 = time.perf_counter()
+    summary = {"groups": 0, "features": 0, "records_added": 0, "records_updated": 0, "records_removed": 0,
+               "features_full": 0, "records_fetched": 0}
     groups = list_feature_groups() or []
     summary["groups"] = len(groups)
+    gnames = [g.get("name") for g in groups]
 
-    for g in groups:
-        gname = g.get("name")
-        feats = list_features(gname) or []
-        summary["features"] += len(feats)
-        for f in feats:
-            fname = f.get("name")
-            # long 뷰 사용 시 파라미터로 활성화 가능(현재는 기본 off)
-            new_rows = list_feature_records(gname, fname, _use_long=False)
-            new_df = ensure_cols(pd.DataFrame(new_rows))
-            cache_name = f"records__{gname}__{fname}"
-            old_df = _load_df(cache_name)
-
-            dcnt = diff_counts(old_df, new_df)
-            _ = snapshot_changes(cache_name, old_df, new_df)
+    serial_s = 0.0
+    manifest: Dict[str, dict] = {}
+    changes: List[pd.DataFrame] = []
+    prev, gen = current_generation(), _new_generation()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fmw-sync") as pool:
+            feats_by_group = list(pool.map(lambda gn: list_features(gn) or [], gnames))
+            jobs = [(gn, f.get("name")) for gn, feats in zip(gnames, feats_by_group) for f in feats]
+            summary["features"] = len(jobs)
+            # map은 입력 순서대로 결과를 돌려주므로 합산 결과는 순차 실행과 동일
+            for dcnt in pool.map(lambda job: _sync_feature(*job, gen=gen, prev=prev, delta=delta), jobs):
+                summary["records_added"]   += dcnt["added"]
+                summary["records_updated"] += dcnt["updated"]
+                summary["records_removed"] += dcnt["removed"]
+                summary["features_full"]   += int(dcnt["full"])
+                summary["records_fetched"] += dcnt["fetched"]
+                serial_s += dcnt["elapsed_s"]
+                manifest[dcnt["cache_name"]] = dcnt["stats"]
+                if not dcnt["changes"].empty:
+                    changes.append(dcnt["changes"])
+                if progress:
+                    progress(len(manifest), len(jobs))
+        _save_manifest(manifest, gen)
+    except BaseException:
+        shutil.rmtree(gen, ignore_errors=True)  # 게시 전 실패: 읽는 쪽은 이 세대를 본 적 없음
+        raise
+    _publish_generation(gen)
+
+    summary["concurrency"] = workers
+    summary["elapsed_s"] = round(time.perf_counter() - t0, 3)
+    summary["serial_s"] = round(serial_s, 3)
+    summary["records_total"] = sum(v["rows"] for v in manifest.values())
+    summary["generation"] = gen.name
+    if changes:
+        _append_recent_changes(pd.concat(changes, ignore_index=True))
+    _save_meta("index", **summary)
+    gc_generations()
+    start_compaction()  # 변경 이력 정리는 백그라운드로
+    return summary
 
-            _save_df(cache_name, new_df)
-            _save_meta(cache_name, **dcnt)
+# ============== 동기화 워커(호스트당 1개) ==============
+# - 프로세스당 워커 1개(st.cache_resource 싱글턴) + 호스트 단위 파일 락 → 세션/리런/다중 프로세스에서도 중복 실행 없음
+# - 진행률/소요/결과는 상태 파일에 기록, UI는 읽기만 함
+# - 자동 동기화가 실패하면 마지막 시도(started_kst)로부터 SYNC_RETRY_MINUTES 동안 재시도하지 않음
+# - 프로세스가 강제 종료되면 상태가 running으로 남으므로, 락이 비어 있으면 stale로 본다
+SYNC_LOCK_FILE = DATA_DIR / "sync.lock"
+SYNC_STATUS_FILE = DATA_DIR / "sync_status.json"
+
+class _HostLock:
+    """비차단 배타 파일 락(Windows: msvcrt, 그 외: fcntl). 프로세스가 죽으면 OS가 해제한다."""
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self._fh = None
+
+    def acquire(self) -> bool:
+        fh = open(self.path, "a+")
+        try:
+            if os.name == "nt":
+                import msvcrt
+                fh.seek(0)
+                msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            fh.close()
+            return False
+        self._fh = fh
+        return True
+
+    def release(self) -> None:
+        if self._fh is None:
+            return
+        try:
+            if os.name == "nt":
+                import msvcrt
+                self._fh.seek(0)
+                msvcrt.locking(self._fh.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._fh.fileno(), fcntl.LOCK_UN)
+        finally:
+            self._fh.close(); self._fh = None
 
-            summary["records_added"]   += dcnt["added"]
-            summary["records_updated"] += dcnt["updated"]
-            summary["records_removed"] += dcnt["removed"]
+def read_sync_status() -> dict:
+    try:
+        return json.loads(SYNC_STATUS_FILE.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
 
-    _save_meta("index", **summary)
-    return summary
+def _write_sync_status(**fields) -> None:
+    # 락 보유자만 호출하므로 read-update-write 경합 없음. 교체는 원자적
+    status = read_sync_status(); status.update(fields)
+    tmp = SYNC_STATUS_FILE.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(status, ensure_ascii=False, indent=2), encoding="utf-8")
+    os.replace(tmp, SYNC_STATUS_FILE)
+
+def _sync_lock_free() -> bool:
+    # 잠깐 잡았다 놓는 확인용. 그 사이 시작하려던 동기화는 False로 물러나고 다음 폴링/클릭에서 다시 시도
+    probe = _HostLock(SYNC_LOCK_FILE)
+    if not probe.acquire():
+        return False
+    probe.release()
+    return True
+
+def sync_status() -> dict:
+    """상태 파일 + 보정: running인데 호스트 락을 잡은 프로세스가 없으면(강제 종료) state="stale"."""
+    status = read_sync_status()
+    if status.get("state") == "running" and _sync_lock_free():
+        status = {**status, "state": "stale"}
+    return status
+
+def sync_backoff_active(now: Optional[datetime] = None) -> bool:
+    """마지막 시도가 실패(error/stale)했고 SYNC_RETRY_MINUTES가 아직 안 지났으면 True."""
+    status = sync_status()
+    if status.get("state") not in ("error", "stale"):
+        return False
+    try:
+        last = datetime.fromisoformat(status["started_kst"])
+    except Exception:
+        return False
+    return (now or datetime.now(KST)) - last < timedelta(minutes=SYNC_RETRY_MINUTES)
 
-def maybe_daily_sync(sync_fn):
-    now = datetime.now(KST)
+def daily_sync_due(now: Optional[datetime] = None) -> bool:
+    now = now or datetime.now(KST)
     today6 = now.replace(hour=6, minute=0, second=0, microsecond=0)
     last_str = read_meta("index").get("last_sync_kst")
-    last_dt = None
-    if last_str:
+    try:
+        last_dt = datetime.fromisoformat(last_str) if last_str else None
+    except Exception:
+        last_dt = None
+    return (not last_dt) or (now >= today6 and last_dt < today6)
+
+def run_sync_once(reason: str = "manual") -> bool:
+    """호스트 락을 잡은 경우에만 동기화. 이미 실행 중이거나(다른 세션/프로세스) 예약 실행이 이미 끝났으면 False."""
+    lock = _HostLock(SYNC_LOCK_FILE)
+    if not lock.acquire():
+        return False
+    try:
+        # 같은 06:00 예약이 여러 프로세스에서 울려도 먼저 끝난 한 번만 유효
+        if reason in ("cron", "daily") and not daily_sync_due():
+            return False
+        t0 = time.perf_counter()
+        _write_sync_status(state="running", reason=reason, host=socket.gethostname(), pid=os.getpid(),
+                           started_kst=datetime.now(KST).isoformat(timespec="seconds"), finished_kst=None,
+                           progress={"done": 0, "total": None}, error=None)
         try:
-            last_dt = datetime.fromisoformat(last_str)
-        except Exception:
-            last_dt = None
-    need = (not last_dt) or (now >= today6 and last_dt.date() != now.date())
-    if need:
+            summary = sync_all(progress=lambda d, t: _write_sync_status(progress={"done": d, "total": t}))
+        except BaseException as e:  # KeyboardInterrupt/SystemExit도 running으로 남기지 않음
+            _write_sync_status(state="error", error=f"{type(e).__name__}: {e}",
+                               finished_kst=datetime.now(KST).isoformat(timespec="seconds"),
+                               duration_s=round(time.perf_counter() - t0, 3))
+            if not isinstance(e, Exception):
+                raise
+            return True
+        _write_sync_status(state="ok", result=summary,
+                           finished_kst=datetime.now(KST).isoformat(timespec="seconds"),
+                           duration_s=round(time.perf_counter() - t0, 3))
+        return True
+    finally:
+        lock.release()
+
+class SyncWorker:
+    """프로세스당 1개. APScheduler가 있으면 06:00 cron, 없으면 데몬 스레드가 1분마다 '오늘 06:00 이후 미동기화'를 확인."""
+    def __init__(self):
+        self._busy = threading.Lock()
+        if BackgroundScheduler:
+            self._sched = BackgroundScheduler(daemon=True)
+            self._sched.add_job(self.run, "cron", hour=6, minute=0, timezone="Asia/Seoul", id="daily_sync",
+                                kwargs={"reason": "cron"}, replace_existing=True, max_instances=1, coalesce=True)
+            self._sched.start()
+            self.mode = "APScheduler(06:00)"
+        else:
+            threading.Thread(target=self._poll, name="fmw-sync-poll", daemon=True).start()
+            self.mode = "Fallback(백그라운드 하루 1회)"
+        if not _meta_path("index").exists():
+            self.trigger("initial")
+
+    def _poll(self):
+        while True:
+            if daily_sync_due() and not sync_backoff_active():
+                self.run("daily")
+            time.sleep(60)
+
+    def run(self, reason: str = "manual") -> bool:
+        if not self._busy.acquire(blocking=False):
+            return False
         try:
-            sync_fn()
-        except Exception as e:
-            st.warning(f"자동 동기화 실패: {e}")
-
-def start_scheduler():
-    if BackgroundScheduler:
-        sched = BackgroundScheduler()
-        sched.add_job(sync_all, "cron", hour=6, minute=0, timezone="Asia/Seoul", id="daily_sync", replace_existing=True)
-        sched.start()
-        return "APScheduler(06:00)"
-    else:
-        maybe_daily_sync(sync_all)
-        return "Fallback(앱 열릴 때 하루 1회)"
+            return run_sync_once(reason)
+        finally:
+            self._busy.release()
+
+    def trigger(self, reason: str = "manual") -> None:
+        """비동기 실행 요청(UI 스레드는 기다리지 않음)."""
+        threading.Thread(target=self.run, args=(reason,), name="fmw-sync-run", daemon=True).start()
+
+@st.cache_resource
+def get_sync_worker() -> SyncWorker:
+    return SyncWorker()
 
 # ============== 도우미: 다운로드 버튼 ==============
 def df_to_excel_bytes(df: pd.DataFrame) -> Optional[bytes]:
@@ -403,15 +1010,21 @@ st.markdown("""
 st.title("FMW 데이터 매니저 · UX v3")
 st.caption("GET-only API · 06:00 자동 동기화 · 오버뷰/탐색/변경 이력 · CSV/Excel 다운로드")
 
-status_msg = start_scheduler()
-st.info(f"동기화 상태: {status_msg} | 모드: {'샘플' if USE_SAMPLE=='1' else '실API'}")
-
-# 초기 캐시 없으면 1회 동기화
+sync_worker = get_sync_worker()
+sync_state = sync_status()
+snap_gen = current_generation()  # 이번 리런 동안 읽을 스냅샷 세대 고정
+st.info(f"동기화 상태: {sync_worker.mode} | 모드: {'샘플' if USE_SAMPLE=='1' else '실API'}"
+        f" | 최근 작업: {sync_state.get('state', '-')} ({sync_state.get('reason', '-')}, {sync_state.get('duration_s', '-')}s)")
+if sync_state.get("state") == "running":
+    prog = sync_state.get("progress") or {}
+    done, total = prog.get("done") or 0, prog.get("total") or 0
+    st.progress(done / total if total else 0.0, text=f"동기화 진행 중 {done}/{total or '?'} (시작 {sync_state.get('started_kst')})")
+elif sync_state.get("state") == "error":
+    st.warning(f"동기화 실패: {sync_state.get('error')} (자동 재시도: {SYNC_RETRY_MINUTES}분 후)")
+elif sync_state.get("state") == "stale":
+    st.warning(f"이전 동기화가 완료 기록 없이 중단되었습니다 (시작 {sync_state.get('started_kst')}, pid {sync_state.get('pid')})")
 if not _meta_path("index").exists():
-    try:
-        sync_all()
-    except Exception as e:
-        st.warning(f"초기 동기화 실패: {e}")
+    st.info("초기 동기화가 백그라운드에서 진행 중입니다. 잠시 후 새로고침하세요.")
 
 # --- 사이드바: 그룹/피처/필터 ---
 st.sidebar.header("탐색 & 필터")
@@ -468,26 +1081,24 @@ with tab_ov:
     updated = int(meta.get("records_updated", 0) or 0)
     removed = int(meta.get("records_removed", 0) or 0)
 
-    rc_base = load_recent_changes(limit=1000)
-    today_cnt = today_change_counts(rc_base)
+    today_cnt = today_change_counts()
 
-    # 총 레코드(간단 산출): 캐시에 저장된 모든 parquet 합
+    # 총 레코드: 동기화 시 기록한 매니페스트 합(없으면 parquet footer). parquet 본문은 읽지 않음
     # 실제 총계는 백엔드 집계 API가 이상적이지만, 여기서는 캐시 합으로 대체
-    total_records = 0
-    for p in DATA_DIR.glob("records__*__.parquet"):
-        try:
-            total_records += len(pd.read_parquet(p))
-        except Exception:
-            pass
+    manifest = cache_manifest(snap_gen)
+    total_records = sum(v["rows"] for v in manifest.values())
 
     col1, col2, col3, col4 = st.columns(4)
     col1.metric("총 레코드(캐시)", total_records)
     col2.metric("금일 변경(건)", today_cnt)
     col3.metric("실패 런(오늘)", "N/A")  # GET-only 환경에서는 추적 곤란 → 백엔드 run API 필요
     col4.metric("마지막 동기화(KST)", idx_last)
+    if meta.get("elapsed_s") is not None:
+        st.caption(f"⏱️ 동기화 소요 {meta['elapsed_s']}s (동시성 {meta.get('concurrency', 1)}) · 순차 기준 {meta.get('serial_s', '-')}s"
+                   f" · 수신 {meta.get('records_fetched', '-')}건 (전체 재조회 피처 {meta.get('features_full', '-')}/{meta.get('features', '-')})")
 
     st.markdown("#### 최근 7일 변경 추이")
-    tr = trend7(rc_base)
+    tr = trend7()
     if tr.empty:
         st.info("추이 데이터가 없습니다. 동기화 후 다시 확인하세요.")
     else:
@@ -496,12 +1107,13 @@ with tab_ov:
     # 선택 항목 현황
     st.markdown("#### 선택 항목 현황")
     if sel_group and sel_feature:
-        df = _load_df(f"records__{sel_group}__{sel_feature}")
-        if not df.empty:
-            df = ensure_cols(df)
-            total = len(df)
-            allow_cnt = int((df.get("mode","").astype(str)=="allow").sum())
-            block_cnt = int((df.get("mode","").astype(str)=="block").sum())
+        ent = dict(manifest.get(f"records__{sel_group}__{sel_feature}") or {})
+        if ent and ent.get("allow") is None:
+            # footer 폴백에는 allow/block이 없으므로 해당 피처의 mode 컬럼만 읽음
+            mode = pd.read_parquet(_p(f"records__{sel_group}__{sel_feature}", ".parquet", snap_gen), columns=["mode"])["mode"]
+            ent.update(allow=int((mode == "allow").sum()), block=int((mode == "block").sum()))
+        if ent:
+            total, allow_cnt, block_cnt = ent["rows"], ent["allow"], ent["block"]
             cc1, cc2, cc3 = st.columns(3)
             cc1.metric("총 레코드", total)
             cc2.metric("allow", allow_cnt)
@@ -512,29 +1124,45 @@ with tab_ov:
     else:
         st.info("좌측에서 그룹과 피처를 선택하면 해당 현황을 보여드립니다.")
 
+    with st.expander("🔧 개발 전용 · API 지연 분해(최근 요청, ms)"):
+        # ttfb는 응답 헤더까지(서버+프록시+왕복 지연), download면 전송 구간, parse면 클라이언트 쪽
+        net = get_net_log().stats()
+        if net.empty:
+            st.caption("아직 계측된 API 요청이 없습니다(샘플 모드는 네트워크를 쓰지 않음).")
+        else:
+            st.dataframe(net, hide_index=True, use_container_width=True)
+        st.caption(f"요청별 기록: {NET_LOG}")
+
 # ===== 탐색 =====
-def load_cached_records(g: str, f: str) -> pd.DataFrame:
-    if not (g and f): return pd.DataFrame()
-    return ensure_cols(_load_df(f"records__{g}__{f}"))
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _cached_records(name: str, gen: str, mtime: float):
+    # (이름, 세대, mtime) 키: 세대는 불변이라 새 세대가 게시되면 자동으로 새로 읽음. 세션 간 공유(읽기 전용)
+    g = DATA_DIR / gen if gen == "." else GEN_DIR / gen
+    df = ensure_cols(_load_df(name, g))
+    return df, (load_filter_index(name, g) or build_filter_index(df))
+
+def load_cached_records(g: str, f: str, gen: pathlib.Path):
+    if not (g and f): return pd.DataFrame(), None
+    name = f"records__{g}__{f}"
+    p = _p(name, ".parquet", gen)
+    if not p.exists(): return pd.DataFrame(), None
+    return _cached_records(name, "." if gen == DATA_DIR else gen.name, p.stat().st_mtime)
 
 with tab_explore:
     st.markdown("#### 조건별 조회")
     if run_query and sel_group and sel_feature:
-        df = load_cached_records(sel_group, sel_feature)
+        df, fidx = load_cached_records(sel_group, sel_feature, snap_gen)
         if df.empty:
             st.info("캐시가 없습니다. 06:00 자동 동기화 이후 확인하세요.")
         else:
-            q = df.copy()
-            # 정확 매칭
-            if mode_eq:       q = q[q["mode"] == mode_eq]
-            if region_eq:     q = q[q["region"] == region_eq]
-            if country_eq:    q = q[q["country"] == country_eq]
-            if mcc_eq:        q = q[q["mcc"] == str(mcc_eq)]
-            if mnc_eq:        q = q[q["mnc"] == str(mnc_eq)]
-            if sp_eq:         q = q[q["sp_type"] == sp_eq]
-            # 포함검색
-            if model_like:    q = q[q["model_name"].str.contains(model_like, case=False, na=False)]
-            if operator_like: q = q[q["operator"].str.contains(operator_like, case=False, na=False)]
+            # 정확 매칭 + 포함검색(대소문자 무시, 리터럴) → 인덱스 교집합으로 행 id만 계산
+            ids = query_filter_index(
+                fidx,
+                eq={"mode": mode_eq, "region": region_eq, "country": country_eq,
+                    "mcc": mcc_eq, "mnc": mnc_eq, "sp_type": sp_eq},
+                like={"model_name": model_like, "operator": operator_like},
+            )
+            q = df.iloc[ids]
 
             st.caption(f"🔎 결과 {len(q)}건")
             st.dataframe(q, use_container_width=True, height=420)
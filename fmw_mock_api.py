@@ -0,0 +1,393 @@
+# fmw_mock_api.py
+# FMW API 로컬 대역 서버 (단일 파일, 표준 라이브러리 http.server)
+# - Django+Postgres 없이 클라이언트(streamlit_app / ux3 / 데모 / v3_plus)를 부하·지연 테스트하기 위한 목 서버
+# - 데이터: 데모 생성기(make_fmw_df + iter_churn_days)로 N일치 변경을 시뮬레이션 → 마지막 날 = 오늘 스냅샷,
+#   일별 변경분은 히스토리/요약 응답에 사용. 같은 인자(seed 포함)면 항상 같은 응답
+# - 주입: 응답 헤더 전 지연(latency + jitter), 오류율(503), 대역폭 상한(본문 전송 속도)
+#
+# 경로 (응답 형태는 각 클라이언트가 기대하는 형태)
+#   GET  /api/v1/all                CSV(DataManager.HEADERS). ETag/If-None-Match·Last-Modified/If-Modified-Since → 304,
+#                                   Accept-Encoding: gzip이면 압축, 컬럼명 쿼리 = 부분 일치 필터
+#   GET  /api/v1/history            CSV(감사 로그). date_from/date_to/action/limit/offset + 컬럼 부분 일치
+#   GET  /api/dev/runs/summary      JSON. ?days=N 시리즈(v3_plus) + today_changes/today_failed_runs(streamlit_app, 항상 0)
+#   POST /api/dev/sync[/<group>]    202
+#   GET  /api/feature-groups/       [{"name"}]
+#   GET  /api/features/?group=      [{"name"}]
+#   GET  /api/feature-records/      ux3 레코드. 운영 OptionalLimitOffsetPagination과 같은 페이지({count,next,previous,results}):
+#                                   limit 없음/잘못된 값 → 500행, 최대 5000, limit=all → 페이지 없이 전체 목록
+#   GET  /api/long-records/         /feature-records/와 동일
+#   Accept: application/json 또는 ?format=json 이면 CSV 경로도 JSON(records)으로 응답
+#
+# 실행 예시
+#   python fmw_mock_api.py                                        # 100k행, 30일, http://127.0.0.1:8000
+#   python fmw_mock_api.py --rows 1000000 --latency-ms 150 --jitter-ms 100 --error-rate 0.02 --bandwidth-mbps 50
+#   USE_SAMPLE=0 API_BASE=http://127.0.0.1:8000/api streamlit run fmw_dm_single_ux3.py
+#   (streamlit_app / v3_plus / 데모는 BASE_URL 또는 호스트 입력란에 http://127.0.0.1:8000)
+#
+# 테스트 코드에서는 serve_in_thread(build_dataset(...), port=0, ...) → (server, base_url)
+
+import sys, gzip, json, types, pathlib, time, random, argparse, threading
+from datetime import datetime, time as dtime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable, Optional, Tuple
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+import numpy as np
+import pandas as pd
+
+KST = timezone(timedelta(hours=9))
+ALL_COLS = ["model_name", "solution", "feature_group", "feature", "mcc", "mnc", "region", "country", "operator",
+            "sp_fci", "mode", "value", "sync_time"]
+AUDIT_COLS = ["action", "model_name", "solution", "feature_group", "feature", "dims_json",
+              "mode_before", "mode_after", "value_before", "value_after", "changed_at", "run_id"]
+DIM_COLS = ["mcc", "mnc", "region", "country", "operator"]
+REC_EQ = ("region", "country", "mcc", "mnc", "mode", "sp_type")   # ux3 정확 매칭 필터
+REC_LIKE = {"model": "model_name", "operator": "operator"}        # ux3 부분 일치 필터
+DEFAULT_LIMIT = 500   # 서버 default_limit(OptionalLimitOffsetPagination)
+MAX_LIMIT = 5000      # 서버 max_limit
+WRITE_CHUNK = 1 << 16
+
+# ============== 데이터 ==============
+HERE = pathlib.Path(__file__).resolve().parent
+
+def load_app_core(filename: str, name: str = None) -> types.ModuleType:
+    """앱 파일에서 UI 구간을 제외한 정의부만 실행한 모듈을 돌려준다(fmw_bench도 이 로더를 쓴다).
+
+    앱은 import 시점에 UI를 그리므로 일반 import를 쓸 수 없다. 캐시 디렉터리 등
+    상대경로 부수효과는 현재 작업 디렉터리에 생기므로 호출 전에 chdir 해 둘 것.
+    """
+    path = HERE / filename
+    src = path.read_text(encoding="utf-8")
+    cut = src.index("st.set_page_config(")
+    mod = types.ModuleType(name or path.stem.replace("-", "_"))
+    mod.__file__ = str(path)
+    sys.modules[mod.__name__] = mod
+    exec(compile(src[:cut], str(path), "exec"), mod.__dict__)
+    return mod
+
+def ux3_records(df: pd.DataFrame) -> pd.DataFrame:
+    """데모 생성기 스냅샷 → ux3 레코드 형태(문자열, 결측 ""). ux3 키에는 solution이 없어 model_name에 합친다."""
+    s = df.astype(object).fillna("")
+    return pd.DataFrame({
+        "feature_group": s["feature_group"], "feature_name": s["feature"],
+        "model_name": s["model_name"] + "/" + s["solution"],
+        "mcc": s["mcc"], "mnc": s["mnc"], "region": s["region"], "country": s["country"],
+        "operator": s["operator"], "sp_type": s["sp_fci"], "mode": s["mode"], "value": s["value"],
+        "status": "active", "updated_at": s["sync_time"],
+    })
+
+def _audit_rows(prev: pd.DataFrame, curr: pd.DataFrame, d, demo) -> pd.DataFrame:
+    """전날(prev) → 그날(curr) 변경분을 감사 로그 행으로. 키 = KEY_COLS 해시, 값이 다르면 updated."""
+    hp, hc = demo._row_hash(prev), demo._row_hash(curr)
+    pos = pd.Index(hp).get_indexer(hc)
+    both = np.flatnonzero(pos >= 0)
+    vp = prev["value"].astype(str).to_numpy()[pos[both]]
+    vc = curr["value"].astype(str).to_numpy()[both]
+    upd = both[vp != vc]
+    parts = []
+    for action, src, before, after in (("created", curr.iloc[np.flatnonzero(pos < 0)], None, "curr"),
+                                       ("updated", curr.iloc[upd], "prev", "curr"),
+                                       ("deleted", prev.iloc[np.flatnonzero(~np.isin(hp, hc))], "prev", None)):
+        s = src.astype(object).where(src.notna(), None)
+        old = prev.iloc[pos[upd]] if action == "updated" else s
+        dims = [json.dumps({k: v for k, v in zip(DIM_COLS, r) if v is not None}, ensure_ascii=False)
+                for r in s[DIM_COLS].itertuples(index=False)]
+        parts.append(pd.DataFrame({
+            "action": action, "model_name": s["model_name"].to_numpy(), "solution": s["solution"].to_numpy(),
+            "feature_group": s["feature_group"].to_numpy(), "feature": s["feature"].to_numpy(), "dims_json": dims,
+            "mode_before": old["mode"].astype(str).to_numpy() if before else "",
+            "mode_after": s["mode"].to_numpy() if after else "",
+            "value_before": old["value"].astype(str).to_numpy() if before else "",
+            "value_after": s["value"].to_numpy() if after else "",
+            "changed_at": f"{d.isoformat()} 06:00:00", "run_id": f"sync-{d:%Y%m%d}-01",
+        }))
+    return pd.concat(parts, ignore_index=True)
+
+class MockData:
+    """응답 원본: 오늘 스냅샷(all), ux3 레코드(records), 감사 로그(audit, 최신순).
+
+    last_modified는 오늘 동기화 시각(06:00 KST, 아직 전이면 지금) — /api/v1/all의 Last-Modified.
+    """
+    def __init__(self, all_df: pd.DataFrame, audit: pd.DataFrame, today):
+        self.all = all_df.astype(object).where(all_df.notna(), None)[ALL_COLS]
+        self.records = ux3_records(all_df)
+        self.audit = audit
+        self.today = today
+        self.version = f"{today:%Y%m%d}-{len(all_df)}-{pd.util.hash_pandas_object(audit, index=False).sum():x}"
+        self.last_modified = min(datetime.combine(today, dtime(6), KST), datetime.now(KST)).replace(microsecond=0)
+        self.by_feature = {k: np.asarray(v) for k, v in self.records.groupby(["feature_group", "feature_name"], sort=True).indices.items()}
+        self.groups = sorted({g for g, _ in self.by_feature})
+        self._all_csv = self._all_csv_gz = None
+
+    def all_csv(self) -> bytes:
+        # 필터 없는 전체 CSV는 한 번만 만든다(대용량 기준 가장 흔한 요청)
+        if self._all_csv is None:
+            self._all_csv = self.all.to_csv(index=False).encode("utf-8")
+        return self._all_csv
+
+    def all_csv_gz(self) -> bytes:
+        if self._all_csv_gz is None:
+            self._all_csv_gz = gzip.compress(self.all_csv(), 6)
+        return self._all_csv_gz
+
+def build_dataset(rows: int = 100_000, days: int = 30, seed: int = 20251024, create: float = 0.01,
+                  update: float = 0.02, delete: float = 0.005, **gen_kw) -> MockData:
+    """rows행 0일차에서 days일 변경을 시뮬레이션(마지막 날 = 오늘 KST). gen_kw는 make_fmw_df 인자(n_models 등)."""
+    demo = load_app_core("fmw_streamlit_cloud_demo.py", "fmw_mock_demo")
+    today = datetime.now(KST).date()
+    start = today - timedelta(days=days)
+    prev = demo.make_fmw_df(rows, seed=seed, sync_time=f"{start.isoformat()}T06:00:00+09:00", **gen_kw)
+    audit = []
+    for d, curr, _ in demo.iter_churn_days(prev, days, start=start, create=create, update=update, delete=delete,
+                                           seed=seed, **gen_kw):
+        audit.append(_audit_rows(prev, curr, d, demo))
+        prev = curr
+    audit = pd.concat(audit[::-1], ignore_index=True) if audit else pd.DataFrame(columns=AUDIT_COLS)
+    return MockData(prev, audit, today)
+
+# ============== 필터/페이징 ==============
+def _like(df: pd.DataFrame, q: Dict[str, str], cols) -> pd.DataFrame:
+    for k, v in q.items():
+        if v and k in cols:
+            col = cols[k] if isinstance(cols, dict) else k
+            df = df[df[col].astype(str).str.contains(v, case=False, na=False, regex=False)]
+    return df
+
+def _filter_records(data: MockData, q: Dict[str, str]) -> pd.DataFrame:
+    # ux3 list_feature_records_sample과 같은 의미(정확/부분 일치, since는 날짜 단위 >=)
+    g, f = q.get("group"), q.get("feature")
+    if g and f:
+        df = data.records.iloc[data.by_feature.get((g, f), np.empty(0, dtype=int))]
+    else:
+        df = data.records
+        if g: df = df[df["feature_group"] == g]
+        if f: df = df[df["feature_name"] == f]
+    for k in REC_EQ:
+        if q.get(k):
+            df = df[df[k].astype(str) == q[k]]
+    df = _like(df, q, REC_LIKE)
+    if q.get("since"):
+        df = df[df["updated_at"].str[:10] >= q["since"][:10]]
+    return df
+
+def _positive_int(v, default: int, strict: bool = False) -> int:
+    # DRF _positive_int과 같은 해석: 숫자가 아니거나 음수(strict면 0 포함)면 기본값
+    try:
+        n = int(v)
+    except (TypeError, ValueError):
+        return default
+    return default if n < 0 or (strict and n == 0) else n
+
+def _page(df: pd.DataFrame, q: Dict[str, str], url: str, max_limit: int, default_limit: int = DEFAULT_LIMIT):
+    """운영 OptionalLimitOffsetPagination과 같은 응답. limit=all이면 페이지 없이 전체 목록."""
+    if q.get("limit") == "all":
+        return df.to_dict(orient="records")
+    limit = min(_positive_int(q.get("limit"), default_limit, strict=True), max_limit)
+    offset = _positive_int(q.get("offset"), 0)
+    def link(off):
+        # DRF처럼 첫 페이지로 가는 previous에는 offset을 붙이지 않는다
+        params = {**q, "limit": limit, "offset": off}
+        if not off: params.pop("offset")
+        return f"{url}?{urlencode(params)}"
+    return {"count": len(df),
+            "next": link(offset + limit) if offset + limit < len(df) else None,
+            "previous": link(max(offset - limit, 0)) if offset > 0 else None,
+            "results": df.iloc[offset:offset + limit].to_dict(orient="records")}
+
+def _summary(data: MockData, days: int) -> Dict[str, Any]:
+    # 시뮬레이션한 동기화 실행(run_id)은 모두 성공이라 errors/today_failed_runs는 0.
+    # 주입한 503은 HTTP 계층 오류라 여기에 세지 않는다(server.errors, 종료 시 출력).
+    a = data.audit
+    span = [data.today - timedelta(days=i) for i in range(days - 1, -1, -1)]
+    cnt = a.assign(date=a["changed_at"].str[:10]).pivot_table(index="date", columns="action", values="run_id",
+                                                             aggfunc="count", fill_value=0) if len(a) else pd.DataFrame()
+    series = [{"date": d.isoformat(), **{k: int(cnt.at[d.isoformat(), k]) if d.isoformat() in cnt.index and k in cnt else 0
+                                         for k in ("created", "updated", "deleted")},
+               "errors": 0} for d in span]
+    return {"window": days, "tz": "Asia/Seoul", "version": data.version,
+            "min_date": series[0]["date"], "max_date": series[-1]["date"], "series": series,
+            "today_changes": sum(series[-1][k] for k in ("created", "updated", "deleted")),
+            "today_failed_runs": 0}
+
+# ============== HTTP ==============
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive(클라이언트 연결 재사용 측정용)
+    server_version = "FMWMock/1.0"
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    # ---- 주입 ----
+    def _inject(self) -> bool:
+        """헤더 전 지연을 주고, 오류율에 걸리면 503을 보낸 뒤 True."""
+        s = self.server
+        with s.lock:
+            delay = s.latency_ms + s.rng.random() * s.jitter_ms
+            fail = s.rng.random() < s.error_rate
+            s.requests += 1
+            s.errors += fail
+        time.sleep(delay / 1000)
+        if fail:
+            self._send(503, {"error": {"code": 503, "message": "injected error"}})
+        return fail
+
+    def _send(self, code: int, body=None, ctype: str = "application/json", headers: Optional[Dict[str, str]] = None):
+        if body is not None and not isinstance(body, bytes):
+            body = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        body = body or b""
+        self.send_response(code)
+        self.send_header("Content-Type", f"{ctype}; charset=utf-8" if body else ctype)
+        self.send_header("Content-Length", str(len(body)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        # 대역폭 상한: 청크마다 누적 전송량이 허용량을 앞서면 그만큼 쉰다
+        bps, t0 = self.server.bandwidth_mbps * 125_000, time.perf_counter()
+        for i in range(0, len(body), WRITE_CHUNK):
+            self.wfile.write(body[i:i + WRITE_CHUNK])
+            if bps:
+                ahead = (i + WRITE_CHUNK) / bps - (time.perf_counter() - t0)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+    def _not_modified(self, etag: str, last_modified: datetime) -> bool:
+        # If-None-Match가 있으면 그것만 본다(RFC 9110). 잘못된 날짜 헤더는 무시
+        inm = self.headers.get("If-None-Match")
+        if inm is not None:
+            return inm.strip() == "*" or etag in [t.strip() for t in inm.split(",")]
+        try:
+            ims = parsedate_to_datetime(self.headers.get("If-Modified-Since") or "")
+        except (TypeError, ValueError):
+            return False
+        return ims.tzinfo is not None and last_modified <= ims
+
+    def _table(self, df: pd.DataFrame, q: Dict[str, str], headers=None, csv: Optional[bytes] = None,
+               csv_gz: Optional[Callable[[], bytes]] = None, gzip_ok: bool = False):
+        if q.get("format") == "json" or "application/json" in self.headers.get("Accept", ""):
+            body, ctype = json.dumps(df.to_dict(orient="records"), ensure_ascii=False, default=str).encode("utf-8"), "application/json"
+        else:
+            body, ctype = csv if csv is not None else df.to_csv(index=False).encode("utf-8"), "text/csv"
+        if gzip_ok:
+            # Django gzip_page와 같게: 200바이트 미만은 그대로, 전체 CSV는 압축본도 캐시
+            headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+            if len(body) >= 200:
+                body = csv_gz() if csv_gz and body is csv else gzip.compress(body, 6)
+                headers["Content-Encoding"] = "gzip"
+        self._send(200, body, ctype, headers)
+
+    # ---- 라우팅 ----
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path, q = parts.path.rstrip("/"), dict(parse_qsl(parts.query))
+        data: MockData = self.server.data
+        if path not in self.server.routes:
+            return self._send(404, {"error": {"code": 404, "message": f"no route: {path}"}})
+        if self._inject():
+            return
+        try:
+            if path == "/api/v1/all":
+                # 운영 AllRecordsView와 같은 조건부 GET(condition + gzip_page)
+                etag, last_mod = f'"{data.version}"', format_datetime(data.last_modified.astimezone(timezone.utc), usegmt=True)
+                validators = {"ETag": etag, "Last-Modified": last_mod}
+                if self._not_modified(etag, data.last_modified):
+                    return self._send(304, headers=validators)
+                filt = {k: v for k, v in q.items() if k in ALL_COLS and v}
+                df = _like(data.all, filt, ALL_COLS) if filt else data.all
+                full = not (filt or q.get("format"))
+                return self._table(df, q, validators, csv=data.all_csv() if full else None,
+                                   csv_gz=data.all_csv_gz if full else None,
+                                   gzip_ok="gzip" in self.headers.get("Accept-Encoding", ""))
+            if path == "/api/v1/history":
+                a = data.audit
+                if q.get("date_from"): a = a[a["changed_at"].str[:10] >= q["date_from"][:10]]
+                if q.get("date_to"): a = a[a["changed_at"].str[:10] <= q["date_to"][:10]]
+                if q.get("action"): a = a[a["action"] == q["action"]]
+                a = _like(a, q, [c for c in AUDIT_COLS if c != "action"])
+                off = int(q.get("offset") or 0)
+                return self._table(a.iloc[off:off + int(q.get("limit") or len(a))], q)
+            if path == "/api/dev/runs/summary":
+                return self._send(200, _summary(data, max(1, int(q.get("days") or 7))))
+            if path == "/api/feature-groups":
+                return self._send(200, [{"name": g} for g in data.groups])
+            if path == "/api/features":
+                return self._send(200, [{"name": f} for g, f in data.by_feature if g == q.get("group", g)])
+            # /api/feature-records/, /api/long-records/
+            url = f"http://{self.headers.get('Host', '%s:%s' % self.server.server_address[:2])}{parts.path}"
+            return self._send(200, _page(_filter_records(data, q), q, url, self.server.max_limit))
+        except ValueError as e:
+            return self._send(400, {"error": {"code": 400, "message": str(e)}})
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        path = urlsplit(self.path).path.rstrip("/")
+        if not (path == "/api/dev/sync" or path.startswith("/api/dev/sync/")):
+            return self._send(404, {"error": {"code": 404, "message": f"no route: {path}"}})
+        if self._inject():
+            return
+        group = path[len("/api/dev/sync/"):] or None
+        self._send(202, {"accepted": True, "feature_group": group, "run_id": f"sync-{datetime.now(KST):%Y%m%d-%H%M%S}"})
+
+ROUTES = {"/api/v1/all", "/api/v1/history", "/api/dev/runs/summary", "/api/feature-groups", "/api/features",
+          "/api/feature-records", "/api/long-records"}
+
+def make_server(data: MockData, host: str = "127.0.0.1", port: int = 8000, latency_ms: float = 0.0,
+                jitter_ms: float = 0.0, error_rate: float = 0.0, bandwidth_mbps: float = 0.0,
+                max_limit: int = MAX_LIMIT, seed: int = 0, verbose: bool = False) -> ThreadingHTTPServer:
+    """설정을 서버 속성으로 붙인 ThreadingHTTPServer. bandwidth_mbps=0이면 무제한(응답별 상한)."""
+    srv = ThreadingHTTPServer((host, port), MockHandler)
+    srv.daemon_threads = True
+    srv.data, srv.routes = data, ROUTES
+    srv.latency_ms, srv.jitter_ms, srv.error_rate, srv.bandwidth_mbps = latency_ms, jitter_ms, error_rate, bandwidth_mbps
+    srv.max_limit, srv.verbose = max_limit, verbose
+    srv.rng, srv.lock, srv.requests, srv.errors = random.Random(seed), threading.Lock(), 0, 0
+    return srv
+
+def serve_in_thread(data: MockData, port: int = 0, **kw) -> Tuple[ThreadingHTTPServer, str]:
+    """백그라운드 스레드에서 서비스 → (server, base_url). port=0이면 빈 포트. 끝나면 server.shutdown()."""
+    srv = make_server(data, port=port, **kw)
+    threading.Thread(target=srv.serve_forever, name="fmw-mock-api", daemon=True).start()
+    host, port = srv.server_address[:2]
+    return srv, f"http://{host}:{port}"
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="FMW API 로컬 목 서버(합성 데이터 + 지연/오류/대역폭 주입)")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8000)
+    ap.add_argument("--rows", type=int, default=100_000, help="0일차 행 수")
+    ap.add_argument("--days", type=int, default=30, help="변경 시뮬레이션 일수(히스토리/요약 범위)")
+    ap.add_argument("--create", type=float, default=0.01, help="일별 생성 비율")
+    ap.add_argument("--update", type=float, default=0.02, help="일별 값 변경 비율")
+    ap.add_argument("--delete", type=float, default=0.005, help="일별 삭제 비율")
+    ap.add_argument("--seed", type=int, default=20251024)
+    ap.add_argument("--models", type=int, default=2000)
+    ap.add_argument("--operators", type=int, default=300)
+    ap.add_argument("--countries", type=int, default=150)
+    ap.add_argument("--latency-ms", type=float, default=0.0, help="응답 헤더 전 고정 지연")
+    ap.add_argument("--jitter-ms", type=float, default=0.0, help="추가 지연 0~jitter(균등)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율(0~1)")
+    ap.add_argument("--bandwidth-mbps", type=float, default=0.0, help="응답별 본문 전송 상한(Mbit/s, 0=무제한)")
+    ap.add_argument("--max-limit", type=int, default=MAX_LIMIT, help="DRF 페이지 limit 상한")
+    ap.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+    args = ap.parse_args(argv)
+
+    t0 = time.perf_counter()
+    data = build_dataset(args.rows, args.days, args.seed, args.create, args.update, args.delete,
+                         n_models=args.models, n_operators=args.operators, n_countries=args.countries)
+    data.all_csv()
+    print(f"데이터 준비: {len(data.all):,}행, 변경 이력 {len(data.audit):,}건, 피처 {len(data.by_feature)}개 "
+          f"({time.perf_counter() - t0:.1f}s)", file=sys.stderr)
+    srv = make_server(data, args.host, args.port, args.latency_ms, args.jitter_ms, args.error_rate,
+                      args.bandwidth_mbps, args.max_limit, args.seed, args.verbose)
+    print(f"FMW mock API: http://{args.host}:{srv.server_address[1]} (Ctrl+C 종료)", file=sys.stderr)
+    try:
+        srv.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.server_close()
+        print(f"요청 {srv.requests}건, 주입 오류 {srv.errors}건", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
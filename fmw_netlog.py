@@ -0,0 +1,139 @@
+# fmw_netlog.py
+# HTTP 요청 계측 (단일 파일, 앱 공용) — 요청 1건을 connect / ttfb / download / parse 단계로 분해
+# - streamlit_app / fmw_streamlit_cloud_demo / fmw_streamlit_sample_v3_plus / fmw_dm_single_ux3가 import해서 쓴다.
+#   앱은 각자 로그 경로·창 크기로 NetLog를 만들고 st.cache_resource(get_net_log)로 프로세스에 1개만 둔다.
+#
+# connect : 새 TCP(+TLS) 연결 수립. keep-alive로 재사용하면 0
+# ttfb    : 요청 전송 ~ 응답 헤더 수신. 서버 처리 + 프록시 + 왕복 지연이 모두 들어 있어 서버 시간만은 아님
+# download: 본문 수신 대기(iter_content 안에서 기다린 시간) — 회선/프록시 버퍼링
+# parse   : with 블록의 나머지(pandas 파싱, parquet 기록 등)
+# 최근 window건은 메모리(개발자 모드 P50/P95 표), 전부 path(JSONL)에 한 줄씩 추가.
+#
+# 사용 예시
+#   net = NetLog(".cache/net_timing.jsonl", window=500)
+#   with net.call("GET", url, timeout=60) as r:          # 계측기 내장 세션
+#       df = pd.read_csv(io.BytesIO(r.content))
+#   s = requests.Session(); s.mount("https://", net.adapter(pool_maxsize=8))
+#   with net.call("GET", url, session=s) as r: ...      # 앱이 만든 세션(헤더/풀 크기 지정)
+
+import os, json, time, threading
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from urllib.parse import urlsplit
+
+import pandas as pd
+import requests
+
+KST = timezone(timedelta(hours=9))
+NET_PHASES = ("connect", "ttfb", "download", "parse", "total")
+
+def _timed_pool(pool_cls, local):
+    # 풀이 만드는 연결 클래스만 바꿔 connect() 소요를 스레드별로 누적
+    class Conn(pool_cls.ConnectionCls):
+        def connect(self):
+            t0 = time.perf_counter()
+            try: super().connect()
+            finally: local.connect_s = getattr(local, "connect_s", 0.0) + time.perf_counter() - t0
+    return type(pool_cls.__name__, (pool_cls,), {"ConnectionCls": Conn})
+
+class _TimedAdapter(requests.adapters.HTTPAdapter):
+    """새 연결의 connect() 소요를 local.connect_s에 누적하는 HTTPAdapter."""
+    def __init__(self, local, **kw):
+        self._net_local = local  # 부모 __init__이 init_poolmanager를 부르므로 먼저
+        super().__init__(**kw)
+
+    def init_poolmanager(self, *args, **kw):
+        super().init_poolmanager(*args, **kw)
+        pm = self.poolmanager
+        pm.pool_classes_by_scheme = {k: _timed_pool(v, self._net_local) for k, v in pm.pool_classes_by_scheme.items()}
+
+def _timed_iter(iter_content, acc: list):
+    # .content/.json()/스트리밍 모두 iter_content를 거치므로 여기서 본문 수신 대기만 잰다
+    def wrapped(*args, **kw):
+        it = iter_content(*args, **kw)
+        while True:
+            t0 = time.perf_counter(); b = next(it, None); acc[0] += time.perf_counter() - t0
+            if b is None: return
+            yield b
+    return wrapped
+
+class NetLog:
+    """프로세스 공용 HTTP 계측기. call()이 요청 1건을 단계별로 재서 기록한다(병렬 워커에서 불러도 됨)."""
+    def __init__(self, path, window: int = 500):
+        self.path, self.recent = str(path), deque(maxlen=window)
+        self._lock, self._local = threading.Lock(), threading.local()
+        self._session: Optional[requests.Session] = None
+
+    def adapter(self, **kw) -> requests.adapters.HTTPAdapter:
+        """이 계측기에 connect 시간을 보고하는 어댑터(kw는 HTTPAdapter 인자). 계측할 세션에 mount."""
+        return _TimedAdapter(self._local, **kw)
+
+    @property
+    def session(self) -> requests.Session:
+        """call(session=None)이 쓰는 내장 keep-alive 세션(첫 사용 때 생성)."""
+        with self._lock:
+            if self._session is None:
+                s = requests.Session()
+                for scheme in ("http://", "https://"):
+                    s.mount(scheme, self.adapter())
+                self._session = s
+            return self._session
+
+    @contextmanager
+    def call(self, method: str, url: str, label: Optional[str] = None,
+             session: Optional[requests.Session] = None, **kw):
+        """계측 요청(stream=True) → with 블록에 응답. 본문 수신·파싱을 블록 안에서 끝내야 단계가 맞게 나뉜다.
+
+        session을 주면 그 세션으로 요청한다(adapter()를 mount해 둬야 connect가 잡힘).
+        블록을 나오면(예외 포함) 1건 기록하고 응답을 닫는다. label 기본값은 URL 경로.
+        """
+        rec = {"label": label or urlsplit(url).path, "method": method, "url": url.split("?")[0], "status": None,
+               "bytes": 0, "error": None, **{f"{p}_ms": 0.0 for p in NET_PHASES}}
+        session = session or self.session
+        self._local.connect_s, download, r = 0.0, [0.0], None
+        t0 = time.perf_counter()
+        try:
+            r = session.request(method, url, stream=True, **kw)
+            rec["status"], rec["ttfb_ms"] = r.status_code, (time.perf_counter() - t0 - self._local.connect_s) * 1000
+            r.iter_content = _timed_iter(r.iter_content, download)
+            yield r
+        except Exception as e:
+            rec["error"] = f"{type(e).__name__}: {e}"[:200]
+            raise
+        finally:
+            rec["total_ms"] = (time.perf_counter() - t0) * 1000
+            rec["connect_ms"], rec["download_ms"] = self._local.connect_s * 1000, download[0] * 1000
+            if r is None:  # 연결/헤더 단계에서 실패
+                rec["ttfb_ms"] = rec["total_ms"] - rec["connect_ms"]
+            else:
+                rec["bytes"] = r.raw.tell()  # 소켓에서 읽은 바이트(gzip이면 압축 기준)
+                r.close()
+            rec["parse_ms"] = max(rec["total_ms"] - rec["connect_ms"] - rec["ttfb_ms"] - rec["download_ms"], 0.0)
+            self._add(rec)
+
+    def _add(self, rec: dict) -> None:
+        rec = {"ts": datetime.now(KST).isoformat(timespec="seconds"),
+               **{k: round(v, 1) if isinstance(v, float) else v for k, v in rec.items()}}
+        with self._lock:
+            self.recent.append(rec)
+            try:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as fh:
+                    fh.write(json.dumps(rec, ensure_ascii=False) + "\n")
+            except OSError:
+                pass  # 로그 기록 실패가 요청을 깨뜨리지 않게
+
+    def stats(self) -> pd.DataFrame:
+        """최근 요청의 label별 호출/오류 수, 연결 재사용 비율, 단계별 P50/P95(ms), 응답 크기 중앙값(KB)."""
+        with self._lock:
+            df = pd.DataFrame(list(self.recent))
+        if df.empty:
+            return df
+        g = df.groupby("label", sort=True)
+        out = pd.DataFrame({"calls": g.size(), "errors": g["error"].count(), "reused": g["connect_ms"].apply(lambda s: (s == 0).mean())})
+        for p in NET_PHASES:
+            out[f"{p}_p50"], out[f"{p}_p95"] = g[f"{p}_ms"].median(), g[f"{p}_ms"].quantile(0.95)
+        out["kb_p50"] = g["bytes"].median() / 1024
+        return out.round(2).reset_index()
@@ -1,21 +1,25 @@
 # fmw_streamlit_cloud_demo.py
 # Streamlit Cloud UX Check — Single-file demo (v1.0, 2025-10-24)
-# 요구 패키지: streamlit, pandas, requests, python-dateutil
+# 요구 패키지: streamlit, pandas, requests, python-dateutil (선택: pyarrow — DRF 스트리밍 수신)
 # 실행: streamlit run fmw_streamlit_cloud_demo.py
 
-import io, os, time, json, random, requests, pandas as pd
+import io, os, time, json, random, requests, numpy as np, pandas as pd
 import streamlit as st
 from datetime import datetime, timedelta, timezone
 from dateutil.parser import isoparse
+from fmw_netlog import NetLog
+try:
+    import pyarrow as pa, pyarrow.parquet as pq
+except ImportError:  # 선택 의존성 — 없으면 DRF 응답을 한 번에 받아 파싱
+    pa = pq = None
 
 KST = timezone(timedelta(hours=9))
 
 # =========================================
-# 0) DEMO 데이터 생성기 (내장 샘플, 500 rows)
+# 0) DEMO 데이터 생성기 (내장 샘플 500 rows ~ 부하 테스트용 수천만 rows)
 # =========================================
 RNG = random.Random(20251024)
 
-MODELS = [f"S{20+i}" for i in range(10)]  # 10 models
 SOLUTIONS = ["slsi", "mtk"]
 GROUPS = {
     "Connectivity": ["VoLTE", "VoWiFi", "5G_SA", "5G_NSA"],
@@ -28,75 +32,197 @@ OPERATORS = ["KT","SKT","LGU+","KDDI","DOCOMO","SOFTBANK","VERIZON","ATT","TMOBI
 REGIONS = ["APAC","NA","EU","LATAM","MEA"]
 SP_FCI = ["postpaid","prepaid","mvno","corp","vip"]
 
-def _pick_or_none(options, p_none=0.25):
-    if RNG.random() < p_none:
-        return None
-    return RNG.choice(options)
-
-def _random_value(feature):
+def _random_value(feature, rng=RNG):
     # value는 feature 성격에 맞춰 bool/num/str 혼용
-    r = RNG.random()
+    r = rng.random()
     if "5G" in feature or feature in ("Hotspot","DataCap","Throttle"):
-        if r < 0.5: return bool(RNG.getrandbits(1))
-        elif r < 0.8: return RNG.randint(1, 100)  # 예: 제한 숫자
-        else: return f"level-{RNG.randint(1,5)}"
+        if r < 0.5: return bool(rng.getrandbits(1))
+        elif r < 0.8: return rng.randint(1, 100)  # 예: 제한 숫자
+        else: return f"level-{rng.randint(1,5)}"
+    else:
+        return bool(rng.getrandbits(1))
+
+# ---- 벡터화 생성기: 컬럼마다 numpy로 코드를 한 번에 뽑아 Categorical로 조립 ----
+# 키 중복은 코드 해시로 걸러내고 모자란 만큼 다음 블록에서 채운다(행 단위 루프/seen set 없음).
+# value는 CSV로 받는 실서버 데이터처럼 문자열("True"/"42"/"level-3").
+NULL_RATES = {"mcc": 0.6, "mnc": 0.6, "region": 0.5, "country": 0.4, "operator": 0.5, "sp_fci": 0.5}  # 차원별 결측 비율
+GEN_BLOCK_ROWS = 1_000_000
+VALUE_VOCAB = ["False", "True"] + [str(i) for i in range(1, 101)] + [f"level-{i}" for i in range(1, 6)]
+
+def _extend(base, n, fmt):
+    # 기본 목록을 앞에서 자르거나 fmt 이름으로 늘려 n개로
+    return (list(base) + [fmt.format(i) for i in range(len(base), n)])[:n]
+
+def _fmw_vocabs(n_models, n_operators, n_countries) -> dict:
+    return {
+        "model_name": [f"S{20+i}" for i in range(n_models)],  # 기본 10개(S20~S29)
+        "solution": SOLUTIONS,
+        "feature_group": list(GROUPS),
+        "feature": [f for fs in GROUPS.values() for f in fs],
+        "mcc": [str(i) for i in range(200, 1000)],
+        "mnc": [f"{i:02d}" for i in range(100)],
+        "region": REGIONS,
+        "country": _extend(COUNTRIES, n_countries, "C{:03d}"),
+        "operator": _extend(OPERATORS, n_operators, "OP{:04d}"),
+        "sp_fci": SP_FCI,
+        "mode": ["allow", "block", "none"],
+        "value": VALUE_VOCAB,
+    }
+
+def _draw_codes(rng, m: int, voc: dict, null_rates: dict) -> dict:
+    codes = {c: rng.integers(0, len(voc[c]), m) for c in voc if c not in ("feature", "value")}
+    # 그룹을 먼저 고르고 그룹 안에서 피처 선택(기존 데모와 같은 분포)
+    sizes = np.array([len(fs) for fs in GROUPS.values()])
+    g = codes["feature_group"]
+    codes["feature"] = np.concatenate([[0], np.cumsum(sizes)[:-1]])[g] + (rng.random(m) * sizes[g]).astype(np.int64)
+    numeric = np.flatnonzero(["5G" in f or f in ("Hotspot", "DataCap", "Throttle") for f in voc["feature"]])
+    r = rng.random(m)
+    is_num = np.isin(codes["feature"], numeric)
+    v = rng.integers(0, 2, m)                                                        # bool
+    v = np.where(is_num & (r >= 0.5) & (r < 0.8), 2 + rng.integers(0, 100, m), v)    # 1~100
+    codes["value"] = np.where(is_num & (r >= 0.8), 102 + rng.integers(0, 5, m), v)   # level-1~5
+    for c, p in null_rates.items():
+        codes[c] = np.where(rng.random(m) < p, -1, codes[c])  # Categorical 코드 -1 = 결측
+    return codes
+
+def iter_fmw_blocks(n: int, seed: int = 20251024, n_models: int = 10, n_operators: int = 10, n_countries: int = 10,
+                    null_rates: dict | None = None, sync_time: str | None = None, block_rows: int = GEN_BLOCK_ROWS):
+    """FeatureRecord 형태 합성 데이터를 최대 block_rows행씩 yield(전체에서 KEY_COLS 중복 없음).
+
+    같은 인자(seed 포함)면 항상 같은 행. 차원 컬럼은 category, 결측은 NaN. 중복 검사를 위해
+    지금까지 만든 키 해시(행당 8바이트)만 메모리에 둔다.
+    """
+    voc = _fmw_vocabs(n_models, n_operators, n_countries)
+    rates = {**NULL_RATES, **(null_rates or {})}
+    ts = sync_time or datetime.now(KST).isoformat(timespec="seconds")
+    if n <= 0:
+        # 0행: 컬럼·카테고리만 있는 빈 블록 1개(make_fmw_df/write_fmw_dataset가 스키마·헤더를 남기도록)
+        yield _fmw_block({c: np.empty(0, dtype=np.int64) for c in voc}, np.empty(0, dtype=np.int64), voc, ts)
+        return
+    seen = np.empty(0, dtype=np.uint64)  # 정렬 유지
+    done, b = 0, 0
+    while done < n:
+        want = min(block_rows, n - done)
+        rng = np.random.default_rng([seed, b]); b += 1
+        codes = _draw_codes(rng, want + want // 8 + 16, voc, rates)  # 중복 탈락분 여유
+        h = pd.util.hash_pandas_object(pd.DataFrame({c: codes[c] for c in KEY_COLS}), index=False).to_numpy()
+        keep = np.zeros(len(h), dtype=bool)
+        keep[np.unique(h, return_index=True)[1]] = True
+        if len(seen):
+            keep &= seen[np.minimum(np.searchsorted(seen, h), len(seen) - 1)] != h
+        idx = np.flatnonzero(keep)[:want]
+        if not len(idx):
+            raise ValueError(f"키 조합이 부족합니다({done}/{n}행) — n_models/n_operators/n_countries를 늘리세요")
+        seen = np.sort(np.concatenate([seen, np.sort(h[idx])]), kind="stable")  # 정렬된 두 구간 병합
+        done += len(idx)
+        yield _fmw_block(codes, idx, voc, ts)
+
+def _fmw_block(codes: dict, idx: np.ndarray, voc: dict, ts: str) -> pd.DataFrame:
+    out = pd.DataFrame({c: pd.Categorical.from_codes(codes[c][idx], categories=voc[c]) for c in voc})
+    out.insert(len(out.columns), "sync_time", pd.Categorical.from_codes(np.zeros(len(idx), dtype=np.int8), categories=[ts]))
+    return out[KEY_COLS + ["value", "sync_time"]]
+
+def make_fmw_df(n: int, **kw) -> pd.DataFrame:
+    """iter_fmw_blocks를 하나의 DataFrame으로(인자 동일)."""
+    return pd.concat(list(iter_fmw_blocks(n, **kw)), ignore_index=True)
+
+def write_fmw_dataset(path: str, n: int, **kw) -> int:
+    """합성 데이터를 path(.parquet | .csv)에 블록 단위로 기록 → 행 수. 전체 표를 메모리에 올리지 않는다."""
+    tmp, rows = path + ".tmp", 0
+    if path.endswith(".parquet"):
+        if pq is None:
+            raise RuntimeError("parquet 출력에는 pyarrow가 필요합니다")
+        writer = None
+        try:
+            for block in iter_fmw_blocks(n, **kw):
+                t = pa.Table.from_pandas(block, preserve_index=False)
+                writer = writer or pq.ParquetWriter(tmp, t.schema, compression="zstd")
+                writer.write_table(t); rows += len(block)
+        finally:
+            if writer is not None: writer.close()
     else:
-        return bool(RNG.getrandbits(1))
+        with open(tmp, "w", encoding="utf-8-sig", newline="") as fh:
+            for block in iter_fmw_blocks(n, **kw):
+                block.to_csv(fh, index=False, header=rows == 0); rows += len(block)
+    os.replace(tmp, path)
+    return rows
+
+_VALUE_OBJ = {"False": False, "True": True, **{str(i): i for i in range(1, 101)}}  # 나머지(level-N)는 문자열 그대로
 
 def make_demo_df(seed_offset=0, size=500):
-    rng = random.Random(20251024 + seed_offset)
-    rows = []
-    seen = set()
-    while len(rows) < size:
-        model = rng.choice(MODELS)
-        sol = rng.choice(SOLUTIONS)
-        group = rng.choice(list(GROUPS.keys()))
-        feat = rng.choice(GROUPS[group])
-        mcc = _pick_or_none([str(rng.randint(200, 999))], p_none=0.6)  # 자주 없음
-        mnc = _pick_or_none([str(rng.randint(0, 99)).zfill(2)], p_none=0.6)
-        region = _pick_or_none(REGIONS, p_none=0.5)
-        country = _pick_or_none(COUNTRIES, p_none=0.4)
-        operator = _pick_or_none(OPERATORS, p_none=0.5)
-        sp_fci = _pick_or_none(SP_FCI, p_none=0.5)
-        mode = rng.choice(["allow","block","none"])
-        value = _random_value(feat)
-        sync_time = datetime.now(KST).isoformat(timespec="seconds")
-
-        key = (model, sol, group, feat, mcc, mnc, region, country, operator, sp_fci, mode)
-        if key in seen: 
-            continue
-        seen.add(key)
-        rows.append({
-            "model_name": model,
-            "solution": sol,
-            "feature_group": group,
-            "feature": feat,
-            "mcc": mcc,
-            "mnc": mnc,
-            "region": region,
-            "country": country,
-            "operator": operator,
-            "sp_fci": sp_fci,
-            "mode": mode,
-            "value": value,
-            "sync_time": sync_time,
-        })
-    return pd.DataFrame(rows)
-
-def tweak_df_for_yesterday(df_today):
-    """오늘 df를 기반으로 '어제' 데이터 시뮬레이션 (생성/업데이트/삭제 약간씩)"""
+    # 데모 표시용: object 컬럼, 결측 None, value는 bool/int/str 혼용(기존 데모 형식)
+    df = make_fmw_df(size, seed=20251024 + seed_offset).astype(object)
+    df = df.where(df.notna(), None)
+    df["value"] = [_VALUE_OBJ.get(v, v) for v in df["value"]]
+    return df
+
+# ---- N일 변경 시뮬레이터: 하루씩 생성/변경/삭제를 가한 스냅샷 시퀀스(리플레이·장기 운영 측정용) ----
+# 핫키: 키 해시 하위 자리로 고정한 hot_frac 비율의 키. 변경의 hot_share가 여기에 몰려 같은 키가 며칠씩 반복 변경된다.
+HOT_BUCKETS = 1_000_000
+
+def _row_hash(df: pd.DataFrame) -> np.ndarray:
+    # category 해시는 값 기준이라 카테고리 구성이 달라도 같은 키면 같은 해시
+    return pd.util.hash_pandas_object(df[KEY_COLS], index=False).to_numpy()
+
+def _pick(rng, idx: np.ndarray, k: int) -> np.ndarray:
+    return rng.choice(idx, min(k, len(idx)), replace=False) if k > 0 and len(idx) else idx[:0]
+
+def iter_churn_days(base: pd.DataFrame, days: int, start=None, create: float = 0.01, update: float = 0.02,
+                    delete: float = 0.005, hot_frac: float = 0.05, hot_share: float = 0.8, seed: int = 20251024, **gen_kw):
+    """base(make_fmw_df 결과, 0일차)에 하루씩 변경을 가한 스냅샷을 yield: (날짜, 스냅샷, {"created","updated","deleted"}).
+
+    비율은 전날 행 수 기준. 변경된/새 행의 sync_time은 그날 06:00 KST. 새 행은 iter_fmw_blocks로 뽑고
+    기존 키와 겹치면 버린다(gen_kw는 base를 만들 때와 같은 생성기 인자). start 미지정 시 마지막 날 = 오늘.
+    """
+    start = start or datetime.now(KST).date() - timedelta(days=days)
+    df = base.reset_index(drop=True)
+    h = _row_hash(df)
+    for i in range(1, days + 1):
+        d = start + timedelta(days=i)
+        ts = f"{d.isoformat()}T06:00:00+09:00"
+        rng = np.random.default_rng([seed, d.toordinal()])
+        n = len(df)
+        # 삭제(균등)
+        keep = np.ones(n, dtype=bool)
+        keep[_pick(rng, np.arange(n), int(n * delete))] = False
+        df, h = df[keep].reset_index(drop=True), h[keep]
+        # 변경: hot_share만큼 핫키에서, 나머지는 일반 키에서
+        k = int(n * update)
+        hot = h % HOT_BUCKETS < hot_frac * HOT_BUCKETS
+        upd = np.concatenate([_pick(rng, np.flatnonzero(hot), round(k * hot_share)),
+                              _pick(rng, np.flatnonzero(~hot), k - round(k * hot_share))])
+        v = df["value"].cat.codes.to_numpy().copy()
+        old = v[upd]
+        # bool은 뒤집고, 숫자/level(코드 2~106)은 다른 코드로 — 항상 실제 값 변경
+        v[upd] = np.where(old <= 1, 1 - old, 2 + (old - 2 + 1 + rng.integers(0, 104, len(upd))) % 105)
+        cats = df["sync_time"].cat.categories.append(pd.Index([ts]))
+        t = df["sync_time"].cat.codes.to_numpy().copy()
+        t[upd] = len(cats) - 1
+        df = df.assign(value=pd.Categorical.from_codes(v, categories=df["value"].cat.categories),
+                       sync_time=pd.Categorical.from_codes(t, categories=cats))
+        # 생성: 기존 키와 겹치지 않는 새 키
+        k = int(n * create)
+        add = make_fmw_df(k + k // 8 + 16, seed=seed + d.toordinal(), sync_time=ts, **gen_kw) if k else df.iloc[:0]
+        ha = _row_hash(add)
+        fresh = np.flatnonzero(~np.isin(ha, h))[:k]
+        add = add.iloc[fresh].assign(sync_time=lambda x: x["sync_time"].cat.set_categories(cats))
+        df, h = pd.concat([df, add], ignore_index=True), np.concatenate([h, ha[fresh]])
+        yield d, df, {"created": len(fresh), "updated": len(upd), "deleted": int(n - keep.sum())}
+
+def tweak_df_for_yesterday(df_today, rng=RNG):
+    """오늘 df를 기반으로 '어제' 데이터 시뮬레이션 (생성/업데이트/삭제 약간씩). rng를 주면 같은 rng 상태에서 같은 결과."""
     df_prev = df_today.copy()
     n = len(df_prev)
     # 삭제: 5%
-    del_idx = RNG.sample(range(n), k=max(1, n//20))
+    del_idx = rng.sample(range(n), k=max(1, n//20))
     df_prev = df_prev.drop(index=del_idx).reset_index(drop=True)
     # 생성: 5% 추가
     add = make_demo_df(seed_offset=1, size=max(1, n//20)).sample(n=max(1, n//20), random_state=42)
     df_prev = pd.concat([df_prev, add], ignore_index=True)
     # 업데이트: 5% value 변경
-    upd_idx = RNG.sample(range(len(df_prev)), k=max(1, len(df_prev)//20))
+    upd_idx = rng.sample(range(len(df_prev)), k=max(1, len(df_prev)//20))
     for i in upd_idx:
-        df_prev.at[i, "value"] = _random_value(df_prev.at[i, "feature"])
+        df_prev.at[i, "value"] = _random_value(df_prev.at[i, "feature"], rng)
     # sync_time 과거로
     ts = (datetime.now(KST) - timedelta(days=1)).isoformat(timespec="seconds")
     df_prev["sync_time"] = ts
@@ -105,12 +231,72 @@ def tweak_df_for_yesterday(df_today):
 # =========================================
 # 1) DRF 로더 (선택) — BASE_URL 설정 시 사용
 # =========================================
-def load_from_drf(base_url: str, params=None):
+DRF_SNAPSHOT = os.path.join(".cache", "drf_all.parquet")  # 스트리밍 수신 결과(컬럼형 스냅샷)
+CSV_CHUNK_ROWS = 50_000
+
+# ---- 요청 계측: 총 지연을 connect / ttfb / download(전송) / parse(pandas)로 분해(fmw_netlog) ----
+# 최근 NET_WINDOW건은 메모리, 전부 NET_LOG(JSONL).
+NET_LOG = os.path.join(".cache", "net_timing.jsonl")
+NET_WINDOW = 200
+
+@st.cache_resource
+def get_net_log() -> NetLog:
+    return NetLog(NET_LOG, NET_WINDOW)
+
+class _IterStream(io.RawIOBase):
+    """iter_content 제너레이터를 읽기 전용 파일 객체로 감싼다(pd.read_csv 입력용)."""
+    def __init__(self, it):
+        self._it, self._buf = it, b""
+    def readable(self):
+        return True
+    def readinto(self, b):
+        while not self._buf:
+            try: self._buf = next(self._it)
+            except StopIteration: return 0
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]; self._buf = self._buf[n:]
+        return n
+
+def stream_csv_to_parquet(r, out_path: str, progress=None, chunk_rows: int = CSV_CHUNK_ROWS) -> int:
+    """stream=True 응답의 CSV를 청크로 파싱해 parquet에 이어 쓴다(메모리는 청크 1개 분량). 행 수 반환."""
+    total = int(r.headers.get("Content-Length") or 0)
+    src = io.BufferedReader(_IterStream(r.iter_content(chunk_size=1 << 16)), 1 << 16)
+    writer, rows = None, 0
+    try:
+        # 청크마다 타입 추론이 달라지지 않도록 전부 문자열로 파싱
+        for chunk in pd.read_csv(src, dtype=str, chunksize=chunk_rows):
+            if writer is None:
+                schema = pa.schema([(c, pa.string()) for c in chunk.columns])
+                writer = pq.ParquetWriter(out_path, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+            if progress: progress(r.raw.tell(), total)
+    finally:
+        if writer is not None: writer.close()
+    if writer is None:  # 빈 본문
+        pd.DataFrame().to_parquet(out_path, index=False)
+    return rows
+
+def load_from_drf(base_url: str, params=None, stream=False, progress=None):
+    """DRF 전체 CSV 로드 → (df, 지연시간 ms). 단계별 분해는 get_net_log()에 기록된다.
+
+    stream=True(pyarrow 필요)이면 받는 동안 청크 파싱해서 DRF_SNAPSHOT에 기록한 뒤 읽는다.
+    응답 본문 전체와 DataFrame을 동시에 메모리에 두지 않는다. 이 경우 모든 컬럼은 문자열.
+    """
     t0 = time.time()
     url = f"{base_url.rstrip('/')}/api/v1/all"
-    r = requests.get(url, params=params or {}, headers={"Accept":"text/csv"}, timeout=60)
-    r.raise_for_status()
-    df = pd.read_csv(io.BytesIO(r.content))
+    streamed = stream and pq is not None
+    with get_net_log().call("GET", url, label="/api/v1/all (stream)" if streamed else None,
+                            params=params or {}, headers={"Accept":"text/csv"}, timeout=60) as r:
+        r.raise_for_status()
+        if streamed:
+            os.makedirs(os.path.dirname(DRF_SNAPSHOT), exist_ok=True)
+            tmp = DRF_SNAPSHOT + ".tmp"
+            stream_csv_to_parquet(r, tmp, progress=progress)
+            os.replace(tmp, DRF_SNAPSHOT)
+            df = pd.read_parquet(DRF_SNAPSHOT)
+        else:
+            df = pd.read_csv(io.BytesIO(r.content))
     latency_ms = int((time.time() - t0)*1000)
     return df, latency_ms
 
@@ -119,7 +305,8 @@ def load_from_drf(base_url: str, params=None):
 # =========================================
 KEY_COLS = ["model_name","solution","feature_group","feature","mcc","mnc","region","country","operator","sp_fci","mode"]
 def _build_key(df: pd.DataFrame):
-    return df[KEY_COLS].astype(str).agg("|".join, axis=1)
+    # 결측은 ""로(pandas 3은 astype(str)이 NaN/None을 그대로 둬서 join이 실패)
+    return df[KEY_COLS].astype(object).fillna("").astype(str).agg("|".join, axis=1)
 
 def diff_prev_curr(prev_df, curr_df):
     import pandas as pd
@@ -160,6 +347,88 @@ def filter_df(df, model, group):
         out = out[out["feature_group"] == group]
     return out
 
+# 검색 인덱스 — 셀 값 사전(소문자) + 값 → 행 postings
+# 질의는 사전에서 값을 고르고(접두어: 이분 탐색, 부분 문자열: trigram 후보 검증, 2글자 이하는 사전 스캔)
+# 해당 값들의 행 목록을 합친다. 키 입력마다 전체 행×컬럼 문자열 스캔을 하지 않음.
+# streamlit_app.py의 같은 이름 함수들과 동일한 구현(단일 파일 앱이라 복사본) — 고칠 때는 양쪽을 함께 고칠 것.
+def build_search_index(df: pd.DataFrame, columns=None) -> dict:
+    cols = [c for c in (columns or df.columns) if c in df.columns]
+    parts = []  # 컬럼별 (코드, 소문자 고유값)
+    for c in cols:
+        col = df[c]
+        if col.dtype == object:  # 혼합 타입은 문자열 기준으로(True와 1이 같은 값으로 묶이지 않게)
+            col = col.where(col.isna(), col.astype(str))
+        codes, uniq = pd.factorize(col)  # 결측은 -1
+        parts.append((codes, pd.Index(np.asarray(uniq, dtype=object)).astype(str).str.lower()))
+    vocab = np.unique(np.concatenate([u.to_numpy(dtype=object) for _, u in parts] + [np.array([], dtype=object)]))
+    terms, rows = [], []
+    for codes, uniq in parts:
+        hit = codes >= 0
+        terms.append(np.searchsorted(vocab, uniq.to_numpy(dtype=object))[codes[hit]])
+        rows.append(np.flatnonzero(hit))
+    terms = np.concatenate(terms + [np.array([], dtype=np.int64)])
+    order = np.argsort(terms, kind="stable")
+    offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(terms, minlength=len(vocab)), out=offsets[1:])
+    grams = {}
+    for i, v in enumerate(vocab):
+        for g in {v[j:j + 3] for j in range(len(v) - 2)}:
+            grams.setdefault(g, []).append(i)
+    return {"n": len(df), "vocab": vocab, "vocab_s": pd.Series(vocab, dtype=str),
+            "grams": {g: np.asarray(ids, dtype=np.int32) for g, ids in grams.items()},
+            "offsets": offsets, "rows": np.concatenate(rows + [np.array([], dtype=np.int64)])[order].astype(np.int32)}
+
+def _match_terms(idx: dict, ql: str, prefix: bool) -> np.ndarray:
+    vocab = idx["vocab"]
+    if prefix:
+        lo, hi = np.searchsorted(vocab, [ql, ql + "\U0010ffff"])
+        return np.arange(lo, hi)
+    if len(ql) < 3:
+        return np.flatnonzero(idx["vocab_s"].str.contains(ql, regex=False).to_numpy())
+    cand = None
+    for g in {ql[j:j + 3] for j in range(len(ql) - 2)}:
+        ids = idx["grams"].get(g)
+        if ids is None:
+            return np.empty(0, dtype=np.int64)
+        cand = ids if cand is None else np.intersect1d(cand, ids, assume_unique=True)
+    return np.asarray([i for i in cand if ql in vocab[i]], dtype=np.int64)  # trigram 후보만 검증
+
+def search_rows(idx: dict, q: str, prefix: bool = False) -> np.ndarray:
+    """q(대소문자 무시)를 포함(prefix=True면 q로 시작)하는 셀이 하나라도 있는 행 위치(오름차순)."""
+    terms = _match_terms(idx, q.lower(), prefix)
+    mask = np.zeros(idx["n"], dtype=bool)
+    if len(terms):
+        # 값별 postings 구간 [off[t], off[t+1])을 한 번에 모아서 표시
+        starts, lens = idx["offsets"][terms], np.diff(idx["offsets"])[terms]
+        pos = np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(lens.sum())
+        mask[idx["rows"][pos]] = True
+    return np.flatnonzero(mask)
+
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _cached_search_index(source, columns, _df):
+    # _df는 캐시 키에서 제외(대형 DataFrame 해시 생략) — 키는 원본 기준 source만
+    return build_search_index(_df, list(columns))
+
+def search_index_for(df: pd.DataFrame, columns, source=None) -> dict:
+    """source: df를 만든 원본의 키(데모: demo_dataset 인자 + diff 종류). None이면 캐시 없이 만든다."""
+    if source is None:
+        return build_search_index(df, list(columns))
+    return _cached_search_index(source, tuple(columns), df)
+
+# 데모 데이터 — (seed, size, TTL 구간)별로 한 번만 생성/diff 하고 모든 세션이 공유(읽기 전용으로 사용할 것)
+DEMO_SEED, DEMO_ROWS = 0, 500
+
+def demo_bucket(ttl_min: int, now: float | None = None) -> int:
+    return int((time.time() if now is None else now) // (ttl_min * 60))
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def demo_dataset(seed: int, size: int, bucket: int) -> dict:
+    """오늘/어제 데모 데이터와 전체 diff(created, updated, deleted). 어제 변경분은 TTL 구간마다 새로 뽑는다."""
+    today = make_demo_df(seed_offset=seed, size=size)
+    prev = tweak_df_for_yesterday(today, rng=random.Random(f"{seed}:{bucket}"))
+    return {"today": today, "prev": prev, "diff": diff_prev_curr(prev, today), "generated_at": datetime.now(KST)}
+
 # =========================================
 # 3) UI — Streamlit Cloud UX 체크
 # =========================================
@@ -172,9 +441,11 @@ with st.sidebar:
     st.divider()
 
     st.header("필터")
-    # 미리 만들어서 모델/그룹 목록 추출
-    demo_today = make_demo_df()
-    demo_yesterday = tweak_df_for_yesterday(demo_today)
+    # 모델/그룹 목록도 캐시된 데모 데이터에서 추출(재실행마다 생성/diff 하지 않음).
+    # 주기 입력은 아래에 그려지지만 위젯 값은 재실행 전에 session_state에 반영되어 있음
+    demo_key = (DEMO_SEED, DEMO_ROWS, demo_bucket(st.session_state.get("demo_ttl", 60)))
+    ds = demo_dataset(*demo_key)
+    demo_today, demo_yesterday = ds["today"], ds["prev"]
     model_opts = ["(전체)"] + sorted([m for m in demo_today["model_name"].dropna().unique()])
     group_opts = ["(전체)"] + sorted([g for g in demo_today["feature_group"].dropna().unique()])
     sel_model = st.selectbox("모델", model_opts, index=0)
@@ -186,18 +457,28 @@ with st.sidebar:
     with dev_col1:
         show_latency = st.checkbox("지연시간 표시", value=True)
     with dev_col2:
-        ttl = st.number_input("데모-재생성 주기(분)", min_value=5, max_value=1440, value=60, step=5, help="데모 데이터 재생성 주기")
+        ttl = st.number_input("데모-재생성 주기(분)", min_value=5, max_value=1440, value=60, step=5, help="데모 데이터 재생성 주기",
+                              key="demo_ttl")
+    st.caption(f"데모 데이터 생성: {ds['generated_at']:%H:%M:%S} KST · {ttl}분 주기")
 
 # 데이터 로딩
 latency_ms = None
+diff_all = ds["diff"]  # 데모 데이터 diff(캐시). 실서버 데이터를 받으면 None → 아래에서 직접 계산
 if mode.startswith("DRF"):
     default_base = st.secrets.get("BASE_URL", "")
     base_url = st.text_input("DRF BASE_URL", value=default_base, placeholder="https://your-nginx-host")
+    use_stream = st.checkbox("스트리밍 수신(대용량)", value=pq is not None, disabled=pq is None,
+                             help="받는 동안 청크 단위로 파싱해 parquet 스냅샷에 기록 (pyarrow 필요)")
     if st.button("불러오기(실서버)") and base_url.strip():
         try:
-            df_all, latency_ms = load_from_drf(base_url.strip(), params={})
+            bar = st.progress(0.0, text="다운로드 중…")
+            df_all, latency_ms = load_from_drf(
+                base_url.strip(), params={}, stream=use_stream,
+                progress=lambda done, total: bar.progress(min(done / total, 1.0)) if total else None)
+            bar.empty()
             # 서버에서 받은 데이터에도 기본 열이 있다고 가정
             df_prev = tweak_df_for_yesterday(df_all)  # UX 비교용 (실서버엔 dev summary 사용 권장)
+            diff_all = None
         except Exception as e:
             st.error(f"로드 실패: {e}")
             df_all, df_prev = demo_today, demo_yesterday
@@ -213,7 +494,11 @@ df_view = filter_df(df_all, sel_model, sel_group)
 df_prev_view = filter_df(df_prev, sel_model, sel_group)
 
 # ---- 상단 오버뷰 카드 ----
-created, updated, deleted = diff_prev_curr(df_prev_view, df_view)
+# diff 결과에도 model_name/feature_group이 있으므로 전체 diff를 거른 것 = 거른 데이터끼리 diff
+if diff_all is not None:
+    created, updated, deleted = (filter_df(x, sel_model, sel_group) for x in diff_all)
+else:
+    created, updated, deleted = diff_prev_curr(df_prev_view, df_view)
 col1, col2, col3, col4 = st.columns(4)
 with col1:
     st.metric("현재 레코드 수", len(df_view), delta=len(df_view) - len(df_prev_view))
@@ -225,6 +510,10 @@ with col4:
     st.metric("전일 삭제", len(deleted))
 if latency_ms is not None and show_latency:
     st.caption(f"서버 로드 지연시간: ~{latency_ms} ms")
+if show_latency and not (net := get_net_log().stats()).empty:
+    with st.expander("API 지연 분해 (최근 요청, ms) — ttfb: 응답 헤더까지 · download: 전송 · parse: pandas"):
+        st.dataframe(net, hide_index=True, use_container_width=True)
+        st.caption(f"요청별 기록: {NET_LOG}")
 
 st.divider()
 
@@ -234,11 +523,20 @@ nav = st.radio("메뉴", ["히스토리 관리", "피처 상세", "데이터 탐
 # ① 히스토리 관리 — CRUD
 if nav == "히스토리 관리":
     st.subheader("히스토리 관리 (전일 대비 CRUD)")
-    q = st.text_input("검색(전역 LIKE)")
-    def _search(df):
+    cq1, cq2 = st.columns([4, 1])
+    with cq1:
+        q = st.text_input("검색(전역 LIKE)")
+    with cq2:
+        q_prefix = st.checkbox("접두어 일치", value=False)
+    # 인덱스는 필터 전 전체 diff 기준 → 각 탭은 행 라벨 교집합만. 데모 diff는 demo_dataset 키로 캐시하고,
+    # 실서버 diff는 전일 쪽이 불러올 때마다 새로 뽑혀(tweak_df_for_yesterday) 그 리런에서만 쓰이므로 캐시 없이 만든다
+    full = diff_all if diff_all is not None else (created, updated, deleted)
+    def _search(df, i):
         if df is None or df.empty or not q: return df
-        ql = q.lower()
-        return df[df.astype(str).apply(lambda s: s.str.lower().str.contains(ql, na=False)).any(axis=1)]
+        base = full[i]
+        src = ("demo", *demo_key, i) if diff_all is not None else None
+        hits = base.index[search_rows(search_index_for(base, base.columns, src), q, prefix=q_prefix)]
+        return df[df.index.isin(hits)]
 
     t1, t2, t3 = st.tabs([
         f"신규 생성 ({len(created)})",
@@ -247,11 +545,11 @@ if nav == "히스토리 관리":
     ])
 
     with t1:
-        st.dataframe(_search(created), use_container_width=True, height=360)
+        st.dataframe(_search(created, 0), use_container_width=True, height=360)
     with t2:
-        st.dataframe(_search(updated), use_container_width=True, height=360)
+        st.dataframe(_search(updated, 1), use_container_width=True, height=360)
     with t3:
-        st.dataframe(_search(deleted), use_container_width=True, height=360)
+        st.dataframe(_search(deleted, 2), use_container_width=True, height=360)
 
 # ② 피처 상세
 elif nav == "피처 상세":
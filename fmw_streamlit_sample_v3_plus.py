@@ -12,6 +12,7 @@ Run:
 from __future__ import annotations
 import json
 import io
+import os
 import hashlib
 import random
 from datetime import datetime, date, timedelta
@@ -22,6 +23,7 @@ import streamlit as st
 
 try:
     import requests
+    from fmw_netlog import NetLog  # requests 필요
 except Exception:
     requests = None
 
@@ -194,42 +196,52 @@ def sample_summary_bundle() -> Dict[str, Dict]:
         "30일": aggregate_summary(audit, 30),
     }
 
+# ------------------------------
+# API 요청 계측 (connect / ttfb / download / parse, fmw_netlog)
+# ------------------------------
+NET_LOG = os.path.join(".cache", "net_timing.jsonl")  # 요청 1건 = JSON 1줄
+NET_WINDOW = 300  # 개발 전용 표에 쓰는 최근 요청 수
+
+@st.cache_resource
+def get_net_log() -> NetLog:
+    return NetLog(NET_LOG, NET_WINDOW)
+
 @st.cache_data(ttl=60, show_spinner=False)
 def api_get_all(host: str, params: Dict[str,str]) -> pd.DataFrame:
     if not requests:
         raise RuntimeError("requests 가용하지 않음")
     url = f"{host.rstrip('/')}/api/v1/all"
-    r = requests.get(url, params=params, timeout=10, headers={"Accept":"text/csv"})
-    if r.status_code >= 400:
-        st.session_state["last_api_error"] = {"error":{"code":r.status_code,"message":r.text}}
-        r.raise_for_status()
-    if r.headers.get("Content-Type","").startswith("text/csv"):
-        return pd.read_csv(io.StringIO(r.text))
-    return pd.DataFrame(r.json())
+    with get_net_log().call("GET", url, params=params, timeout=10, headers={"Accept":"text/csv"}) as r:
+        if r.status_code >= 400:
+            st.session_state["last_api_error"] = {"error":{"code":r.status_code,"message":r.text}}
+            r.raise_for_status()
+        if r.headers.get("Content-Type","").startswith("text/csv"):
+            return pd.read_csv(io.StringIO(r.text))
+        return pd.DataFrame(r.json())
 
 @st.cache_data(ttl=60, show_spinner=False)
 def api_get_summary(host: str, days: int) -> Dict:
     if not requests:
         raise RuntimeError("requests 가용하지 않음")
     url = f"{host.rstrip('/')}/api/dev/runs/summary?days={days}"
-    r = requests.get(url, timeout=10, headers={"Accept":"application/json"})
-    if r.status_code >= 400:
-        st.session_state["last_api_error"] = {"error":{"code":r.status_code,"message":r.text}}
-        r.raise_for_status()
-    return r.json()
+    with get_net_log().call("GET", url, timeout=10, headers={"Accept":"application/json"}) as r:
+        if r.status_code >= 400:
+            st.session_state["last_api_error"] = {"error":{"code":r.status_code,"message":r.text}}
+            r.raise_for_status()
+        return r.json()
 
 @st.cache_data(ttl=60, show_spinner=False)
 def api_get_history(host: str, params: Dict[str,str]) -> pd.DataFrame:
     if not requests:
         raise RuntimeError("requests 가용하지 않음")
     url = f"{host.rstrip('/')}/api/v1/history"
-    r = requests.get(url, params=params, timeout=10, headers={"Accept":"text/csv"})
-    if r.status_code >= 400:
-        st.session_state["last_api_error"] = {"error":{"code":r.status_code,"message":r.text}}
-        r.raise_for_status()
-    if r.headers.get("Content-Type","").startswith("text/csv"):
-        return pd.read_csv(io.StringIO(r.text))
-    return pd.DataFrame(r.json())
+    with get_net_log().call("GET", url, params=params, timeout=10, headers={"Accept":"text/csv"}) as r:
+        if r.status_code >= 400:
+            st.session_state["last_api_error"] = {"error":{"code":r.status_code,"message":r.text}}
+            r.raise_for_status()
+        if r.headers.get("Content-Type","").startswith("text/csv"):
+            return pd.read_csv(io.StringIO(r.text))
+        return pd.DataFrame(r.json())
 
 
 def sidebar_filters() -> Dict[str,str]:
@@ -487,3 +499,10 @@ else:
         {"run_id":"sync-20251026-01","status":"ok","finished_at":"2025-10-26 11:15:00 KST"},
         {"run_id":"sync-20251025-02","status":"ok","finished_at":"2025-10-25 02:05:00 KST"}
     ], ensure_ascii=False, indent=2), language="json")
+    st.subheader("API 지연 분해 (최근 요청, ms)")
+    net = get_net_log().stats() if requests else pd.DataFrame()
+    if net.empty:
+        st.info("아직 기록된 API 요청이 없습니다. (캐시 적중 시 요청이 발생하지 않음)")
+    else:
+        st.dataframe(net, hide_index=True, use_container_width=True)
+        st.caption(f"ttfb=응답 헤더까지(서버+프록시+왕복), download=전송, parse=pandas 파싱 · 요청별 기록: {NET_LOG}")
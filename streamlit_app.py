@@ -1,13 +1,197 @@
 
 # streamlit_app.py — fmw (Feature Management Web) — v1.1 (2025-10-24)
-# 요구: pip install streamlit pandas requests python-dateutil
-import os, io, json, requests, pandas as pd
+# 요구: pip install streamlit pandas requests python-dateutil (선택: pyarrow — parquet 사본으로 빠른 로드)
+import os, io, json, math, time, shutil, tempfile, threading, requests, numpy as np, pandas as pd
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import NamedTuple
 from datetime import datetime, timedelta, timezone
 from dateutil.parser import isoparse
+from fmw_netlog import NetLog
+try:
+    import pyarrow as pa, pyarrow.parquet as pq
+except ImportError:  # 선택 의존성 — 없으면 스트리밍/parquet 사본 없이 CSV만 사용
+    pa = pq = None
 
 KST = timezone(timedelta(hours=9))
 
+# ===============================
+# 공유 캐시 — 파싱된 표를 프로세스 전체에서 1벌만 보관
+# ===============================
+# 키는 (경로, mtime, 크기): 파일이 바뀌면 자동으로 새로 읽고, 안 바뀌면 리런/세션마다 재파싱하지 않음.
+# 반환된 DataFrame은 모든 세션이 공유하므로 읽기 전용으로 다룰 것(필터는 copy/슬라이스로).
+# CSV는 항상 문자열로 파싱(dtype=str): mcc/mnc 앞자리 0 보존, 청크/스냅샷마다 추론 타입이 달라져 키가 어긋나는 것 방지.
+# 결측은 빈 칸만 — 기본 NA 목록은 region "NA"(북미)를 결측으로 바꿔 버림.
+CSV_READ = dict(dtype=str, keep_default_na=False, na_values=[""])
+CATEGORY_COLS = ["solution","feature_group","feature","mcc","mnc","region","country","operator","sp_fci","mode"]
+
+def _parquet_path(csv_path: str) -> str:
+    return os.path.splitext(csv_path)[0] + ".parquet"
+
+def _typed(df: pd.DataFrame) -> pd.DataFrame:
+    # 반복이 많은 차원 컬럼은 category로(메모리/비교 비용 감소)
+    for c in CATEGORY_COLS:
+        if c in df.columns and df[c].dtype != "category":
+            df[c] = df[c].astype("category")
+    return df
+
+def _atomic_write(path: str, write) -> None:
+    tmp = path + ".tmp"
+    write(tmp)
+    os.replace(tmp, path)  # 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록
+
+def _write_parquet_copy(csv_path: str, df: pd.DataFrame) -> None:
+    try:
+        _atomic_write(_parquet_path(csv_path), lambda t: df.to_parquet(t, index=False))
+    except Exception:
+        pass  # pyarrow 미설치 등 → CSV만 사용
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _load_frame(path: str, mtime: float, size: int) -> pd.DataFrame:
+    pq_path = _parquet_path(path)
+    if os.path.exists(pq_path) and os.path.getmtime(pq_path) >= mtime:
+        try: return _typed(pd.read_parquet(pq_path))
+        except Exception: pass
+    df = _typed(pd.read_csv(path, **CSV_READ))
+    _write_parquet_copy(path, df)
+    return df
+
+def load_frame(path: str) -> pd.DataFrame:
+    s = os.stat(path)
+    return _load_frame(path, s.st_mtime, s.st_size)
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _load_changes(path: str, mtime: float) -> pd.DataFrame:
+    return pd.read_parquet(path)
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _range_changes(key: tuple, _days: tuple) -> pd.DataFrame:
+    # key: (시작, 끝, ((변경분 경로, mtime), ...)) — 일별 변경분 파일이 바뀌면 다시 병합. _days는 키에서 제외
+    return merge_changes([(d, _load_changes(p, m)) for d, (p, m) in zip(_days, key[2])])
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _replay_snapshot(chain: tuple) -> pd.DataFrame:
+    # chain: ((체크포인트 경로, mtime), (변경분 경로, mtime), ...) — 파일이 바뀌면 키가 바뀌어 다시 복원
+    base_path = chain[0][0]
+    df = load_frame(base_path) if base_path.endswith(".csv") else _typed(pd.read_parquet(base_path))
+    for p, _ in chain[1:]:
+        df = apply_delta(df, pd.read_parquet(p))
+    return _typed(df)
+
+# ===============================
+# 스트리밍 수신 — 다운로드 중에 청크 단위로 파싱해서 parquet에 바로 기록
+# ===============================
+CSV_CHUNK_ROWS = 50_000
+
+class _IterStream(io.RawIOBase):
+    """iter_content 제너레이터를 읽기 전용 파일 객체로 감싼다(pd.read_csv 입력용)."""
+    def __init__(self, it):
+        self._it, self._buf = it, b""
+    def readable(self):
+        return True
+    def readinto(self, b):
+        while not self._buf:
+            try: self._buf = next(self._it)
+            except StopIteration: return 0
+        n = min(len(b), len(self._buf))
+        b[:n] = self._buf[:n]; self._buf = self._buf[n:]
+        return n
+
+def stream_csv_to_parquet(r: requests.Response, out_path: str, columns=None, tee=None, progress=None,
+                          chunk_rows: int = CSV_CHUNK_ROWS) -> int:
+    """stream=True 응답의 CSV 본문을 청크로 파싱해 parquet에 이어 쓴다. 기록한 행 수 반환.
+
+    메모리에는 네트워크 버퍼 + CSV 청크 1개만 올라간다. tee가 있으면 받은 원문을 그대로 복사,
+    progress(받은 바이트, Content-Length)는 청크마다 호출(gzip이면 압축 기준 바이트).
+    """
+    total = int(r.headers.get("Content-Length") or 0)
+    def body():
+        for b in r.iter_content(chunk_size=1 << 16):
+            if tee is not None: tee.write(b)
+            yield b
+    src = io.BufferedReader(_IterStream(body()), 1 << 16)
+    usecols = (lambda c: c in columns) if columns else None
+    writer, rows = None, 0
+    try:
+        for chunk in pd.read_csv(src, usecols=usecols, chunksize=chunk_rows, **CSV_READ):
+            if columns: chunk = chunk[[c for c in columns if c in chunk.columns]]
+            if writer is None:
+                schema = pa.schema([(c, pa.string()) for c in chunk.columns])
+                writer = pq.ParquetWriter(out_path, schema)
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            rows += len(chunk)
+            if progress: progress(r.raw.tell(), total)
+    finally:
+        if writer is not None: writer.close()
+    if writer is None:  # 헤더만 있거나 빈 본문
+        pd.DataFrame(columns=columns or []).astype(str).to_parquet(out_path, index=False)
+    return rows
+
+# ===============================
+# HTTP 계측 — 요청 1건을 connect / ttfb / download / parse 단계로 분해(fmw_netlog)
+# ===============================
+# 최근 NET_WINDOW건은 메모리(개발자 모드 P50/P95 표), 전부 NET_LOG(JSONL)에 한 줄씩 추가.
+NET_LOG = os.path.join(".cache", "net_timing.jsonl")
+NET_WINDOW = 500
+
+@st.cache_resource
+def get_net_log() -> NetLog:
+    return NetLog(NET_LOG, NET_WINDOW)
+
+# ===============================
+# 백그라운드 JSON 갱신 — 작은 서버 요약 엔드포인트용 stale-while-revalidate
+# ===============================
+# 화면은 마지막 성공값을 즉시 쓰고, TTL이 지났으면 백그라운드 스레드가 다시 받아 둔다.
+# 서버가 느리거나 죽어 있어도 리런이 네트워크를 기다리지 않음.
+JSON_TTL_S = 60
+JSON_TIMEOUT_S = 10
+
+class Fetched(NamedTuple):
+    value: object = None          # 마지막 성공 응답(JSON) — 없으면 None
+    fetched_at: float = 0.0       # 마지막 성공 시각(epoch)
+    error: str | None = None      # 마지막 시도가 실패했으면 그 사유
+    refreshing: bool = False      # 지금 백그라운드에서 받는 중
+
+    @property
+    def age_s(self) -> float | None:
+        return time.time() - self.fetched_at if self.fetched_at else None
+
+class JsonRefresher:
+    """URL+파라미터별 마지막 응답을 보관하고 TTL이 지나면 비동기로 갱신. 프로세스당 1개(get_json_refresher)."""
+    def __init__(self, max_workers: int = 2):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fmw-json")
+        self._net = get_net_log()
+        self._lock = threading.Lock()
+        self._entries = {}   # key → Fetched
+        self._tried = {}     # key → 마지막 시도 시각(실패 포함, 재시도 간격 계산용)
+
+    def get(self, url: str, params=None, ttl: float = JSON_TTL_S) -> Fetched:
+        key = (url, tuple(sorted((params or {}).items())))
+        with self._lock:
+            cur = self._entries.get(key, Fetched())
+            if not cur.refreshing and time.time() - self._tried.get(key, 0.0) >= ttl:
+                cur = self._entries[key] = cur._replace(refreshing=True)
+                self._tried[key] = time.time()
+                self._pool.submit(self._refresh, key, url, params)
+            return cur
+
+    def _refresh(self, key, url, params):
+        try:
+            with self._net.call("GET", url, params=params or {}, timeout=JSON_TIMEOUT_S) as r:
+                r.raise_for_status()
+                new = Fetched(value=r.json(), fetched_at=time.time())
+        except Exception as e:
+            with self._lock:  # 실패해도 마지막 성공값은 유지
+                self._entries[key] = self._entries[key]._replace(error=str(e)[:200], refreshing=False)
+            return
+        with self._lock:
+            self._entries[key] = new
+
+@st.cache_resource
+def get_json_refresher() -> JsonRefresher:
+    return JsonRefresher()
+
 # ===============================
 # DataManager — DRF 하루 1회 벌크 동기화 + 스냅샷
 # ===============================
@@ -17,78 +201,266 @@ class DataManager:
         "mcc","mnc","region","country","operator","sp_fci",
         "mode","value","sync_time"
     ]
-    def __init__(self, base_url: str, cache_dir: str = ".cache", refresh_hour_kst: int = 6):
+    def __init__(self, base_url: str, cache_dir: str = ".cache", refresh_hour_kst: int = 6, stream: bool = True,
+                 checkpoint_every: int = 7, diff_budget_mb: int | None = None):
         self.base_url = base_url.rstrip("/")
         self.cache_dir = cache_dir
         self.refresh_hour_kst = refresh_hour_kst
+        self.stream = stream and pq is not None  # 스트리밍 수신은 pyarrow 필요
+        self.checkpoint_every = checkpoint_every  # 데일리 스냅샷: N일마다 전체, 그 사이는 변경분만
+        self.diff_budget_mb = diff_budget_mb if pq is not None else None  # 설정 시 변경분을 디스크 분할 diff로 계산
         os.makedirs(self.cache_dir, exist_ok=True)
         os.makedirs(os.path.join(self.cache_dir, "daily"), exist_ok=True)
 
     def _today_path(self, d=None):
+        # 구 형식(전체 CSV) 데일리 스냅샷. pyarrow가 없으면 계속 이 형식으로 저장
         d = d or datetime.now(KST).date()
         return os.path.join(self.cache_dir, "daily", f"{d:%Y-%m-%d}.csv")
 
+    def _snap_path(self, d, kind: str):
+        # kind: "full"(체크포인트) | "delta"(전일 저장본 대비 변경분)
+        return os.path.join(self.cache_dir, "daily", f"{d:%Y-%m-%d}.{kind}.parquet")
+
     def _cache_all_path(self):
         return os.path.join(self.cache_dir, "fmw_all.csv")
 
+    def _validator_path(self):
+        # 마지막 응답의 ETag/Last-Modified. 파일 mtime = 마지막으로 서버에 확인한 시각
+        return os.path.join(self.cache_dir, "fmw_all.validator.json")
+
     def _should_refresh(self) -> bool:
         p = self._cache_all_path()
         if not os.path.exists(p):
             return True
         now = datetime.now(KST)
         cut = now.replace(hour=self.refresh_hour_kst, minute=0, second=0, microsecond=0)
-        mtime = datetime.fromtimestamp(os.path.getmtime(p), KST)
+        # 304로 본문을 안 받은 경우 CSV mtime은 그대로이므로 검증자 파일의 확인 시각도 함께 봄
+        checked = max([os.path.getmtime(x) for x in (p, self._validator_path()) if os.path.exists(x)])
+        mtime = datetime.fromtimestamp(checked, KST)
         return (now >= cut) and (mtime < cut)
 
-    def _fetch_all_csv(self, params=None) -> pd.DataFrame:
+    def _read_validator(self, params) -> dict:
+        try:
+            with open(self._validator_path(), encoding="utf-8") as fh:
+                v = json.load(fh)
+        except Exception:
+            return {}
+        # 같은 조회 조건으로 받은 캐시가 있을 때만 유효
+        return v if v.get("params") == (params or {}) and os.path.exists(self._cache_all_path()) else {}
+
+    def _write_validator(self, v: dict, params) -> None:
+        def write(tmp):
+            with open(tmp, "w", encoding="utf-8") as fh:
+                json.dump({**v, "params": params or {}}, fh, ensure_ascii=False)
+        _atomic_write(self._validator_path(), write)
+
+    @contextmanager
+    def _get_all(self, params=None, label="/api/v1/all"):
+        """/api/v1/all 조건부 GET(계측) → with 블록에 (응답, 검증자). 서버가 304(변경 없음)를 주면 응답은 None.
+
+        본문은 블록 안에서 받아야 한다(블록을 나오면 응답을 닫음).
+        gzip 응답은 requests가 Accept-Encoding을 보내고 자동으로 풀어준다.
+        """
         url = f"{self.base_url}/api/v1/all"
-        r = requests.get(url, params=params or {}, headers={"Accept": "text/csv"}, timeout=60)
-        r.raise_for_status()
-        df = pd.read_csv(io.BytesIO(r.content))
+        headers = {"Accept": "text/csv"}
+        prev = self._read_validator(params)
+        if prev.get("etag"): headers["If-None-Match"] = prev["etag"]
+        if prev.get("last_modified"): headers["If-Modified-Since"] = prev["last_modified"]
+        with get_net_log().call("GET", url, label=label, params=params or {}, headers=headers, timeout=60) as r:
+            v = {"etag": r.headers.get("ETag"), "last_modified": r.headers.get("Last-Modified")}
+            if r.status_code == 304:
+                yield None, {k: v[k] or prev.get(k) for k in v}
+                return
+            r.raise_for_status()
+            yield r, v
+
+    def _fetch_all_csv(self, params=None):
+        """전체 CSV를 한 번에 받아 파싱 → (df, 검증자). 변경 없으면 df는 None."""
+        with self._get_all(params) as (r, v):
+            if r is None:
+                return None, v
+            df = pd.read_csv(io.BytesIO(r.content), **CSV_READ)
         keep = [c for c in self.HEADERS if c in df.columns]
-        return df[keep]
+        return df[keep], v
+
+    def _stream_all_csv(self, params=None, progress=None):
+        """전체 CSV를 스트리밍 수신 → (변경 여부, 검증자).
+
+        받는 대로 원문은 fmw_all.csv, 파싱한 청크는 fmw_all.parquet에 기록(둘 다 tmp 후 교체).
+        본문과 전체 DataFrame을 동시에 메모리에 두지 않는다.
+        """
+        p = self._cache_all_path(); pq_path = _parquet_path(p)
+        try:
+            with self._get_all(params, label="/api/v1/all (stream)") as (r, v):
+                if r is None:
+                    return False, v
+                with open(p + ".tmp", "wb") as tee:
+                    stream_csv_to_parquet(r, pq_path + ".tmp", self.HEADERS, tee=tee, progress=progress)
+            os.replace(p + ".tmp", p)
+            os.replace(pq_path + ".tmp", pq_path)  # parquet을 나중에 교체해야 CSV보다 새 사본으로 인식
+        finally:
+            for t in (p + ".tmp", pq_path + ".tmp"):
+                if os.path.exists(t): os.remove(t)
+        return True, v
 
-    def refresh(self, params=None) -> pd.DataFrame:
-        df = self._fetch_all_csv(params=params)
-        df.to_csv(self._cache_all_path(), index=False, encoding="utf-8-sig")
+    def refresh(self, params=None, progress=None) -> pd.DataFrame:
+        p = self._cache_all_path()
+        if self.stream:
+            changed, v = self._stream_all_csv(params=params, progress=progress)
+        else:
+            df, v = self._fetch_all_csv(params=params)
+            changed = df is not None
+            if changed:
+                _atomic_write(p, lambda t: df.to_csv(t, index=False, encoding="utf-8-sig"))
+                _write_parquet_copy(p, _typed(df.copy()))
+        # 검증자는 본문을 저장한 뒤에 기록(중간 실패 시 다음번엔 전체 수신).
+        # 변경 없음(304)이면 기존 캐시(파싱본 공유 캐시 포함)를 그대로 쓰고 확인 시각만 갱신
+        self._write_validator(v, params)
         # 데일리 스냅샷(한 번만)
-        day_path = self._today_path()
-        if not os.path.exists(day_path):
-            df.to_csv(day_path, index=False, encoding="utf-8-sig")
-        return df
+        today = datetime.now(KST).date()
+        if today not in self._stored_days():
+            self.write_snapshot(today, load_frame(p))
+        return load_frame(p)
 
-    def load_all(self, force=False, params=None) -> pd.DataFrame:
+    def load_all(self, force=False, params=None, progress=None) -> pd.DataFrame:
         if force or self._should_refresh():
-            try: return self.refresh(params=params)
+            try: return self.refresh(params=params, progress=progress)
             except Exception as e: st.warning(f"동기화 실패 → 캐시 사용: {e}")
         p = self._cache_all_path()
         if os.path.exists(p):
-            return pd.read_csv(p)
+            return load_frame(p)
         return self.refresh(params=params)
 
+    # ---- 데일리 스냅샷 저장소 ----
+    # checkpoint_every일마다 전체 체크포인트(.full.parquet), 그 사이 날은 직전 저장일 대비 변경분(.delta.parquet,
+    # created/updated/touched/deleted + old_value)만 zstd로 저장. 특정 날은 가장 가까운 이전 체크포인트부터 변경분을 재생해 복원.
+    # sync_time만 바뀐 행(touched)도 변경분에 담으므로 복원 결과는 키+값만이 아니라 전 컬럼이 그날과 같다.
+    # 구 형식 .csv 스냅샷은 체크포인트로 취급.
+    def _stored_days(self) -> dict:
+        out = {}
+        for name in os.listdir(os.path.join(self.cache_dir, "daily")):
+            stem, _, ext = name.partition(".")
+            kind = {"csv": "csv", "full.parquet": "full", "delta.parquet": "delta"}.get(ext)
+            if not kind: continue
+            try: d = datetime.strptime(stem, "%Y-%m-%d").date()
+            except ValueError: continue
+            if kind != "csv" or d not in out:  # 같은 날 parquet이 있으면 그쪽 우선
+                out[d] = kind
+        return dict(sorted(out.items()))
+
+    def _stored_path(self, d, kind: str):
+        return self._today_path(d) if kind == "csv" else self._snap_path(d, kind)
+
+    def _changes_path(self, d):
+        # 체크포인트/구 CSV 날짜의 변경분(변경분 저장일은 .delta.parquet 자체가 변경분)
+        return os.path.join(self.cache_dir, "daily", f"{d:%Y-%m-%d}.changes.parquet")
+
+    def write_snapshot(self, d, df: pd.DataFrame) -> str:
+        """d일 스냅샷 저장 → 저장 형식("full"|"delta"|"csv")."""
+        if pq is None:
+            _atomic_write(self._today_path(d), lambda t: df.to_csv(t, index=False, encoding="utf-8-sig"))
+            return "csv"
+        stored = self._stored_days()
+        before = [x for x in stored if x < d]
+        ckpt = max((x for x in before if stored[x] != "delta"), default=None)
+        kind = "full" if ckpt is None or (d - ckpt).days >= self.checkpoint_every else "delta"
+        # 변경분은 저장 시 1회만 계산·정렬해 두고 히스토리 탭은 읽기만 함(delta 저장일은 변경분 파일 = 스냅샷)
+        if before:
+            out = self._changes_path(d) if kind == "full" else self._snap_path(d, "delta")
+            self._write_changes(out, before[-1], curr_df=df)
+        if kind == "full":
+            _atomic_write(self._snap_path(d, kind), lambda t: df.to_parquet(t, index=False, compression="zstd"))
+        return kind
+
+    def _write_changes(self, out: str, prev_day, curr_day=None, curr_df: pd.DataFrame | None = None) -> None:
+        """prev_day → curr_day(또는 curr_df) 정렬 변경분을 out에 기록."""
+        if self.diff_budget_mb:
+            # 대용량: 스냅샷을 통째로 복원하지 않고 복원 체인을 조각 단위로 비교(작업 파일은 캐시 폴더 아래)
+            curr = [curr_df] if curr_df is not None else self._chain(curr_day)
+            external_delta(self._chain(prev_day), curr, out, self.diff_budget_mb, work_dir=self.cache_dir)
+            return
+        curr = curr_df if curr_df is not None else self.load_snapshot(curr_day)
+        changes = sort_changes(snapshot_delta(self.load_snapshot(prev_day), curr))
+        _atomic_write(out, lambda t: changes.to_parquet(t, index=False, compression="zstd"))
+
+    def _changes_file(self, d) -> str | None:
+        """d일 변경분 파일 경로. 파일이 없는 날(구 CSV 스냅샷 등)은 처음 조회할 때 계산해서 저장한다.
+
+        비교할 스냅샷이 없거나 pyarrow가 없으면(파일로 저장하지 않음) None.
+        """
+        stored = self._stored_days()
+        before = [x for x in stored if x < d]
+        if d not in stored or not before or pq is None:
+            return None
+        p = self._snap_path(d, "delta") if stored[d] == "delta" else self._changes_path(d)
+        if not os.path.exists(p):
+            self._write_changes(p, before[-1], d)
+        return p
+
+    def changes_key(self, d) -> tuple | None:
+        """d일 변경분의 캐시 키(경로, mtime). 파일이 없으면 None."""
+        p = self._changes_file(d)
+        return (p, os.path.getmtime(p)) if p else None
+
+    def load_changes(self, d) -> pd.DataFrame | None:
+        """d일 변경분(직전 저장일 대비, change_type·KEY_COLS 순 정렬). 비교할 스냅샷이 없으면 None."""
+        key = self.changes_key(d)
+        if key:
+            return _load_changes(*key)
+        stored = self._stored_days()
+        before = [x for x in stored if x < d]
+        if pq is None and d in stored and before:
+            return sort_changes(snapshot_delta(self.load_snapshot(before[-1]), self.load_snapshot(d)))
+        return None
+
+    def _range_files(self, start, end) -> list:
+        # (start, end] 사이 저장일 중 변경분 파일이 있는 날: [(날짜, (경로, mtime)), ...]
+        days = [d for d in self._stored_days() if start < d <= end]
+        return [(d, k) for d in days if (k := self.changes_key(d))]
+
+    def range_key(self, start, end) -> tuple | None:
+        """기간 순변경의 캐시 키(시작, 끝, 변경분 (경로, mtime) 목록). pyarrow가 없으면 None."""
+        if pq is None:
+            return None
+        return (start, end, tuple(k for _, k in self._range_files(start, end)))
+
+    def range_changes(self, start, end) -> pd.DataFrame:
+        """start 시점 → end 시점 순변경(키별 1행, RANGE_COLS). 일별 변경분만 병합하고 전체 스냅샷은 복원하지 않음.
+
+        start 당일 이전까지의 상태가 기준이며, (start, end] 사이 저장일의 변경분을 날짜순으로 합친다.
+        결과는 변경분 파일 (경로, mtime) 기준으로 캐시 — 리런마다 다시 병합하지 않음.
+        """
+        if pq is None:
+            days = [d for d in self._stored_days() if start < d <= end]
+            return merge_changes([(d, self.load_changes(d)) for d in days])
+        files = self._range_files(start, end)
+        return _range_changes((start, end, tuple(k for _, k in files)), tuple(d for d, _ in files))
+
     def list_snapshots(self, days: int = 14):
-        out = []
         today = datetime.now(KST).date()
-        for i in range(days):
-            d = today - timedelta(days=i)
-            p = self._today_path(d)
-            if os.path.exists(p):
-                out.append((d, p))
-        return sorted(out)
+        return [(d, self._stored_path(d, k)) for d, k in self._stored_days().items() if (today - d).days < days]
+
+    def _chain(self, d) -> list:
+        """d일 복원에 필요한 파일(가장 가까운 이전 체크포인트 → 변경분 순). 없으면 []."""
+        stored = self._stored_days()
+        if d not in stored:
+            return []
+        days = [x for x in stored if x <= d]
+        ckpts = [i for i, x in enumerate(days) if stored[x] != "delta"]
+        if not ckpts:
+            return []  # 체크포인트가 지워진 경우
+        return [self._stored_path(x, stored[x]) for x in days[ckpts[-1]:]]
 
     def load_snapshot(self, d) -> pd.DataFrame | None:
-        p = self._today_path(d)
-        if os.path.exists(p):
-            return pd.read_csv(p)
-        return None
+        chain = self._chain(d)
+        return _replay_snapshot(tuple((p, os.path.getmtime(p)) for p in chain)) if chain else None
+
+    def fetch_json(self, path: str, params=None, ttl: float = JSON_TTL_S) -> Fetched:
+        """작은 JSON 엔드포인트 조회(비차단). 마지막 성공값과 갱신 상태를 즉시 반환."""
+        return get_json_refresher().get(f"{self.base_url}{path}", params=params, ttl=ttl)
 
     def runs_summary(self, days=7):
-        try:
-            r = requests.get(f"{self.base_url}/api/dev/runs/summary", params={"days": days}, timeout=10)
-            r.raise_for_status()
-            return r.json()
-        except Exception:
-            return None
+        return self.fetch_json("/api/dev/runs/summary", {"days": days}).value
 
     def dev_sync(self, feature_group: str | None = None, source_tag="manual-streamlit"):
         try:
@@ -96,8 +468,8 @@ class DataManager:
                 url = f"{self.base_url}/api/dev/sync/{feature_group}"
             else:
                 url = f"{self.base_url}/api/dev/sync"
-            r = requests.post(url, json={"source_tag": source_tag}, timeout=15)
-            return r.status_code, r.text
+            with get_net_log().call("POST", url, json={"source_tag": source_tag}, timeout=15) as r:
+                return r.status_code, r.text
         except Exception as e:
             return 0, str(e)
 
@@ -119,44 +491,332 @@ def apply_filters(df: pd.DataFrame, model: str | None, group: str | None):
 def build_key(df: pd.DataFrame) -> pd.Series:
     return df[KEY_COLS].astype(str).agg("|".join, axis=1)
 
+def key_hash(df: pd.DataFrame) -> pd.Series:
+    """KEY_COLS 64bit 해시(문자열 결합 없이 벡터 연산). category/str, NaN 표현과 무관하게 같은 값이면 같은 해시."""
+    # CSV에서는 빈 칸과 null을 구분할 수 없으므로 결측은 ""로 통일
+    return pd.util.hash_pandas_object(df[KEY_COLS].astype(object).fillna(""), index=False)
+
+def _same(a: pd.Series, b: pd.Series):
+    a, b = a.astype(object).to_numpy(), b.astype(object).to_numpy()
+    return (a == b) | (pd.isna(a) & pd.isna(b))
+
+CHANGE_COLS = KEY_COLS + ["value", "old_value", "sync_time", "change_type"]
+
+def snapshot_delta(prev_df: pd.DataFrame, curr_df: pd.DataFrame) -> pd.DataFrame:
+    """prev → curr 변경분: created/updated/touched는 curr 행(updated는 old_value 포함), deleted는 prev 행.
+
+    touched는 value는 같고 sync_time만 바뀐 행. 스냅샷 저장소가 그날을 그대로 복원하는 데만 쓰이고
+    히스토리 표(split_changes)와 기간 순변경(merge_changes)에서는 빠진다.
+    """
+    p = prev_df.loc[~key_hash(prev_df).duplicated(keep="last").to_numpy()]  # 키 중복은 마지막 행 기준
+    c = curr_df.loc[~key_hash(curr_df).duplicated(keep="last").to_numpy()]
+    pk, ck = key_hash(p), key_hash(c)
+    pos = pd.Index(pk.to_numpy()).get_indexer(ck.to_numpy())
+    hit = pos >= 0
+    old_value = p["value"].iloc[pos[hit]]
+    changed = ~_same(c["value"][hit], old_value)
+    touched = ~changed
+    if "sync_time" in p.columns and "sync_time" in c.columns:
+        touched &= ~_same(c["sync_time"][hit], p["sync_time"].iloc[pos[hit]])
+    else:
+        touched[:] = False
+    created = c[~hit].assign(change_type="created")
+    updated = c[hit][changed].assign(old_value=old_value.to_numpy()[changed], change_type="updated")
+    touched = c[hit][touched].assign(change_type="touched")
+    deleted = p[~pk.isin(ck.to_numpy()).to_numpy()].assign(change_type="deleted")
+    return pd.concat([created, updated, touched, deleted], ignore_index=True).reindex(columns=CHANGE_COLS).astype(object)
+
+def apply_delta(base_df: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """snapshot_delta의 역: base에서 updated/touched/deleted 키를 빼고 created/updated/touched 행을 더한다."""
+    gone = key_hash(delta[delta["change_type"] != "created"])
+    out = base_df[~key_hash(base_df).isin(gone.to_numpy()).to_numpy()]
+    add = delta[delta["change_type"] != "deleted"].reindex(columns=out.columns)
+    return pd.concat([out.astype(object), add.astype(object)], ignore_index=True)
+
+def sort_changes(changes: pd.DataFrame) -> pd.DataFrame:
+    return changes.sort_values(["change_type"] + KEY_COLS, kind="stable", ignore_index=True)
+
+def split_changes(changes: pd.DataFrame):
+    """변경분(CHANGE_COLS) → (created, updated, deleted) 표시 형식. 정렬은 sort_changes 순서를 그대로 따름."""
+    ct = changes["change_type"]
+    created = changes.loc[ct == "created", KEY_COLS + ["value", "change_type"]]
+    updated = changes.loc[ct == "updated"].rename(columns={"value": "new_value"})[KEY_COLS + ["old_value", "new_value", "change_type"]]
+    deleted = changes.loc[ct == "deleted", KEY_COLS + ["value", "change_type"]]
+    return created, updated, deleted
+
 def daily_changes(prev_df: pd.DataFrame, curr_df: pd.DataFrame):
-    import pandas as pd
     if prev_df is None:  # 첫날
-        empty_created = pd.DataFrame(columns=KEY_COLS+["value","change_type"])
-        empty_updated = pd.DataFrame(columns=KEY_COLS+["old_value","new_value","change_type"])
-        empty_deleted = pd.DataFrame(columns=KEY_COLS+["value","change_type"])
-        return empty_created, empty_updated, empty_deleted
-
-    p, c = prev_df.copy(), curr_df.copy()
-    p["_key"] = build_key(p); c["_key"] = build_key(c)
-
-    # 생성/삭제
-    created_keys = set(c["_key"]) - set(p["_key"])
-    deleted_keys = set(p["_key"]) - set(c["_key"])
-
-    created = c[c["_key"].isin(created_keys)].copy()
-    created["change_type"] = "created"
-
-    deleted = p[p["_key"].isin(deleted_keys)].copy()
-    deleted["change_type"] = "deleted"
-
-    # 업데이트(키 동일, value 변경)
-    merged = c.merge(p[["_key","value"]].rename(columns={"value":"old_value"}), on="_key", how="inner")
-    updated = merged[merged["value"].astype(str) != merged["old_value"].astype(str)].copy()
-    if not updated.empty:
-        for col in KEY_COLS:
-            if col not in updated.columns:
-                updated[col] = updated["_key"].str.split("|").str[KEY_COLS.index(col)]
-        updated["new_value"] = updated["value"]
-        updated["change_type"] = "updated"
-        updated = updated[KEY_COLS + ["old_value","new_value","change_type"]]
-
-    created = created[KEY_COLS + ["value","change_type"]]
-    deleted = deleted[KEY_COLS + ["value","change_type"]]
-    created = created.sort_values(KEY_COLS, kind="stable")
-    updated = updated.sort_values(KEY_COLS, kind="stable") if not updated.empty else updated
-    deleted = deleted.sort_values(KEY_COLS, kind="stable")
-    return created, updated, deleted
+        return split_changes(pd.DataFrame(columns=CHANGE_COLS))
+    return split_changes(sort_changes(snapshot_delta(prev_df, curr_df)))
+
+RANGE_COLS = KEY_COLS + ["first_value", "last_value", "change_type", "first_day", "last_day", "n_changes"]
+
+def merge_changes(day_changes) -> pd.DataFrame:
+    """[(날짜, 일별 변경분), ...](날짜 오름차순) → 기간 순변경.
+
+    키별 첫 이벤트로 기간 시작 시 존재 여부/값(first_value), 마지막 이벤트로 끝 시점 존재 여부/값(last_value)을 정한다.
+    생성 후 삭제됐거나 값이 원래대로 돌아온 키는 순변경이 없으므로 제외. touched(sync_time만 변경)는 보지 않는다.
+    """
+    frames = [c[c["change_type"] != "touched"].assign(day=d) for d, c in day_changes if c is not None and len(c)]
+    frames = [f for f in frames if len(f)]
+    if not frames:
+        return pd.DataFrame(columns=RANGE_COLS)
+    ev = pd.concat(frames, ignore_index=True)
+    ev["_k"] = key_hash(ev).to_numpy()
+    ev = ev.sort_values("_k", kind="stable")  # 같은 키 안에서는 날짜순 유지
+    first = ev.drop_duplicates("_k", keep="first").set_index("_k")
+    last = ev.drop_duplicates("_k", keep="last").set_index("_k")
+    before = (first["change_type"] != "created").to_numpy()
+    after = (last["change_type"] != "deleted").to_numpy()
+    ft = first["change_type"].to_numpy()
+    out = last[KEY_COLS].copy()
+    out["first_value"] = np.where(ft == "updated", first["old_value"], np.where(ft == "deleted", first["value"], None))
+    out["last_value"] = np.where(after, last["value"], None)
+    out["change_type"] = np.select([~before & after, before & ~after], ["created", "deleted"], "updated")
+    out["first_day"] = first["day"].to_numpy()
+    out["last_day"] = last["day"].to_numpy()
+    out["n_changes"] = ev.groupby("_k", sort=True).size().reindex(out.index).to_numpy()
+    keep = (before | after) & ~(before & after & _same(out["first_value"], out["last_value"]))
+    return sort_changes(out[keep].reset_index(drop=True))[RANGE_COLS]
+
+
+# ===============================
+# 대용량 변경분 — 메모리 예산 안에서 디스크 분할 diff
+# ===============================
+# 두 스냅샷을 키 해시로 P개 조각으로 나눠 디스크에 쓰고(같은 키는 양쪽 모두 같은 조각), 조각별로 snapshot_delta를 돌린다.
+# 변경분은 change_type별로 모았다가 예산을 넘으면 KEY_COLS 정렬 런으로 내려쓰고, 끝에 런을 병합해 sort_changes 순서로 내보냄.
+# P·배치 크기는 표본 행 크기로 추정한 입력 크기와 예산으로 정한다. pyarrow 필요.
+DIFF_BUDGET_MB = 512
+_DIFF_OVERHEAD = 3  # snapshot_delta 피크 ≈ 조각 입력(prev+curr, object 기준)의 배수(해시·인덱스·concat 사본)
+_CHANGE_TYPES = ("created", "deleted", "touched", "updated")  # sort_changes 순서
+
+def _str_schema(cols):
+    return pa.schema([(c, pa.string()) for c in cols])
+
+def _src_columns(src) -> list:
+    if isinstance(src, pd.DataFrame): return list(src.columns)
+    if src.endswith(".csv"): return list(pd.read_csv(src, nrows=0, **CSV_READ).columns)
+    return pq.ParquetFile(src).schema_arrow.names
+
+def _iter_frames(src, rows: int):
+    """DataFrame / .csv / .parquet → rows행씩 object 프레임."""
+    if isinstance(src, pd.DataFrame):
+        for i in range(0, len(src), rows):
+            yield src.iloc[i:i + rows].astype(object)
+    elif src.endswith(".csv"):
+        yield from pd.read_csv(src, chunksize=rows, **CSV_READ)
+    else:
+        for b in pq.ParquetFile(src).iter_batches(batch_size=rows):
+            yield b.to_pandas().astype(object)
+
+def _estimate(src) -> tuple:
+    """(행 수, 메모리상 행당 바이트) 추정 — 전체를 읽지 않고 앞쪽 표본만 본다."""
+    if isinstance(src, pd.DataFrame):
+        n, sample = len(src), src.head(1000).astype(object)
+    elif src.endswith(".csv"):
+        sample = pd.read_csv(src, nrows=1000, **CSV_READ)
+        with open(src, "rb") as fh:
+            head = sum(len(fh.readline()) for _ in range(len(sample) + 1))
+        n = int(os.path.getsize(src) * (len(sample) + 1) / max(head, 1))
+    else:
+        f = pq.ParquetFile(src)
+        n = f.metadata.num_rows
+        b = next(f.iter_batches(batch_size=1000), None)
+        sample = b.to_pandas().astype(object) if b is not None else pd.DataFrame()
+    per = sample.memory_usage(deep=True, index=False).sum() / len(sample) if len(sample) else 0
+    return n, per
+
+def _partition(src, out_dir: str, parts: int, rows: int) -> tuple:
+    """src를 key_hash % parts로 나눠 out_dir에 기록 → (컬럼, {조각 번호: [파일, ...]}). 조각 안 행 순서는 원본 순서.
+
+    조각별로 잘게 쓰지 않도록 rows×4행까지 모았다가 조각마다 파일 1개로 내려쓴다(열린 writer 없음).
+    """
+    cols = _src_columns(src)
+    schema = _str_schema(cols)
+    os.makedirs(out_dir, exist_ok=True)
+    pieces, buf, nbuf = {}, {}, 0
+    def flush():
+        for i, frames in buf.items():
+            p = os.path.join(out_dir, f"{i}-{len(pieces.get(i, []))}.parquet")
+            pq.write_table(pa.Table.from_pandas(pd.concat(frames), schema=schema, preserve_index=False), p)
+            pieces.setdefault(i, []).append(p)
+        buf.clear()
+    for chunk in _iter_frames(src, rows):
+        part = (key_hash(chunk).to_numpy() % parts).astype(np.int64)
+        order = np.argsort(part, kind="stable")
+        bounds = np.searchsorted(part[order], np.arange(parts + 1))
+        for i in np.flatnonzero(np.diff(bounds)):
+            buf.setdefault(i, []).append(chunk.iloc[order[bounds[i]:bounds[i + 1]]])
+        nbuf += len(chunk)
+        if nbuf >= rows * 4:
+            flush(); nbuf = 0
+    flush()
+    return cols, pieces
+
+def _read_part(cols, pieces, i: int) -> pd.DataFrame:
+    if i not in pieces:
+        return pd.DataFrame(columns=cols, dtype=object)
+    return pd.concat([pd.read_parquet(p) for p in pieces[i]], ignore_index=True).astype(object)
+
+def _replay_part(side, i: int) -> pd.DataFrame:
+    # side: [(컬럼, 조각 파일), ...] = 체크포인트 → 변경분 순. 조각 단위로 apply_delta 재생
+    df = _read_part(*side[0], i)
+    for cols, pieces in side[1:]:
+        if i in pieces:
+            df = apply_delta(df, _read_part(cols, pieces, i))
+    return df
+
+def _merge_runs(paths, rows: int):
+    """KEY_COLS로 정렬된 런 파일들 → 전체 정렬 순서 배치. 런마다 rows행만 메모리에 둔다."""
+    its = {j: pq.ParquetFile(p).iter_batches(batch_size=rows) for j, p in enumerate(paths)}
+    bufs = {}
+    while True:
+        for j in list(its):  # 비어 있는 버퍼 채우기(끝난 런은 제외)
+            while j not in bufs:
+                b = next(its[j], None)
+                if b is None: del its[j]; break
+                if b.num_rows: bufs[j] = b.to_pandas().astype(object)
+        if not bufs:
+            return
+        # 각 버퍼 마지막 키 중 가장 작은 키까지는 모든 런에서 안전하게 내보낼 수 있음
+        tails = pd.concat([b.iloc[[-1]].assign(_run=j) for j, b in bufs.items()])
+        r = tails.sort_values(KEY_COLS, kind="stable")["_run"].iloc[0]
+        pool = pd.concat([b.assign(_run=j, _pos=np.arange(len(b))) for j, b in bufs.items()], ignore_index=True)
+        pool = pool.sort_values(KEY_COLS, kind="stable", ignore_index=True)
+        cut = np.flatnonzero(((pool["_run"] == r) & (pool["_pos"] == len(bufs[r]) - 1)).to_numpy())[0] + 1
+        yield pool.iloc[:cut].drop(columns=["_run", "_pos"])
+        rest = pool.iloc[cut:]
+        bufs = {j: g.drop(columns=["_run", "_pos"]).reset_index(drop=True) for j, g in rest.groupby("_run", sort=False)}
+
+def iter_external_delta(prev_srcs, curr_srcs, budget_mb: int = DIFF_BUDGET_MB, work_dir: str | None = None):
+    """snapshot_delta의 디스크 분할판 → CHANGE_COLS 배치를 sort_changes 순서로 yield.
+
+    prev_srcs/curr_srcs: [체크포인트, 변경분, ...](DataFrame/.csv/.parquet) — 스냅샷 저장소의 복원 체인 그대로.
+    작업 파일은 work_dir 아래 임시 폴더에 만들고 끝나면 지운다.
+    """
+    budget = budget_mb << 20
+    est = [_estimate(s) for s in (*prev_srcs, *curr_srcs)]
+    per = max([b for _, b in est] + [1])
+    parts = max(1, math.ceil(sum(n for n, _ in est) * per * _DIFF_OVERHEAD / (budget / 2)))
+    rows = max(1_000, int(budget / 16 / per))  # 분할 시 rows×4행(예산의 1/4)까지 버퍼
+    tmp = tempfile.mkdtemp(prefix="fmw-diff-", dir=work_dir)
+    try:
+        sides = [[_partition(s, os.path.join(tmp, f"{name}{j}"), parts, rows) for j, s in enumerate(srcs)]
+                 for name, srcs in (("prev", prev_srcs), ("curr", curr_srcs))]
+        runs = {t: [] for t in _CHANGE_TYPES}
+        acc, acc_bytes = {t: [] for t in _CHANGE_TYPES}, 0
+        def flush(t):
+            out = pd.concat(acc[t], ignore_index=True).sort_values(KEY_COLS, kind="stable", ignore_index=True)
+            acc[t] = []
+            return out
+        def spill(t):
+            p = os.path.join(tmp, f"run-{t}-{len(runs[t])}.parquet")
+            flush(t).to_parquet(p, index=False)
+            runs[t].append(p)
+        for i in range(parts):
+            ch = snapshot_delta(*(_replay_part(side, i) for side in sides))
+            if ch.empty: continue
+            for t, g in ch.groupby("change_type", sort=False):
+                acc[t].append(g)
+            acc_bytes += ch.memory_usage(deep=True, index=False).sum()
+            if acc_bytes > budget / 4:  # 정렬 런으로 내려쓰기
+                for t in _CHANGE_TYPES:
+                    if acc[t]: spill(t)
+                acc_bytes = 0
+        for t in _CHANGE_TYPES:
+            if not runs[t]:
+                if acc[t]: yield flush(t)
+                continue
+            if acc[t]: spill(t)
+            yield from _merge_runs(runs[t], max(1_000, rows // len(runs[t])))
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+def external_delta(prev_srcs, curr_srcs, out_path: str, budget_mb: int = DIFF_BUDGET_MB, work_dir: str | None = None) -> int:
+    """iter_external_delta 결과를 out_path(parquet, zstd)에 배치 단위로 기록 → 변경 행 수. 정렬 변경분 파일과 같은 형식."""
+    schema = _str_schema(CHANGE_COLS)
+    n = 0
+    def write(tmp):
+        nonlocal n
+        with pq.ParquetWriter(tmp, schema, compression="zstd") as w:
+            for batch in iter_external_delta(prev_srcs, curr_srcs, budget_mb, work_dir):
+                w.write_table(pa.Table.from_pandas(batch.reindex(columns=CHANGE_COLS), schema=schema, preserve_index=False))
+                n += len(batch)
+    _atomic_write(out_path, write)
+    return n
+
+
+# ===============================
+# 검색 인덱스 — 셀 값 사전(소문자) + 값 → 행 postings
+# ===============================
+# 셀 값 종류는 행 수보다 훨씬 적으므로 질의는 사전에서 값을 고르고(접두어: 이분 탐색, 부분 문자열: trigram
+# 후보 검증, 2글자 이하는 사전 스캔) 해당 값들의 행 목록을 합친다. 키 입력마다 전체 행×컬럼 스캔을 하지 않음.
+# fmw_streamlit_cloud_demo.py에 같은 구현의 복사본이 있음(단일 파일 앱) — 고칠 때는 양쪽을 함께 고칠 것.
+SEARCH_COLS = [c for c in CHANGE_COLS if c != "sync_time"]  # 히스토리 탭 표에 보이는 컬럼만
+
+def build_search_index(df: pd.DataFrame, columns=None) -> dict:
+    cols = [c for c in (columns or df.columns) if c in df.columns]
+    parts = []  # 컬럼별 (코드, 소문자 고유값)
+    for c in cols:
+        col = df[c]
+        if col.dtype == object:  # 혼합 타입은 문자열 기준으로(True와 1이 같은 값으로 묶이지 않게)
+            col = col.where(col.isna(), col.astype(str))
+        codes, uniq = pd.factorize(col)  # 결측은 -1
+        parts.append((codes, pd.Index(np.asarray(uniq, dtype=object)).astype(str).str.lower()))
+    vocab = np.unique(np.concatenate([u.to_numpy(dtype=object) for _, u in parts] + [np.array([], dtype=object)]))
+    terms, rows = [], []
+    for codes, uniq in parts:
+        hit = codes >= 0
+        terms.append(np.searchsorted(vocab, uniq.to_numpy(dtype=object))[codes[hit]])
+        rows.append(np.flatnonzero(hit))
+    terms = np.concatenate(terms + [np.array([], dtype=np.int64)])
+    order = np.argsort(terms, kind="stable")
+    offsets = np.zeros(len(vocab) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(terms, minlength=len(vocab)), out=offsets[1:])
+    grams = {}
+    for i, v in enumerate(vocab):
+        for g in {v[j:j + 3] for j in range(len(v) - 2)}:
+            grams.setdefault(g, []).append(i)
+    return {"n": len(df), "vocab": vocab, "vocab_s": pd.Series(vocab, dtype=str),
+            "grams": {g: np.asarray(ids, dtype=np.int32) for g, ids in grams.items()},
+            "offsets": offsets, "rows": np.concatenate(rows + [np.array([], dtype=np.int64)])[order].astype(np.int32)}
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _cached_search_index(source, columns, _df):
+    # _df는 캐시 키에서 제외(대형 DataFrame 해시 생략) — 키는 원본 파일 기준 source만
+    return build_search_index(_df, list(columns))
+
+def search_index_for(df: pd.DataFrame, columns, source=None) -> dict:
+    """source: df를 만든 원본의 키(changes_key/range_key). None이면(파일 없음) 캐시 없이 만든다."""
+    if source is None:
+        return build_search_index(df, list(columns))
+    return _cached_search_index(source, tuple(columns), df)
+
+def _match_terms(idx: dict, ql: str, prefix: bool) -> np.ndarray:
+    vocab = idx["vocab"]
+    if prefix:
+        lo, hi = np.searchsorted(vocab, [ql, ql + "\U0010ffff"])
+        return np.arange(lo, hi)
+    if len(ql) < 3:
+        return np.flatnonzero(idx["vocab_s"].str.contains(ql, regex=False).to_numpy())
+    cand = None
+    for g in {ql[j:j + 3] for j in range(len(ql) - 2)}:
+        ids = idx["grams"].get(g)
+        if ids is None:
+            return np.empty(0, dtype=np.int64)
+        cand = ids if cand is None else np.intersect1d(cand, ids, assume_unique=True)
+    return np.asarray([i for i in cand if ql in vocab[i]], dtype=np.int64)  # trigram 후보만 검증
+
+def search_rows(idx: dict, q: str, prefix: bool = False) -> np.ndarray:
+    """q(대소문자 무시)를 포함(prefix=True면 q로 시작)하는 셀이 하나라도 있는 행 위치(오름차순)."""
+    terms = _match_terms(idx, q.lower(), prefix)
+    mask = np.zeros(idx["n"], dtype=bool)
+    if len(terms):
+        # 값별 postings 구간 [off[t], off[t+1])을 한 번에 모아서 표시
+        starts, lens = idx["offsets"][terms], np.diff(idx["offsets"])[terms]
+        pos = np.repeat(starts - np.cumsum(lens) + lens, lens) + np.arange(lens.sum())
+        mask[idx["rows"][pos]] = True
+    return np.flatnonzero(mask)
 
 
 # ===============================
@@ -171,7 +831,9 @@ BASE_URL = st.secrets.get("BASE_URL", "https://<YOUR-NGINX-HOST>")
 if "refresh_hour_kst" not in st.session_state:
     st.session_state.refresh_hour_kst = 6
 
-dm = DataManager(BASE_URL, cache_dir=".cache", refresh_hour_kst=st.session_state.refresh_hour_kst)
+# DIFF_BUDGET_MB(secrets): 설정하면 데일리 변경분을 디스크 분할 diff로 계산(전체 표가 메모리에 여러 벌 올라가지 않게)
+dm = DataManager(BASE_URL, cache_dir=".cache", refresh_hour_kst=st.session_state.refresh_hour_kst,
+                 diff_budget_mb=st.secrets.get("DIFF_BUDGET_MB"))
 
 # 최초 로드/갱신
 df_all = dm.load_all(force=False)
@@ -192,7 +854,9 @@ with st.sidebar:
         colA, colB, colC = st.columns(3)
         with colA:
             if st.button("캐시 강제 새로고침"):
-                df_all = dm.load_all(force=True)
+                bar = st.progress(0.0, text="다운로드 중…")
+                df_all = dm.load_all(force=True, progress=lambda done, total: bar.progress(min(done / total, 1.0)) if total else None)
+                bar.empty()
                 st.success("캐시 새로고침 완료")
         with colB:
             if st.button("서버 동기화 호출(/api/dev/sync)"):
@@ -206,6 +870,14 @@ with st.sidebar:
                     st.info(f"응답: {code} / {msg[:120]}...")
                 else:
                     st.warning("그룹명을 입력하세요.")
+        # 느린 구간 판별: ttfb는 응답 헤더까지(서버+프록시+왕복 지연), download면 회선/버퍼링, parse면 클라이언트(pandas)
+        st.markdown("**API 지연 분해** (최근 요청, ms)")
+        net = get_net_log().stats()
+        if net.empty:
+            st.caption("아직 계측된 요청이 없습니다.")
+        else:
+            st.dataframe(net, hide_index=True, use_container_width=True)
+        st.caption(f"요청별 기록: {NET_LOG}")
 
 # ---- 상단 오버뷰(요약) 항상 표시 ----
 col1, col2, col3, col4 = st.columns(4)
@@ -215,7 +887,8 @@ yest_df = dm.load_snapshot(datetime.now(KST).date() - timedelta(days=1))
 yest_cnt = len(yest_df) if yest_df is not None else 0
 delta_1d = today_cnt - yest_cnt
 
-srv = dm.runs_summary(days=7)
+srv_state = dm.fetch_json("/api/dev/runs/summary", {"days": 7})
+srv = srv_state.value
 with col1:
     st.metric("현재 레코드 수", today_cnt, delta=delta_1d)
 with col2:
@@ -224,6 +897,15 @@ with col3:
     st.metric("오늘 변경 수(서버)", srv.get("today_changes", 0) if srv else 0)
 with col4:
     st.metric("실패 run(오늘)", srv.get("today_failed_runs", 0) if srv else 0)
+# 서버 요약 신선도(값은 백그라운드 갱신 — 이 페이지는 기다리지 않음)
+if srv_state.age_s is not None:
+    note = f"서버 요약: {int(srv_state.age_s)}초 전 갱신"
+    if srv_state.error: note += f" · 최근 갱신 실패({srv_state.error[:60]}) → 이전 값 표시"
+    st.caption(note)
+elif srv_state.error:
+    st.caption(f"서버 요약 없음 · 갱신 실패: {srv_state.error[:80]}")
+else:
+    st.caption("서버 요약 불러오는 중… (새로고침 시 반영)")
 
 st.divider()
 
@@ -238,23 +920,45 @@ df_filtered = apply_filters_view(df_all)
 # ===============================
 if nav == "히스토리 관리":
     st.subheader("히스토리 관리 (데일리 변경 CRUD)")
-    target_day = st.date_input("대상 일자(오늘 기준 비교: 전일 ↔ 선택일)", value=datetime.now(KST).date())
-    prev_day = target_day - timedelta(days=1)
-
-    df_curr = dm.load_snapshot(target_day) or df_filtered
-    df_prev = dm.load_snapshot(prev_day)
-
-    # 필터 적용
-    df_curr = apply_filters(df_curr, sel_model, sel_group) if df_curr is not None else None
-    df_prev = apply_filters(df_prev, sel_model, sel_group) if df_prev is not None else None
-
-    created, updated, deleted = daily_changes(df_prev, df_curr)
+    today = datetime.now(KST).date()
+    cmp_mode = st.radio("비교 방식", ["일별(직전 스냅샷 ↔ 선택일)", "기간(시작일 ↔ 종료일 순변경)"], horizontal=True)
+    if cmp_mode.startswith("일별"):
+        target_day = st.date_input("대상 일자", value=today)
+        label = f"{target_day}"
+        # 변경분은 스냅샷 저장 시 미리 계산된 것을 읽기만 함(전체 스냅샷 2개 diff 없음)
+        changes, source = dm.load_changes(target_day), dm.changes_key(target_day)
+        if changes is None:
+            st.info("선택일 스냅샷 또는 비교할 이전 스냅샷이 없습니다.")
+            changes = pd.DataFrame(columns=CHANGE_COLS)
+        search_cols = SEARCH_COLS
+        created, updated, deleted = split_changes(apply_filters(changes, sel_model, sel_group))
+    else:
+        rng = st.date_input("기간", value=(today - timedelta(days=30), today))
+        start, end = (rng[0], rng[-1]) if isinstance(rng, (list, tuple)) else (rng, rng)
+        label = f"{start}_{end}"
+        # 일별 변경분만 병합(전체 스냅샷 복원 없음). 키별 기간 시작 값 → 끝 값
+        changes, source = dm.range_changes(start, end), dm.range_key(start, end)
+        search_cols = [c for c in RANGE_COLS if c not in ("first_day", "last_day", "n_changes")]
+        view = apply_filters(changes, sel_model, sel_group)
+        created, updated, deleted = (view[view["change_type"] == t] for t in ("created", "updated", "deleted"))
 
-    q = st.text_input("검색(모든 컬럼 포함, 대소문자 무시)", value="")
+    cq1, cq2 = st.columns([4, 1])
+    with cq1:
+        q = st.text_input("검색(모든 컬럼 포함, 대소문자 무시)", value="")
+    with cq2:
+        q_prefix = st.checkbox("접두어 일치", value=False)
+    # 검색 인덱스로 전체 변경분에서 1회 조회 → 각 탭은 행 라벨 교집합만
+    # 인덱스는 검색어가 있을 때만 (원본 파일 키로 캐시) — 빈 검색창 리런에는 비용 없음
+    hits = changes.index[search_rows(search_index_for(changes, search_cols, source), q, prefix=q_prefix)] if q else None
     def search(df):
-        if df is None or df.empty or not q: return df
-        ql = q.lower()
-        return df[df.astype(str).apply(lambda s: s.str.lower().str.contains(ql, na=False)).any(axis=1)]
+        if df is None or df.empty or hits is None: return df
+        return df[df.index.isin(hits)]
+
+    page_size = st.selectbox("페이지 크기", [100, 500, 2000], index=1)
+    def show_page(dfv, key):
+        pages = max(1, -(-len(dfv) // page_size))
+        page = st.number_input(f"페이지 (총 {pages})", min_value=1, max_value=pages, value=1, step=1, key=key)
+        st.dataframe(dfv.iloc[(page - 1) * page_size: page * page_size], use_container_width=True, height=360)
 
     t1, t2, t3 = st.tabs([
         f"신규 생성 ({len(created)})", f"업데이트 ({len(updated)})", f"삭제 ({len(deleted)})"
@@ -262,21 +966,21 @@ if nav == "히스토리 관리":
 
     with t1:
         dfv = search(created)
-        st.dataframe(dfv, use_container_width=True, height=360)
+        show_page(dfv, "page_created")
         st.download_button("CSV 다운로드(신규)", dfv.to_csv(index=False).encode("utf-8-sig"),
-                           file_name=f"created_{target_day}.csv", mime="text/csv")
+                           file_name=f"created_{label}.csv", mime="text/csv")
 
     with t2:
         dfv = search(updated)
-        st.dataframe(dfv, use_container_width=True, height=360)
+        show_page(dfv, "page_updated")
         st.download_button("CSV 다운로드(업데이트)", dfv.to_csv(index=False).encode("utf-8-sig"),
-                           file_name=f"updated_{target_day}.csv", mime="text/csv")
+                           file_name=f"updated_{label}.csv", mime="text/csv")
 
     with t3:
         dfv = search(deleted)
-        st.dataframe(dfv, use_container_width=True, height=360)
+        show_page(dfv, "page_deleted")
         st.download_button("CSV 다운로드(삭제)", dfv.to_csv(index=False).encode("utf-8-sig"),
-                           file_name=f"deleted_{target_day}.csv", mime="text/csv")
+                           file_name=f"deleted_{label}.csv", mime="text/csv")
 
 # ===============================
 # 2) 피처 상세 — 선택한 그룹의 피처를 직관적으로